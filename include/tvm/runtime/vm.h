@@ -480,19 +480,57 @@ class Executable : public ModuleNode {
    * \brief Serialize the executable into global section, constant section, and
    * code section.
    *
+   * \param include_constants Whether the constant section holds the constant
+   *        tensors, or only their number when they are stored elsewhere.
+   *
    * \return The binary representation of the VM.
    */
-  TVMByteArray Save();
+  TVMByteArray Save(bool include_constants = true);
 
   /*!
    * \brief Load the saved VM executable.
    *
    * \param code The bytecode in string.
    * \param lib The compiled runtime library.
+   * \param constant_loader If defined, the code was saved without the constant
+   *        tensors, and the function returns the constant given its index.
+   *
+   * \return exe The constructed executable.
+   */
+  static runtime::Module Load(const std::string& code, const runtime::Module lib,
+                              PackedFunc constant_loader = PackedFunc());
+
+  /*!
+   * \brief Save the executable to a file whose constants are aligned so that
+   * they can be memory mapped by LoadFromFile.
+   *
+   * \param path The path of the file.
+   * \param alignment The alignment of the constants in bytes.
+   *
+   * \note The library is not included, it has to be exported separately.
+   */
+  void SaveToFile(const std::string& path, size_t alignment);
+
+  /*!
+   * \brief Load an executable saved by SaveToFile.
+   *
+   * The file is memory mapped and the constants are created on first use as
+   * tensors pointing to the mapping, so the pages are shared by the processes
+   * loading the same file.
+   *
+   * \param path The path of the file.
+   * \param lib The compiled runtime library.
    *
    * \return exe The constructed executable.
    */
-  static runtime::Module Load(const std::string& code, const runtime::Module lib);
+  static runtime::Module LoadFromFile(const std::string& path, const runtime::Module lib);
+
+  /*!
+   * \brief Get a constant of the constant pool.
+   * \param index The index of the constant.
+   * \return The constant, created by the constant loader if it is not loaded.
+   */
+  ObjectRef GetConstant(Index index) const;
 
   /*!
    * \brief Get the serialized form of the `functions`. This is
@@ -566,8 +604,11 @@ class Executable : public ModuleNode {
   /*! \brief The runtime module/library that contains both the host and also the device
    * code when executing on non-CPU devices. */
   runtime::Module lib;
-  /*! \brief The global constant pool. */
+  /*! \brief The global constant pool, entries are undefined until loaded
+   * when the executable has a constant loader. */
   std::vector<ObjectRef> constants;
+  /*! \brief The function creating the constants that are not loaded. */
+  PackedFunc constant_loader;
   /*! \brief A map from globals (as strings) to their index in the function map. */
   std::unordered_map<std::string, Index> global_map;
   /*! \brief A mapping from the packed function (as string) to the index that
@@ -589,8 +630,9 @@ class Executable : public ModuleNode {
    * \brief Save the constant pool.
    *
    * \param strm The input stream.
+   * \param include_constants Whether to save the tensors or only their number.
    */
-  void SaveConstantSection(dmlc::Stream* strm);
+  void SaveConstantSection(dmlc::Stream* strm, bool include_constants);
 
   /*!
    * \brief Save primitive op names.
@@ -769,6 +811,19 @@ class VirtualMachine : public runtime::ModuleNode {
                             Index output_size,
                             const std::vector<ObjectRef>& args);
 
+  /*!
+   * \brief Allocate the storage of an AllocStorage instruction.
+   *
+   * \param size The size of the storage in bytes.
+   * \param alignment The alignment of the storage.
+   * \param dtype_hint The data type hint of the storage.
+   * \param ctx The context to allocate on.
+   *
+   * \return The allocated storage.
+   */
+  virtual ObjectRef AllocStorage(int64_t size, int64_t alignment,
+                                 DLDataType dtype_hint, TVMContext ctx);
+
   /*!
    * \brief Initialize the virtual machine for a set of contexts.
    * \param contexts The set of TVM contexts.
@@ -47,6 +47,12 @@ TVM_FREE_PYOBJ = TVMCFuncFinalizer(_ctypes_free_resource)
 ctypes.pythonapi.Py_IncRef(ctypes.py_object(TVM_FREE_PYOBJ))
 
 
+def _set_release_gil(flag):
+    """Calls through ctypes.CDLL always release the GIL, and the
+    python callbacks re-acquire it, so there is nothing to set."""
+    return flag
+
+
 def _make_packed_func(handle, is_global):
     """Make a packed function class"""
     obj = _CLASS_PACKED_FUNC.__new__(_CLASS_PACKED_FUNC)
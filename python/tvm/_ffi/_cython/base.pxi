@@ -104,7 +104,7 @@ cdef extern from "tvm/runtime/c_runtime_api.h":
                     int* type_codes,
                     int num_args,
                     TVMValue* ret_val,
-                    int* ret_type_code)
+                    int* ret_type_code) nogil
     int TVMFuncFree(TVMPackedFuncHandle func)
     int TVMCFuncSetReturn(TVMRetValueHandle ret,
                           TVMValue* value,
@@ -16,6 +16,7 @@
 # under the License.
 
 import ctypes
+import threading
 import traceback
 from cpython cimport Py_INCREF, Py_DECREF
 from numbers import Number, Integral
@@ -23,7 +24,21 @@ from ..base import string_types, py2cerror
 from ..runtime_ctypes import DataType, TVMContext, TVMByteArray, ObjectRValueRef
 
 
-cdef void tvm_callback_finalize(void* fhandle):
+# Whether the packed function calls of each thread release the GIL.
+# Python callbacks re-acquire it, see tvm_callback.
+_GIL_STATE = threading.local()
+
+
+def _set_release_gil(flag):
+    """Set whether the calls of the current thread release the GIL.
+
+    Returns the previous value."""
+    old = getattr(_GIL_STATE, "release", False)
+    _GIL_STATE.release = flag
+    return old
+
+
+cdef void tvm_callback_finalize(void* fhandle) with gil:
     local_pyfunc = <object>(fhandle)
     Py_DECREF(local_pyfunc)
 
@@ -229,12 +244,19 @@ cdef inline int FuncCall3(void* chandle,
                           int* ret_tcode) except -1:
     cdef TVMValue[3] values
     cdef int[3] tcodes
+    cdef int c_api_ret_code
     nargs = len(args)
     temp_args = []
     for i in range(nargs):
         make_arg(args[i], &values[i], &tcodes[i], temp_args)
-    CALL(TVMFuncCall(chandle, &values[0], &tcodes[0],
-                     nargs, ret_val, ret_tcode))
+    if getattr(_GIL_STATE, "release", False):
+        with nogil:
+            c_api_ret_code = TVMFuncCall(chandle, &values[0], &tcodes[0],
+                                         nargs, ret_val, ret_tcode)
+    else:
+        c_api_ret_code = TVMFuncCall(chandle, &values[0], &tcodes[0],
+                                     nargs, ret_val, ret_tcode)
+    CALL(c_api_ret_code)
     return 0
 
 cdef inline int FuncCall(void* chandle,
@@ -249,13 +271,20 @@ cdef inline int FuncCall(void* chandle,
 
     cdef vector[TVMValue] values
     cdef vector[int] tcodes
+    cdef int c_api_ret_code
     values.resize(max(nargs, 1))
     tcodes.resize(max(nargs, 1))
     temp_args = []
     for i in range(nargs):
         make_arg(args[i], &values[i], &tcodes[i], temp_args)
-    CALL(TVMFuncCall(chandle, &values[0], &tcodes[0],
-                     nargs, ret_val, ret_tcode))
+    if getattr(_GIL_STATE, "release", False):
+        with nogil:
+            c_api_ret_code = TVMFuncCall(chandle, &values[0], &tcodes[0],
+                                         nargs, ret_val, ret_tcode)
+    else:
+        c_api_ret_code = TVMFuncCall(chandle, &values[0], &tcodes[0],
+                                     nargs, ret_val, ret_tcode)
+    CALL(c_api_ret_code)
     return 0
 
 
@@ -181,12 +181,16 @@ class RPCRunner(Runner):
         Whether check correctness after measurement. This will use llvm cpu target to
         call your template and get the reference output.
         This can work for TOPI templates, but may not work for your custom template.
+    adaptive_measure: dict, optional
+        If set, measure with :py:meth:`tvm.runtime.Module.adaptive_time_evaluator`
+        instead of a fixed `repeat`, the dict holding its extra keyword arguments
+        (e.g. rel_ci, time_budget, max_repeat). The cost reported is the median.
     """
     def __init__(self,
                  key, host, port, priority=1,
                  timeout=10, n_parallel=None,
                  number=4, repeat=3, min_repeat_ms=0, cooldown_interval=0.1,
-                 check_correctness=False):
+                 check_correctness=False, adaptive_measure=None):
         super(RPCRunner, self).__init__(timeout, n_parallel)
 
         self.key = key
@@ -198,6 +202,7 @@ class RPCRunner(Runner):
         self.number = number
         self.repeat = repeat
         self.min_repeat_ms = min_repeat_ms
+        self.adaptive_measure = adaptive_measure
 
         self.ref_input = None
         self.ref_output = None
@@ -266,7 +271,8 @@ class RPCRunner(Runner):
                                            self.cooldown_interval,
                                            remote_args,
                                            self.ref_input,
-                                           self.ref_output)
+                                           self.ref_output,
+                                           self.adaptive_measure)
                 futures.append(ret)
 
             for future in futures:
@@ -308,6 +314,10 @@ class LocalRunner(RPCRunner):
         Whether check correctness after measurement. This will use llvm cpu target to
         call your template and get the reference output.
         This can work for TOPI templates, but may not work for your custom template.
+    adaptive_measure: dict, optional
+        If set, measure with :py:meth:`tvm.runtime.Module.adaptive_time_evaluator`
+        instead of a fixed `repeat`, the dict holding its extra keyword arguments
+        (e.g. rel_ci, time_budget, max_repeat). The cost reported is the median.
 
     Note
     ----
@@ -317,13 +327,14 @@ class LocalRunner(RPCRunner):
     def __init__(self,
                  timeout=10,
                  number=4, repeat=3, min_repeat_ms=0, cooldown_interval=0.1,
-                 check_correctness=False):
+                 check_correctness=False, adaptive_measure=None):
         super(LocalRunner, self).__init__('', None, None, 0,
                                           timeout=timeout, n_parallel=1,
                                           number=number, repeat=repeat,
                                           min_repeat_ms=min_repeat_ms,
                                           cooldown_interval=cooldown_interval,
-                                          check_correctness=check_correctness)
+                                          check_correctness=check_correctness,
+                                          adaptive_measure=adaptive_measure)
         self.tracker = None
         self.server = None
 
@@ -420,7 +431,7 @@ def _wrap_build_func(build_func):
 
 def run_through_rpc(measure_input, build_result,
                     number, repeat, min_repeat_ms, cooldown_interval,
-                    remote_args, ref_input=None, ref_output=None):
+                    remote_args, ref_input=None, ref_output=None, adaptive_measure=None):
     """Run a generated library through rpc
 
     Parameters
@@ -453,12 +464,15 @@ def run_through_rpc(measure_input, build_result,
         The reference input used for checking correctness
     ref_output: List of np.ndarray
         The reference output used for checking correctness
+    adaptive_measure: dict, optional
+        The keyword arguments of the adaptive time evaluator, if it is used
     """
     if isinstance(build_result, MeasureResult):
         return build_result
 
     tic = time.time()
     errno = MeasureErrorNo.NO_ERROR
+    remote = None
     try:
         # upload built module
         remote = request_remote(*remote_args)
@@ -472,8 +486,13 @@ def run_through_rpc(measure_input, build_result,
         remote.upload(build_result.filename)
         func = remote.load_module(os.path.split(build_result.filename)[1])
         ctx = remote.context(str(measure_input.target), 0)
-        time_f = func.time_evaluator(
-            func.entry_name, ctx, number=number, repeat=repeat, min_repeat_ms=min_repeat_ms)
+        if adaptive_measure is not None:
+            time_f = func.adaptive_time_evaluator(
+                func.entry_name, ctx, number=number, min_repeat_ms=min_repeat_ms,
+                **adaptive_measure)
+        else:
+            time_f = func.time_evaluator(
+                func.entry_name, ctx, number=number, repeat=repeat, min_repeat_ms=min_repeat_ms)
 
         # set input
         if ref_input:
@@ -485,14 +504,20 @@ def run_through_rpc(measure_input, build_result,
             args = [nd.array(x, ctx=ctx) for x in args]
             ctx.sync()
 
-        costs = time_f(*args).results
+        profile = time_f(*args)
+        costs = profile.results
 
         # clean up remote files
         remote.remove(build_result.filename)
         remote.remove(os.path.splitext(build_result.filename)[0] + '.so')
         remote.remove('')
 
-        if len(costs) > 2:  # remove largest and smallest value to reduce variance
+        if adaptive_measure is not None:
+            if profile.unstable:
+                logger.debug("Unstable measurement of %s: median %g, confidence interval %s",
+                             measure_input.config, profile.median, profile.ci)
+            costs = (profile.median,)
+        elif len(costs) > 2:  # remove largest and smallest value to reduce variance
             costs = list(costs)
             costs.sort()
             costs = tuple(costs[1:-1])
@@ -512,6 +537,9 @@ def run_through_rpc(measure_input, build_result,
         costs = (RuntimeError(msg[:1024]),)
         errno = MeasureErrorNo.RUNTIME_DEVICE
     tstamp = time.time()
+    if remote is not None:
+        report_remote(remote_args, remote, tstamp - tic,
+                      errno != MeasureErrorNo.RUNTIME_DEVICE)
     time.sleep(cooldown_interval)
     return MeasureResult(costs, errno, tstamp - tic + build_result.time_cost, tstamp)
 
@@ -548,6 +576,32 @@ def request_remote(device_key, host=None, port=None, priority=1, timeout=60):
     return remote
 
 
+def report_remote(remote_args, remote, latency, success):
+    """Report the health of a remote session to the tracker it came from
+
+    Parameters
+    ----------
+    remote_args: Tuple
+        The argument for request_remote
+    remote: RPCSession
+        The session returned by request_remote
+    latency: float
+        The time spent on the session (units: second)
+    success: bool
+        Whether the session was used without device error
+    """
+    if remote.server_addr is None:
+        return
+    host = remote_args[1] or os.environ['TVM_TRACKER_HOST']
+    port = remote_args[2] or int(os.environ['TVM_TRACKER_PORT'])
+    try:
+        tracker = _rpc.connect_tracker(host, port)
+        tracker.report(remote.server_addr, latency=latency, success=success)
+    except (OSError, RuntimeError) as err:
+        # the report is best effort, older trackers do not support it
+        logger.debug("Failed to report the health of %s: %s", remote.server_addr, err)
+
+
 def check_remote(target, device_key, host=None, port=None, priority=100, timeout=10):
     """
     Check the availability of a remote device
@@ -30,6 +30,7 @@ of the DispatchContext base class.
 
 from __future__ import absolute_import as _abs
 
+import itertools
 import logging
 
 import numpy as np
@@ -38,6 +39,9 @@ from .space import FallbackConfigEntity
 
 logger = logging.getLogger('autotvm')
 
+# source of the versions of dispatch contexts
+_VERSION_COUNTER = itertools.count()
+
 
 class DispatchContext(object):
     """
@@ -45,11 +49,21 @@ class DispatchContext(object):
 
     DispatchContext enables the target and workload
     specific dispatch mechanism for templates.
+
+    Every context carries a version which changes whenever its records
+    change. Contexts whose query results only depend on the target, the
+    workload and the version are marked as cacheable, so that callers
+    can memoize the decisions made from these results.
     """
     current = None
+    cacheable = False
 
     def __init__(self):
         self._old_ctx = DispatchContext.current
+        self.version = next(_VERSION_COUNTER)
+
+    def _bump_version(self):
+        self.version = next(_VERSION_COUNTER)
 
     def query(self, target, workload):
         """
@@ -184,6 +198,8 @@ class ApplyHistoryBest(DispatchContext):
         If is str, then it should be the filename of a records log file.
         Each row of this file is an encoded record pair. Otherwise, it is an iterator.
     """
+    cacheable = True
+
     def __init__(self, records):
         super(ApplyHistoryBest, self).__init__()
 
@@ -215,6 +231,7 @@ class ApplyHistoryBest(DispatchContext):
             records = load_from_file(records)
         if not records:
             return
+        self._bump_version()
 
         best_by_targetkey = self.best_by_targetkey
         best_by_model = self.best_by_model
@@ -277,6 +294,7 @@ class ApplyHistoryBest(DispatchContext):
         key = (model, workload)
         # assume user provided config is the best
         cfg.cost = 0
+        self._bump_version()
         self._best_user_defined[key] = cfg
 
         for k in target.keys:
@@ -291,6 +309,7 @@ class FallbackContext(DispatchContext):
     Any tunable template can be called under this context.
     This is the root context.
     """
+    cacheable = True
 
     def __init__(self):
         super(FallbackContext, self).__init__()
@@ -331,10 +350,12 @@ class FallbackContext(DispatchContext):
         key = (str(target), workload)
         if key in self.memory:
             del self.memory[key]
+            self._bump_version()
 
     def update(self, target, workload, cfg):
         key = (str(target), workload)
         self.memory[key] = cfg
+        self._bump_version()
 
 
 DispatchContext.current = FallbackContext()
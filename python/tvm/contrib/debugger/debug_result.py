@@ -69,8 +69,31 @@ class DebugResult(object):
         self._nodes_list = json_obj['nodes']
         self._shapes_list = json_obj['attrs']['shape']
         self._dtype_list = json_obj['attrs']['dltype']
+        self._bytes_list = self._compute_node_bytes(json_obj)
         self._update_graph_json()
 
+    def _compute_node_bytes(self, json_obj):
+        """Compute the number of bytes read and written by each node.
+        """
+        node_row_ptr = json_obj['node_row_ptr']
+
+        def entry_bytes(eid):
+            dtype = tvm.runtime.DataType(self._dtype_list[1][eid])
+            size = (dtype.bits * dtype.lanes + 7) // 8
+            for dim in self._shapes_list[1][eid]:
+                size *= dim
+            return size
+
+        bytes_list = []
+        for nid, node in enumerate(self._nodes_list):
+            if node['op'] == 'null':
+                bytes_list.append(0)
+                continue
+            eids = [node_row_ptr[e[0]] + e[1] for e in node['inputs']]
+            eids += range(node_row_ptr[nid], node_row_ptr[nid + 1])
+            bytes_list.append(sum(entry_bytes(eid) for eid in eids))
+        return bytes_list
+
     def _update_graph_json(self):
         """update the nodes_list with name, shape and data type,
         for temporarily storing the output.
@@ -119,6 +142,11 @@ class DebugResult(object):
         """
         return self._dtype_list
 
+    def get_graph_node_bytes(self):
+        """Return the number of bytes read and written by each node
+        """
+        return self._bytes_list
+
     def get_output_tensors(self):
         """Dump the outputs to a temporary folder, the tensors are in numpy format
         """
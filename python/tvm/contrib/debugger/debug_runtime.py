@@ -17,8 +17,10 @@
 """Graph debug runtime executes TVM debug packed functions."""
 
 import os
+import re
 import tempfile
 import shutil
+import numpy as np
 import tvm._ffi
 
 from tvm._ffi.base import string_types
@@ -104,6 +106,9 @@ class GraphModuleDebug(graph_runtime.GraphModule):
         self._dump_path = None
         self._get_output_by_layer = module["get_output_by_layer"]
         self._run_individual = module["run_individual"]
+        self._profile_ops = module["profile_ops"]
+        self._get_captured_output = module["get_captured_output"]
+        self._captured_outputs = {}
         graph_runtime.GraphModule.__init__(self, module)
         self._create_debug_env(graph_json_str, ctx)
 
@@ -244,6 +249,94 @@ class GraphModuleDebug(graph_runtime.GraphModule):
         ret = self._run_individual(number, repeat, min_repeat_ms)
         return ret.strip(",").split(",") if ret else []
 
+    def profile(self, number=10, warmup=1, capture=None, flops=None, **input_dict):
+        """Time every operator separately over several runs.
+
+        Unlike :py:meth:`run`, no tensor is copied to the host or dumped
+        to the disk, so this can be used on large models.
+
+        Parameters
+        ----------
+        number : int
+            The number of timed runs, each one gives a sample of every operator.
+
+        warmup : int
+            The number of untimed runs done first.
+
+        capture : str, optional
+            A regular expression. The outputs of the nodes whose name matches
+            it are copied right after they execute in the last run, they can
+            then be read with :py:meth:`get_captured_outputs`.
+
+        flops : dict of str to int, optional
+            The number of floating point operations of the nodes, by name.
+
+        input_dict : dict of str to NDArray
+            List of input values to be feed to
+
+        Returns
+        -------
+        profile : numpy.recarray
+            One record for each operator node, in execution order, with the
+            fields name, op, mean_us, std_us, min_us, p50_us, p90_us, p99_us,
+            max_us, flops, bytes, gflops and gbps. The throughputs are
+            computed from the mean time.
+        """
+        if input_dict:
+            self.set_input(**input_dict)
+        nodes = self.debug_datum.get_graph_nodes()
+        capture_nodes = []
+        if capture is not None:
+            pattern = re.compile(capture)
+            capture_nodes = [i for i, node in enumerate(nodes)
+                             if node['op'] != 'param' and pattern.search(node['name'])]
+        times = self._profile_ops(number, warmup, *capture_nodes).asnumpy()
+        self._captured_outputs = {}
+        for i in capture_nodes:
+            for j in range(self.debug_datum.get_graph_node_output_num(nodes[i])):
+                key = nodes[i]['name'] + "_" + str(j)
+                self._captured_outputs[key] = self._get_captured_output(i, j)
+
+        op_ids = [i for i, node in enumerate(nodes) if node['op'] != 'param']
+        flops = flops or {}
+        name_len = max([len(nodes[i]['name']) for i in op_ids] + [1])
+        op_len = max([len(nodes[i]['op']) for i in op_ids] + [1])
+        dtype = [("name", "U%d" % name_len), ("op", "U%d" % op_len)]
+        dtype += [(field, "f8") for field in ("mean_us", "std_us", "min_us", "p50_us",
+                                              "p90_us", "p99_us", "max_us")]
+        dtype += [("flops", "i8"), ("bytes", "i8"), ("gflops", "f8"), ("gbps", "f8")]
+        profile = np.recarray((len(op_ids),), dtype=dtype)
+        samples = times[:, op_ids]
+        profile.name = [nodes[i]['name'] for i in op_ids]
+        profile.op = [nodes[i]['op'] for i in op_ids]
+        profile.mean_us = samples.mean(axis=0)
+        profile.std_us = samples.std(axis=0)
+        profile.min_us = samples.min(axis=0)
+        profile.p50_us, profile.p90_us, profile.p99_us = np.percentile(
+            samples, [50, 90, 99], axis=0)
+        profile.max_us = samples.max(axis=0)
+        profile.flops = [flops.get(nodes[i]['name'], 0) for i in op_ids]
+        node_bytes = self.debug_datum.get_graph_node_bytes()
+        profile.bytes = [node_bytes[i] for i in op_ids]
+        # 1 flop/us = 1e-3 GFLOPS, and likewise for bytes.
+        with np.errstate(divide="ignore", invalid="ignore"):
+            profile.gflops = np.where(profile.mean_us > 0,
+                                      profile.flops / profile.mean_us * 1e-3, 0.0)
+            profile.gbps = np.where(profile.mean_us > 0,
+                                    profile.bytes / profile.mean_us * 1e-3, 0.0)
+        return profile
+
+    def get_captured_outputs(self):
+        """Get the outputs captured by the last :py:meth:`profile` call.
+
+        Returns
+        -------
+        outputs : dict of str to NDArray
+            The outputs, keyed by the node name and the output index
+            as in :py:meth:`debug_get_output`.
+        """
+        return self._captured_outputs
+
     def exit(self):
         """Exits the dump folder and all its contents"""
         self._remove_dump_root()
@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 """Minimum graph runtime that executes graph containing TVM PackedFunc."""
+from collections.abc import Mapping
+
 import numpy as np
 import tvm._ffi
 
@@ -238,10 +240,17 @@ class GraphModule(object):
 
         Parameters
         ----------
-        params_bytes : bytearray
-            The serialized parameter dict.
+        params_bytes : bytearray or Mapping of str to NDArray
+            The serialized parameter dict. A mapping such as the result of
+            :py:func:`tvm.relay.load_param_file` is copied into the module
+            directly, without going through an intermediate byte array.
         """
-        self._load_params(bytearray(params_bytes))
+        if isinstance(params_bytes, Mapping):
+            self.set_input(**params_bytes)
+            return
+        if not isinstance(params_bytes, bytearray):
+            params_bytes = bytearray(params_bytes)
+        self._load_params(params_bytes)
 
     def share_params(self, other, params_bytes):
         """Share parameters from pre-existing GraphRuntime instance.
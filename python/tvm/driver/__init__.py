@@ -16,3 +16,4 @@
 # under the License.
 """Namespace for driver APIs"""
 from .build_module import lower, build
+from .build_cache import BuildCache
@@ -0,0 +1,208 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""A cache of the runtime modules built by tvm.build"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+
+import tvm._ffi
+import tvm.runtime
+from tvm.ir import save_json
+from tvm.target import BuildConfig
+
+logger = logging.getLogger('build_cache')
+
+# environment variable to enable a persistent build cache for a whole process
+BUILD_CACHE_DIR_ENV_VAR = "TVM_BUILD_CACHE_DIR"
+
+_ENTRY_SUFFIX = ".bc"
+
+_BUILD_CACHE_STATE = threading.local()
+
+
+class BuildCache(object):
+    """Reuse the runtime modules of tvm.build for identical lowered functions.
+
+    Within the scope of a BuildCache, tvm.build still lowers its inputs, but
+    skips code generation when the lowered modules, targets and build config
+    are identical to an earlier build. When a directory is given, the
+    built modules are also saved there and shared by later processes.
+
+    The host modules are kept as LLVM bitcode, and every hit loads a new
+    module from it, so that callers can import other modules into the
+    result. Builds whose host module is not an LLVM module are not cached,
+    and builds with device modules are only cached within the process.
+
+    A build cache only applies to the thread that entered it, worker
+    threads that call tvm.build enter it again.
+
+    Parameters
+    ----------
+    path : str, optional
+        The directory of the persistent cache, defaults to the value of
+        TVM_BUILD_CACHE_DIR. Only the in-process cache is used when neither is set.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with tvm.driver.BuildCache("/tmp/tvm_build_cache"):
+            func = tvm.build(s, [A, B], "llvm")
+    """
+    def __init__(self, path=None):
+        self.path = path if path is not None else os.environ.get(BUILD_CACHE_DIR_ENV_VAR)
+        self.hits = 0
+        self.misses = 0
+        self._modules = {}
+        self._temp = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stack():
+        if not hasattr(_BUILD_CACHE_STATE, "stack"):
+            _BUILD_CACHE_STATE.stack = []
+        return _BUILD_CACHE_STATE.stack
+
+    @staticmethod
+    def current():
+        """Get the build cache entered in the current thread.
+
+        Returns
+        -------
+        cache : BuildCache or None
+            The innermost build cache, or None outside of build caches.
+        """
+        stack = BuildCache._stack()
+        return stack[-1] if stack else None
+
+    def __enter__(self):
+        BuildCache._stack().append(self)
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        BuildCache._stack().pop()
+
+    @staticmethod
+    def key(target_input_mod, target_host):
+        """Get the key of a build.
+
+        Parameters
+        ----------
+        target_input_mod : dict of str or Target to IRModule
+            The lowered modules of each target.
+
+        target_host : str or Target
+            The host target.
+
+        Returns
+        -------
+        key : str or None
+            The digest of the build, None when the modules cannot be serialized.
+        """
+        cfg = BuildConfig.current()
+        # pylint: disable=protected-access
+        options = ["%s=%s" % (name, getattr(cfg, name))
+                   for name in sorted(BuildConfig._object_defaults)]
+        items = [tvm.__version__, str(target_host)] + options
+        try:
+            for tar, mod in sorted(target_input_mod.items(), key=lambda x: str(x[0])):
+                items += [str(tar), save_json(mod)]
+        except tvm._ffi.base.TVMError:
+            return None
+        return hashlib.sha256("\n".join(items).encode("utf-8")).hexdigest()
+
+    def _file(self, key):
+        return os.path.join(self.path, key + _ENTRY_SUFFIX)
+
+    def _temp_dir(self):
+        # pylint: disable=import-outside-toplevel
+        from tvm.contrib import util
+        with self._lock:
+            if self._temp is None:
+                self._temp = util.tempdir()
+            return self._temp.temp_dir
+
+    def get(self, key):
+        """Get the runtime module of a build.
+
+        Parameters
+        ----------
+        key : str
+            The key of the build.
+
+        Returns
+        -------
+        rt_mod : runtime.Module or None
+            A new module loaded from the cache, None if the build is not cached.
+        """
+        with self._lock:
+            entry = self._modules.get(key)
+        if entry is None and self.path and os.path.isfile(self._file(key)):
+            entry = (self._file(key), [])
+        rt_mod = None
+        if entry is not None:
+            path, device_modules = entry
+            try:
+                rt_mod = tvm.runtime.load_module(path)
+            except tvm._ffi.base.TVMError as err:
+                logger.warning("Failed to load the cached module %s: %s", path, err)
+            else:
+                for mdev in device_modules:
+                    rt_mod.import_module(mdev)
+        with self._lock:
+            if rt_mod is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return rt_mod
+
+    def put(self, key, rt_mod):
+        """Add the runtime module of a build.
+
+        Parameters
+        ----------
+        key : str
+            The key of the build.
+
+        rt_mod : runtime.Module
+            The built module.
+        """
+        if rt_mod.type_key != "llvm":
+            return
+        device_modules = list(rt_mod.imported_modules)
+        # the device modules are not saved with the bitcode of the host module
+        cache_dir = self.path if self.path and not device_modules else self._temp_dir()
+        path = os.path.join(cache_dir, key + _ENTRY_SUFFIX)
+        tmp_path = None
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # save to a temporary file first so that concurrent
+            # readers never see a partial entry
+            fd, tmp_path = tempfile.mkstemp(suffix=_ENTRY_SUFFIX, dir=cache_dir)
+            os.close(fd)
+            rt_mod.save(tmp_path)
+            os.replace(tmp_path, path)
+        except (OSError, tvm._ffi.base.TVMError) as err:
+            logger.warning("Failed to save the built module to the cache: %s", err)
+            return
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        with self._lock:
+            self._modules[key] = (path, device_modules)
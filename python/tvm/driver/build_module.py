@@ -25,11 +25,13 @@ import tvm.tir
 from tvm.runtime import ndarray
 from tvm.ir import container
 from tvm.ir import CallingConv
+from tvm.ir import profiling
 from tvm.target import codegen, BuildConfig
 from tvm.tir import ir_pass
 from tvm.te import tensor
 from tvm.te import schedule
 from tvm import target as _target
+from .build_cache import BuildCache
 
 
 def get_binds(args, compact=False, binds=None):
@@ -356,6 +358,8 @@ def build(inputs,
     Note
     ----
     See the note on :any:`tvm.target` on target string format.
+    Within a :any:`tvm.driver.BuildCache`, identical lowered functions
+    are only compiled once.
     """
     if isinstance(inputs, schedule.Schedule):
         if args is None:
@@ -398,19 +402,32 @@ def build(inputs,
     if not target_host:
         target_host = "llvm" if tvm.runtime.enabled("llvm") else "stackvm"
 
-    mod_host_all = tvm.IRModule({})
+    cache = BuildCache.current()
+    if cache is not None:
+        key = cache.key(target_input_mod, target_host)
+        rt_mod_host = cache.get(key) if key is not None else None
+        if rt_mod_host is not None:
+            return rt_mod_host
 
-    device_modules = []
-    for tar, input_mod in target_input_mod.items():
-        mod_host, mdev = _build_for_device(input_mod, tar, target_host)
-        mod_host_all.update(mod_host)
-        device_modules.append(mdev)
+    names = [gvar.name_hint for mod in target_input_mod.values()
+             for gvar, _ in mod.functions.items()]
+    with profiling.scope(names[0] if len(names) == 1 else "tvm.build", "codegen"):
+        mod_host_all = tvm.IRModule({})
 
-    # Generate a unified host module.
-    rt_mod_host = codegen.build_module(mod_host_all, target_host)
+        device_modules = []
+        for tar, input_mod in target_input_mod.items():
+            mod_host, mdev = _build_for_device(input_mod, tar, target_host)
+            mod_host_all.update(mod_host)
+            device_modules.append(mdev)
+
+        # Generate a unified host module.
+        rt_mod_host = codegen.build_module(mod_host_all, target_host)
 
     # Import all modules.
     for mdev in device_modules:
         if mdev:
             rt_mod_host.import_module(mdev)
+
+    if cache is not None and key is not None:
+        cache.put(key, rt_mod_host)
     return rt_mod_host
@@ -58,12 +58,14 @@ def main(args):
                      web_port=args.web_port,
                      index_page=index,
                      resource_files=js_files,
-                     tracker_addr=tracker_addr)
+                     tracker_addr=tracker_addr,
+                     max_buffer_size=args.max_buffer_size)
     else:
         prox = Proxy(args.host,
                      port=args.port,
                      web_port=args.web_port,
-                     tracker_addr=tracker_addr)
+                     tracker_addr=tracker_addr,
+                     max_buffer_size=args.max_buffer_size)
     prox.proc.join()
 
 
@@ -79,6 +81,8 @@ if __name__ == "__main__":
                         help='Whether to switch on example rpc mode')
     parser.add_argument('--tracker', type=str, default="",
                         help="Report to RPC tracker")
+    parser.add_argument('--max-buffer-size', type=int, default=4 << 20,
+                        help="The maximum number of bytes buffered for a connection")
     parser.add_argument('--no-fork', dest='fork', action='store_false',
                         help="Use spawn mode to avoid fork. This option \
                          is able to avoid potential fork problems with Metal, OpenCL \
@@ -55,7 +55,9 @@ def main(args):
                         tracker_addr=tracker_addr,
                         load_library=args.load_library,
                         custom_addr=args.custom_addr,
-                        silent=args.silent)
+                        silent=args.silent,
+                        upload_cache_size=args.upload_cache_size,
+                        upload_cache_path=args.upload_cache_path)
     server.proc.join()
 
 
@@ -114,6 +116,11 @@ if __name__ == "__main__":
                          and ROCM compilers.")
     parser.add_argument('--custom-addr', type=str,
                         help="Custom IP Address to Report to RPC Tracker")
+    parser.add_argument('--upload-cache-size', type=int, default=256 << 20,
+                        help="The maximum size in bytes of the cache of uploaded files, "
+                             "0 disables the cache.")
+    parser.add_argument('--upload-cache-path', type=str,
+                        help="The directory of the cache of uploaded files.")
     parser.add_argument('--utvm-dev-config', type=str,
                         help='JSON config file for the target device (if using MicroTVM)')
     parser.add_argument('--utvm-dev-id', type=str,
@@ -22,12 +22,15 @@ import logging
 import argparse
 import multiprocessing
 import sys
-from ..rpc.tracker import Tracker
+from ..rpc.tracker import Tracker, HealthPolicy
 
 def main(args):
     """Main funciton"""
+    health_policy = HealthPolicy(max_failure_rate=args.max_failure_rate,
+                                 straggler_factor=args.straggler_factor,
+                                 quarantine_time=args.quarantine_time)
     tracker = Tracker(args.host, port=args.port, port_end=args.port_end,
-                      silent=args.silent)
+                      silent=args.silent, health_policy=health_policy)
     tracker.proc.join()
 
 
@@ -45,6 +48,13 @@ if __name__ == "__main__":
                          and ROCM compilers.")
     parser.add_argument('--silent', action='store_true',
                         help="Whether run in silent mode.")
+    parser.add_argument('--max-failure-rate', type=float, default=0.5,
+                        help="The failure rate above which a server is quarantined.")
+    parser.add_argument('--straggler-factor', type=float, default=2.0,
+                        help="How many times slower than its peers a server is \
+                        quarantined.")
+    parser.add_argument('--quarantine-time', type=float, default=300.0,
+                        help="The number of seconds a server stays in quarantine.")
 
     parser.set_defaults(fork=True)
     args = parser.parse_args()
@@ -28,5 +28,6 @@ from .adt import Constructor, TypeData
 from .module import IRModule
 from .attrs import Attrs, DictAttrs, make_node
 from .container import Array, Map
+from .profiling import CompileProfiler, CompileEvent
 
 from . import transform
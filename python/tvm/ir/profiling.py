@@ -0,0 +1,344 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Compile time profiling of passes and primitive functions."""
+import json
+import os
+import threading
+import time
+
+
+class CompileEvent(object):
+    """A timed step of the compilation.
+
+    Parameters
+    ----------
+    name : str
+        The name of the pass, operator or function.
+
+    category : str
+        The kind of step, e.g. pass, strategy, compute, schedule, lower or codegen.
+
+    start : float
+        The start time in seconds.
+
+    thread : int
+        The index of the thread that ran the step.
+
+    parent : int or None
+        The index of the enclosing event in the events of the profiler.
+    """
+    __slots__ = ["name", "category", "start", "duration", "thread", "parent", "nodes"]
+
+    def __init__(self, name, category, start, thread, parent):
+        self.name = name
+        self.category = category
+        self.start = start
+        self.duration = None
+        self.thread = thread
+        self.parent = parent
+        self.nodes = None
+
+    def __repr__(self):
+        return "CompileEvent(%s:%s, %.6f s, nodes=%s)" % (
+            self.category, self.name, self.duration or 0.0, self.nodes)
+
+
+def count_nodes(mod):
+    """Count the IR nodes of the Relay and TIR functions in a module.
+
+    Parameters
+    ----------
+    mod : IRModule
+        The module.
+
+    Returns
+    -------
+    count : int
+        The number of expressions of the Relay functions plus the number
+        of statements and expressions of the TIR functions.
+    """
+    # pylint: disable=import-outside-toplevel
+    from tvm import relay, tir
+    count = [0]
+    def _visit(_):
+        count[0] += 1
+    for _, func in mod.functions.items():
+        if isinstance(func, relay.Function):
+            relay.analysis.post_order_visit(func, _visit)
+        elif isinstance(func, tir.PrimFunc):
+            tir.ir_pass.PostOrderVisit(func.body, _visit)
+    return count[0]
+
+
+class CompileProfiler(object):
+    """Record the wall time and IR size of each step of the compilation.
+
+    The passes are timed through the trace function of the PassContext,
+    and the strategy selection, compute and schedule construction, lowering
+    and code generation of each primitive function through hooks in the
+    compile engine and tvm.build. Steps run inside others are nested in
+    them, e.g. the lowering of the fused functions in relay.build.
+
+    The profiler can be used as a context manager, which enters a copy of
+    the current PassContext tracing into the profiler, or be given as the
+    trace of a PassContext.
+
+    Parameters
+    ----------
+    count_nodes : bool, optional
+        Whether to count the IR nodes after each pass and lowering. The
+        counting is excluded from the time of the step, but not from the
+        time of the enclosing ones.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with tvm.transform.PassContext(opt_level=3):
+            with tvm.ir.CompileProfiler() as prof:
+                graph, lib, params = relay.build(mod, "llvm", params=params)
+        print(prof.summary())
+        prof.export_chrome_trace("build.json")
+    """
+    current = None
+
+    def __init__(self, count_nodes=True):
+        self.count_nodes = count_nodes
+        self.events = []
+        self._threads = {}
+        self._stacks = {}
+        self._lock = threading.Lock()
+        self._old_profilers = []
+        self._pass_ctxs = []
+
+    def __enter__(self):
+        # pylint: disable=import-outside-toplevel
+        from .transform import PassContext
+        cur = PassContext.current()
+        pass_ctx = PassContext(opt_level=cur.opt_level,
+                               fallback_device=cur.fallback_device,
+                               required_pass=[str(x) for x in cur.required_pass],
+                               disabled_pass=[str(x) for x in cur.disabled_pass],
+                               trace=self)
+        pass_ctx.__enter__()
+        self._pass_ctxs.append(pass_ctx)
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        self._pass_ctxs.pop().__exit__(ptype, value, trace)
+
+    def __call__(self, mod, info, is_before):
+        if is_before:
+            self.begin(info.name, "pass")
+        else:
+            self.end(info.name, mod)
+
+    def _activate(self):
+        self._old_profilers.append(CompileProfiler.current)
+        CompileProfiler.current = self
+
+    def _deactivate(self):
+        CompileProfiler.current = self._old_profilers.pop()
+
+    def _stack(self):
+        ident = threading.get_ident()
+        with self._lock:
+            if ident not in self._stacks:
+                self._threads[ident] = len(self._threads)
+                self._stacks[ident] = []
+            return self._threads[ident], self._stacks[ident]
+
+    def begin(self, name, category):
+        """Start timing a step.
+
+        Parameters
+        ----------
+        name : str
+            The name of the step.
+
+        category : str
+            The kind of step.
+        """
+        thread, stack = self._stack()
+        event = CompileEvent(name, category, time.perf_counter(), thread,
+                             stack[-1] if stack else None)
+        with self._lock:
+            stack.append(len(self.events))
+            self.events.append(event)
+
+    def end(self, name, mod=None):
+        """Stop timing the innermost step with the name.
+
+        The steps left open inside it, e.g. by a failed pass, are stopped too.
+
+        Parameters
+        ----------
+        name : str
+            The name of the step.
+
+        mod : IRModule, optional
+            The result of the step, whose nodes are counted.
+        """
+        end = time.perf_counter()
+        _, stack = self._stack()
+        event = None
+        while stack and (event is None or event.name != name):
+            event = self.events[stack.pop()]
+            event.duration = end - event.start
+        if event is not None and mod is not None and self.count_nodes:
+            event.nodes = count_nodes(mod)
+
+    def _self_times(self):
+        self_times = [event.duration or 0.0 for event in self.events]
+        for event in self.events:
+            if event.parent is not None:
+                self_times[event.parent] -= event.duration or 0.0
+        return [max(t, 0.0) for t in self_times]
+
+    def report(self):
+        """Aggregate the events by category and name.
+
+        Returns
+        -------
+        report : list of dict
+            The category, name, count, total time, self time excluding the
+            nested steps, and the largest node count of each step, sorted
+            by decreasing self time.
+        """
+        rows = {}
+        for event, self_time in zip(self.events, self._self_times()):
+            key = (event.category, event.name)
+            if key not in rows:
+                rows[key] = {"category": event.category, "name": event.name, "count": 0,
+                             "total": 0.0, "self": 0.0, "nodes": None}
+            row = rows[key]
+            row["count"] += 1
+            row["total"] += event.duration or 0.0
+            row["self"] += self_time
+            if event.nodes is not None:
+                row["nodes"] = max(row["nodes"] or 0, event.nodes)
+        return sorted(rows.values(), key=lambda row: -row["self"])
+
+    def summary(self, top=None):
+        """Get a table of the slowest steps.
+
+        Parameters
+        ----------
+        top : int, optional
+            The number of rows, all by default.
+
+        Returns
+        -------
+        summary : str
+            The table of the report.
+        """
+        lines = ["%-10s %-40s %6s %10s %10s %8s" % (
+            "Category", "Name", "Count", "Total(ms)", "Self(ms)", "Nodes")]
+        for row in self.report()[:top]:
+            lines.append("%-10s %-40s %6d %10.3f %10.3f %8s" % (
+                row["category"], row["name"][:40], row["count"], row["total"] * 1e3,
+                row["self"] * 1e3, "-" if row["nodes"] is None else row["nodes"]))
+        return "\n".join(lines)
+
+    def export_chrome_trace(self, path):
+        """Save the events in the Chrome trace event format.
+
+        The file can be opened in chrome://tracing or Perfetto.
+
+        Parameters
+        ----------
+        path : str
+            The path of the json file.
+        """
+        origin = min([event.start for event in self.events], default=0.0)
+        trace_events = []
+        for event in self.events:
+            args = {} if event.nodes is None else {"nodes": event.nodes}
+            trace_events.append({"name": event.name, "cat": event.category, "ph": "X",
+                                 "ts": (event.start - origin) * 1e6,
+                                 "dur": (event.duration or 0.0) * 1e6,
+                                 "pid": os.getpid(), "tid": event.thread, "args": args})
+        with open(path, "w") as out_file:
+            json.dump({"traceEvents": trace_events, "displayTimeUnit": "ms"}, out_file)
+
+    def export_flame_graph(self, path):
+        """Save the self time of each stack of steps in the folded format.
+
+        The file is the input of flamegraph.pl and speedscope, with one
+        stack of category:name frames and its self time in microseconds
+        per line.
+
+        Parameters
+        ----------
+        path : str
+            The path of the text file.
+        """
+        frames = ["%s:%s" % (event.category, event.name.replace(";", "_"))
+                  for event in self.events]
+        folded = {}
+        for index, self_time in enumerate(self._self_times()):
+            stack = []
+            parent = index
+            while parent is not None:
+                stack.append(frames[parent])
+                parent = self.events[parent].parent
+            key = ";".join(reversed(stack))
+            folded[key] = folded.get(key, 0.0) + self_time
+        with open(path, "w") as out_file:
+            for key, self_time in folded.items():
+                out_file.write("%s %d\n" % (key, round(self_time * 1e6)))
+
+
+class _Scope(object):
+    """Time a step with the current profiler, if any."""
+    def __init__(self, profiler, name, category):
+        self.profiler = profiler
+        self.name = name
+        self.category = category
+        self.mod = None
+
+    def __enter__(self):
+        if self.profiler is not None:
+            self.profiler.begin(self.name, self.category)
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        if self.profiler is not None:
+            self.profiler.end(self.name, self.mod)
+
+    def record(self, mod):
+        """Set the result of the step, whose nodes are counted."""
+        self.mod = mod
+
+
+def scope(name, category):
+    """Time a step of the compilation with the current CompileProfiler.
+
+    Parameters
+    ----------
+    name : str
+        The name of the step.
+
+    category : str
+        The kind of step.
+
+    Returns
+    -------
+    scope : object
+        A context manager, which does nothing when no profiler is active.
+    """
+    return _Scope(CompileProfiler.current, name, category)
@@ -26,6 +26,7 @@ import tvm.runtime
 from tvm.runtime import ndarray as _nd
 
 from . import _ffi_transform_api
+from .profiling import CompileProfiler
 
 @tvm._ffi.register_object("transform.PassInfo")
 class PassInfo(tvm.runtime.Object):
@@ -70,6 +71,11 @@ class PassContext(tvm.runtime.Object):
 
     disabled_pass : Optional[Union[List[str], Set[str], Tuple[str]]]
         The list of passes that are disabled.
+
+    trace : Optional[Callable[[IRModule, PassInfo, bool], None]]
+        A tracing function called before and after each pass. A
+        :py:class:`tvm.ir.CompileProfiler` also records the lowering of
+        primitive functions while the context is entered.
     """
     def __init__(self,
                  opt_level=2,
@@ -98,13 +104,21 @@ class PassContext(tvm.runtime.Object):
         self.__init_handle_by_constructor__(_ffi_transform_api.PassContext, opt_level,
                                             fallback_device, required,
                                             disabled, trace)
+        self._profiler = trace if isinstance(trace, CompileProfiler) else None
 
     def __enter__(self):
         _ffi_transform_api.EnterPassContext(self)
+        # contexts returned from C++ have no profiler attribute
+        profiler = self.__dict__.get("_profiler")
+        if profiler is not None:
+            profiler._activate()  # pylint: disable=protected-access
         return self
 
     def __exit__(self, ptype, value, trace):
         _ffi_transform_api.ExitPassContext(self)
+        profiler = self.__dict__.get("_profiler")
+        if profiler is not None:
+            profiler._deactivate()  # pylint: disable=protected-access
 
     @staticmethod
     def current():
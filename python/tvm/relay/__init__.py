@@ -134,3 +134,5 @@ fromtext = parser.fromtext
 # Param Serialization
 save_param_dict = param_dict.save_param_dict
 load_param_dict = param_dict.load_param_dict
+save_param_file = param_dict.save_param_file
+load_param_file = param_dict.load_param_file
@@ -41,6 +41,7 @@ import tvm.ir._ffi_api
 from tvm.ir import IRModule
 
 from .base import Span, SourceName
+from ._text_parser import ParseError, OpWrapper, ExprOp, FuncOp, FUNC_OPS, TYPE_PREFIXES
 from . import adt
 from . import expr
 from . import function
@@ -66,59 +67,6 @@ except ImportError:
 
 sys.setrecursionlimit(10000)
 
-class ParseError(Exception):
-    """Exception type for parse errors."""
-
-    def __init__(self, message: str) -> None:
-        super(ParseError, self).__init__()
-        self.message = message
-
-    def __repr__(self):
-        return "ParseError({})".format(self.message)
-
-    def __str__(self):
-        return repr(self)
-
-class OpWrapper:
-    """Overload the __call__ for op."""
-
-
-class ExprOp(OpWrapper):
-    """Call an expr. The default, but does not handle attrs well."""
-    def __init__(self, operator):
-        self.operator = operator
-
-    def __call__(self, args, attrs, type_args):
-        try:
-            return expr.Call(self.operator, args, attrs, type_args)
-        except Exception:
-            raise Exception("Operator {} is not registered. It's attributes are {}"
-                            .format(self.operator, attrs))
-
-class FuncOp(OpWrapper):
-    """Convert the attrs, call the python function with the attrs passed in as keyword arguments.
-    Tvm should provide this in the future, as this is pretty similar to what op.get is providing.
-    """
-    def __init__(self, operator):
-        self.operator = operator
-
-    def convert(self, v):
-        if isinstance(v, tuple):
-            return tuple([self.convert(x) for x in v])
-        if isinstance(v, expr.Constant):
-            return v.data.asnumpy().item()
-        if isinstance(v, str):
-            return v
-        raise Exception(v)
-
-    def __call__(self, args, attrs, type_args):
-        if attrs is None:
-            attrs = {}
-        x = self.operator(*args, **{k: self.convert(v) for k, v in attrs.items()})
-        if isinstance(x, expr.TupleWrapper):
-            x = x.astuple()
-        return x
-
 BINARY_OPS = {
     RelayParser.MUL: op.multiply,
     RelayParser.DIV: op.divide,
@@ -132,35 +80,6 @@ BINARY_OPS = {
     RelayParser.NE:  op.not_equal,
 }
 
-FUNC_OPS = {
-    "nn.conv2d": op.nn.conv2d,
-    "nn.batch_norm": op.nn.batch_norm,
-    "nn.dense": op.nn.dense,
-    "nn.bias_add": op.nn.bias_add,
-    "nn.max_pool2d": op.nn.max_pool2d,
-    "nn.max_pool3d": op.nn.max_pool3d,
-    "nn.global_max_pool2d": op.nn.global_max_pool2d,
-    "nn.avg_pool2d": op.nn.avg_pool2d,
-    "nn.avg_pool3d": op.nn.avg_pool3d,
-    "nn.global_avg_pool2d": op.nn.global_avg_pool2d,
-    "nn.softmax": op.nn.softmax,
-    "reshape": op.reshape,
-    "nn.conv2d_transpose": op.nn.conv2d_transpose,
-    "nn.conv1d_transpose": op.nn.conv1d_transpose,
-    "concatenate": op.concatenate,
-    "nn.dropout": op.nn.dropout_raw,
-    "zeros": op.zeros,
-    "split": op.split,
-    "cast": op.cast
-}
-
-TYPE_PREFIXES = [
-    "int",
-    "uint",
-    "float",
-    "bool",
-]
-
 T = TypeVar("T")
 Scope = Deque[Tuple[str, T]]
 Scopes = Deque[Scope[T]]
@@ -0,0 +1,957 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=invalid-name, too-many-branches, too-many-return-statements
+"""A recursive descent parser for Relay's text format.
+
+The parser follows grammar/Relay.g4 and builds the same IR, including the
+spans, as the ANTLR based parser in _parser.py, without going through a
+parse tree. The ANTLR runtime is not needed.
+
+The expression grammar is left recursive, it is parsed by precedence
+climbing with the precedences ANTLR derives from the order of the
+alternatives in the grammar. Spans record the indices of the first and
+last token of a construct, as ANTLR's getSourceInterval does.
+"""
+from __future__ import absolute_import
+
+import re
+from ast import literal_eval
+
+import tvm
+import tvm.ir._ffi_api
+from tvm.ir import IRModule
+
+from .base import Span, SourceName
+from . import adt
+from . import expr
+from . import function
+from . import ty
+from . import op
+
+# version of the IR built by the parser, part of the key of the parsed std
+# library modules, increase it when a change of the parser changes its output
+PARSER_VERSION = 1
+
+
+class ParseError(Exception):
+    """Exception type for parse errors."""
+
+    def __init__(self, message: str) -> None:
+        super(ParseError, self).__init__()
+        self.message = message
+
+    def __repr__(self):
+        return "ParseError({})".format(self.message)
+
+    def __str__(self):
+        return repr(self)
+
+class OpWrapper:
+    """Overload the __call__ for op."""
+
+
+class ExprOp(OpWrapper):
+    """Call an expr. The default, but does not handle attrs well."""
+    def __init__(self, operator):
+        self.operator = operator
+
+    def __call__(self, args, attrs, type_args):
+        try:
+            return expr.Call(self.operator, args, attrs, type_args)
+        except Exception:
+            raise Exception("Operator {} is not registered. It's attributes are {}"
+                            .format(self.operator, attrs))
+
+class FuncOp(OpWrapper):
+    """Convert the attrs, call the python function with the attrs passed in as keyword arguments.
+    Tvm should provide this in the future, as this is pretty similar to what op.get is providing.
+    """
+    def __init__(self, operator):
+        self.operator = operator
+
+    def convert(self, v):
+        if isinstance(v, tuple):
+            return tuple([self.convert(x) for x in v])
+        if isinstance(v, expr.Constant):
+            return v.data.asnumpy().item()
+        if isinstance(v, str):
+            return v
+        raise Exception(v)
+
+    def __call__(self, args, attrs, type_args):
+        if attrs is None:
+            attrs = {}
+        x = self.operator(*args, **{k: self.convert(v) for k, v in attrs.items()})
+        if isinstance(x, expr.TupleWrapper):
+            x = x.astuple()
+        return x
+
+FUNC_OPS = {
+    "nn.conv2d": op.nn.conv2d,
+    "nn.batch_norm": op.nn.batch_norm,
+    "nn.dense": op.nn.dense,
+    "nn.bias_add": op.nn.bias_add,
+    "nn.max_pool2d": op.nn.max_pool2d,
+    "nn.max_pool3d": op.nn.max_pool3d,
+    "nn.global_max_pool2d": op.nn.global_max_pool2d,
+    "nn.avg_pool2d": op.nn.avg_pool2d,
+    "nn.avg_pool3d": op.nn.avg_pool3d,
+    "nn.global_avg_pool2d": op.nn.global_avg_pool2d,
+    "nn.softmax": op.nn.softmax,
+    "reshape": op.reshape,
+    "nn.conv2d_transpose": op.nn.conv2d_transpose,
+    "nn.conv1d_transpose": op.nn.conv1d_transpose,
+    "concatenate": op.concatenate,
+    "nn.dropout": op.nn.dropout_raw,
+    "zeros": op.zeros,
+    "split": op.split,
+    "cast": op.cast
+}
+
+TYPE_PREFIXES = [
+    "int",
+    "uint",
+    "float",
+    "bool",
+]
+
+BINARY_OPS = {
+    "*": op.multiply,
+    "/": op.divide,
+    "+": op.add,
+    "-": op.subtract,
+    "<": op.less,
+    ">": op.greater,
+    "<=": op.less_equal,
+    ">=": op.greater_equal,
+    "==": op.equal,
+    "!=": op.not_equal,
+}
+
+# Precedences of the left recursive alternatives of the expr rule,
+# ANTLR gives earlier alternatives a higher precedence.
+_CALL_PREC = 23
+_NEG_PREC = 22
+_BINARY_PREC = {
+    "*": 21, "/": 21,
+    "+": 20, "-": 20,
+    "<": 19, ">": 19, "<=": 19, ">=": 19,
+    "==": 18, "!=": 18,
+}
+_PROJECTION_PREC = 10
+_LET_PREC = 9
+_SEQ_PREC = 8
+_GRAPH_PREC = 7
+
+_KEYWORDS = frozenset([
+    "fn", "def", "let", "if", "else", "match", "type", "extern", "meta", "Tensor", "_",
+])
+
+_TOKEN_RE = re.compile(r"""
+    (?P<ws>[ \t\n\r]+)
+  | (?P<line_comment>//[^\n]*\n)
+  | (?P<comment>/\*)
+  | (?P<metadata>METADATA:)
+  | (?P<semver>v0\.0\.4)
+  | (?P<string>"(?:\\"|[^\n\r])*?")
+  | (?P<float>[0-9]+(?:\.[0-9]+)?(?:[eE][+\-]?[0-9]+)?f)
+  | (?P<nat>[0-9]+)
+  | (?P<name>[_a-zA-Z][_a-zA-Z0-9]*(?:\.[_a-zA-Z][_a-zA-Z0-9]*)*)
+  | (?P<punct>;;|->|=>|<=|>=|==|!=|[()\[\]{},=;.@%:*/+\-<>])
+""", re.VERBOSE)
+
+_COMMENT_RE = re.compile(r"/\*|\*/")
+
+
+def _error_location(text, offset):
+    line = text.count("\n", 0, offset) + 1
+    col = offset - (text.rfind("\n", 0, offset) + 1)
+    return "line {0}, column {1}".format(line, col)
+
+
+def tokenize(text):
+    """Split Relay text into tokens.
+
+    Parameters
+    ----------
+    text : str
+        The Relay text.
+
+    Returns
+    -------
+    kinds : List[str]
+        The kind of each token. Keywords and punctuation are their own
+        kind, the other kinds are CNAME, NAT, FLOAT, BOOL_LIT,
+        QUOTED_STRING, SEMVER, METADATA and the final EOF.
+
+    texts : List[str]
+        The text of each token.
+
+    offsets : List[int]
+        The offset of each token in text.
+    """
+    kinds = []
+    texts = []
+    offsets = []
+    pos = 0
+    end = len(text)
+    match = _TOKEN_RE.match
+    while pos < end:
+        m = match(text, pos)
+        if m is None:
+            raise ParseError("unexpected character {0!r} at {1}".format(
+                text[pos], _error_location(text, pos)))
+        group = m.lastgroup
+        token = m.group()
+        if group == "ws" or group == "line_comment":
+            pos = m.end()
+            continue
+        if group == "comment":
+            # comments nest
+            depth = 1
+            cur = m.end()
+            while depth:
+                delim = _COMMENT_RE.search(text, cur)
+                if delim is None:
+                    raise ParseError("unterminated comment at {0}".format(
+                        _error_location(text, pos)))
+                depth += 1 if delim.group() == "/*" else -1
+                cur = delim.end()
+            pos = cur
+            continue
+        if group == "metadata":
+            kind = "METADATA"
+            token = text[pos:]
+        elif group == "name":
+            if token in _KEYWORDS:
+                kind = token
+                if token == "match" and text.startswith("?", m.end()):
+                    kind = token = "match?"
+            elif token in ("True", "False"):
+                kind = "BOOL_LIT"
+            else:
+                kind = "CNAME"
+        elif group == "punct":
+            kind = token
+        elif group == "nat":
+            kind = "NAT"
+        elif group == "float":
+            kind = "FLOAT"
+        elif group == "string":
+            kind = "QUOTED_STRING"
+        else:
+            kind = "SEMVER"
+        kinds.append(kind)
+        texts.append(token)
+        offsets.append(pos)
+        pos += len(token)
+    kinds.append("EOF")
+    texts.append("<EOF>")
+    offsets.append(end)
+    return kinds, texts, offsets
+
+
+class _VarScope(object):
+    """A scope of local vars, the latest var of a name shadows earlier ones."""
+    __slots__ = ["vars", "names"]
+
+    def __init__(self):
+        self.vars = {}
+        self.names = []
+
+    def add(self, name, var):
+        self.vars.setdefault(name, []).append(var)
+        self.names.append(name)
+
+    def get(self, name):
+        stack = self.vars.get(name)
+        return stack[-1] if stack else None
+
+    def rollback(self, mark):
+        """Remove the vars added after the scope had mark vars."""
+        names = self.names
+        while len(names) > mark:
+            self.vars[names.pop()].pop()
+
+
+class RelayTextParser(object):
+    """Parse Relay text format into Relay IR.
+
+    Parameters
+    ----------
+    text : str
+        The Relay text.
+
+    source_name : SourceName
+        The source name of the spans.
+    """
+    def __init__(self, text, source_name):
+        self.text = text
+        self.kinds, self.texts, self.offsets = tokenize(text)
+        self.pos = 0
+        self.source_name = source_name
+        self.module = IRModule({})
+        self.meta = None
+
+        # Adding an empty scope allows naked lets without pain.
+        self.var_scopes = [_VarScope()]
+        self.global_vars = {}
+        self.type_var_scopes = [[]]
+        self.global_type_vars = {}
+        self.graph_expr = []
+
+    # Tokens
+
+    def error(self, message):
+        """Raise a ParseError at the current token."""
+        raise ParseError("{0} at {1}".format(
+            message, _error_location(self.text, self.offsets[self.pos])))
+
+    def expect(self, kind):
+        """Consume a token of the given kind and return its text."""
+        if self.kinds[self.pos] != kind:
+            self.error("expected `{0}` but got `{1}`".format(kind, self.texts[self.pos]))
+        self.pos += 1
+        return self.texts[self.pos - 1]
+
+    def accept(self, kind):
+        """Consume the current token if it is of the given kind."""
+        if self.kinds[self.pos] == kind:
+            self.pos += 1
+            return True
+        return False
+
+    def set_span(self, node, start):
+        """Attach the span from token start to the last consumed token."""
+        if isinstance(node, expr.TupleWrapper):
+            node = node.astuple()
+        tvm.ir._ffi_api.NodeSetSpan(node, Span(self.source_name, start, self.pos - 1))
+        return node
+
+    # Scopes
+
+    def enter_var_scope(self):
+        self.var_scopes.append(_VarScope())
+
+    def exit_var_scope(self):
+        self.var_scopes.pop()
+
+    def mk_var(self, name, typ=None):
+        """Create a new Var and add it to the Var scope."""
+        var = expr.Var(name, typ)
+        self.var_scopes[-1].add(name, var)
+        return var
+
+    def lookup_var(self, name):
+        for scope in reversed(self.var_scopes):
+            var = scope.get(name)
+            if var is not None:
+                return var
+        return None
+
+    def mk_global_var(self, name):
+        """Create a new GlobalVar and add it to the GlobalVar scope."""
+        if name in self.global_vars:
+            raise ParseError("duplicate global var \"{0}\"".format(name))
+        var = expr.GlobalVar(name)
+        self.global_vars[name] = var
+        return var
+
+    def enter_type_param_scope(self):
+        self.type_var_scopes.append([])
+
+    def exit_type_param_scope(self):
+        return self.type_var_scopes.pop()
+
+    def mk_typ(self, name, kind):
+        """Create a new TypeVar and add it to the TypeVar scope."""
+        typ = ty.TypeVar(name, kind)
+        self.type_var_scopes[-1].append((name, typ))
+        return typ
+
+    def lookup_typ(self, name):
+        for scope in reversed(self.type_var_scopes):
+            for key, val in scope:
+                if key == name:
+                    return val
+        return None
+
+    def mk_global_typ_var(self, name, kind):
+        """Create a new GlobalTypeVar and add it to the TypeVar scope."""
+        typ = ty.GlobalTypeVar(name, kind)
+        self._check_existing_typ_expr(name, typ)
+        self.global_type_vars[name] = typ
+        return typ
+
+    def mk_global_typ_cons(self, name, cons):
+        self._check_existing_typ_expr(name, cons)
+        self.global_type_vars[name] = cons
+
+    def _check_existing_typ_expr(self, name, new_expr):
+        if name in self.global_type_vars:
+            new_typ_name = self._type_expr_name(new_expr)
+            existing_typ_name = self._type_expr_name(self.global_type_vars[name])
+            raise ParseError(
+                "{0} `{1}` conflicts with existing {2}".format(new_typ_name,\
+                                                                name, existing_typ_name))
+
+    @staticmethod
+    def _type_expr_name(e):
+        if isinstance(e, adt.Constructor):
+            return "`{0}` ADT constructor".format(e.belong_to.name_hint)
+        if isinstance(e, ty.GlobalTypeVar):
+            if e.kind == ty.TypeKind.AdtHandle:
+                return "ADT definition"
+        return "function definition"
+
+    # Program
+
+    def parse_prog(self):
+        """prog: SEMVER (defn* | expr) METADATA? EOF"""
+        if self.kinds[-2] == "METADATA":
+            header, data = self.texts[-2].split("\n", 1)
+            assert header == "METADATA:"
+            self.meta = tvm.ir.load_json(data)
+        self.expect("SEMVER")
+        kind = self.kinds[self.pos]
+        result = self.module
+        if kind in ("def", "type", "extern"):
+            while self.kinds[self.pos] in ("def", "type", "extern"):
+                self.parse_defn()
+        elif kind not in ("METADATA", "EOF"):
+            result = self.parse_expr(0)
+        self.accept("METADATA")
+        self.expect("EOF")
+        return result
+
+    def parse_defn(self):
+        """Parse a function or ADT definition into the module."""
+        kind = self.kinds[self.pos]
+        self.pos += 1
+        if kind == "def":
+            self.expect("@")
+            ident = self.mk_global_var(self.expect("CNAME"))
+            func = self.parse_func_rest()
+            self.module[ident] = func
+        elif kind == "extern":
+            self.expect("type")
+            self.enter_type_param_scope()
+            adt_var, type_params = self.parse_adt_header()
+            self.module[adt_var] = adt.TypeData(adt_var, type_params, [])
+            self.exit_type_param_scope()
+        else:
+            self.enter_type_param_scope()
+            adt_var, type_params = self.parse_adt_header()
+            self.expect("{")
+            constructors = []
+            while self.kinds[self.pos] != "}":
+                name = self.expect("CNAME")
+                inputs = []
+                if self.accept("("):
+                    inputs.append(self.parse_type())
+                    while self.accept(","):
+                        inputs.append(self.parse_type())
+                    self.expect(")")
+                cons = adt.Constructor(name, inputs, adt_var)
+                self.mk_global_typ_cons(name, cons)
+                constructors.append(cons)
+                if not self.accept(","):
+                    break
+            self.expect("}")
+            self.module[adt_var] = adt.TypeData(adt_var, type_params, constructors)
+            self.exit_type_param_scope()
+
+    def parse_general_ident_text(self):
+        """generalIdent: CNAME ('.' CNAME)*"""
+        name = self.expect("CNAME")
+        while self.kinds[self.pos] == "." and self.kinds[self.pos + 1] == "CNAME":
+            name += "." + self.texts[self.pos + 1]
+            self.pos += 2
+        return name
+
+    def parse_type_param_names(self):
+        """The names of a typeParamList."""
+        self.expect("[")
+        names = [self.parse_general_ident_text()]
+        while self.accept(","):
+            names.append(self.parse_general_ident_text())
+        self.expect("]")
+        return names
+
+    def parse_adt_header(self):
+        """Parse the name and type params of an ADT definition."""
+        adt_name = self.parse_general_ident_text()
+        adt_var = self.mk_global_typ_var(adt_name, ty.TypeKind.AdtHandle)
+        type_params = []
+        if self.kinds[self.pos] == "[":
+            type_params = [self.mk_typ(name, ty.TypeKind.Type)
+                           for name in self.parse_type_param_names()]
+        return adt_var, type_params
+
+    def parse_func_rest(self):
+        """Parse a function after `fn` or the global var of a definition."""
+        # Enter var scope early to put params in scope.
+        self.enter_var_scope()
+        # Capture type params in params.
+        self.enter_type_param_scope()
+        if self.kinds[self.pos] == "[":
+            for name in self.parse_type_param_names():
+                self.mk_typ(name, ty.TypeKind.Type)
+
+        self.expect("(")
+        var_list = []
+        attr_list = None
+        while self.kinds[self.pos] != ")":
+            if self.kinds[self.pos] == "CNAME" and self.kinds[self.pos + 1] == "=":
+                attr_list = self.parse_attr_seq()
+                break
+            var_list.append(self.parse_var())
+            if not self.accept(","):
+                break
+        self.expect(")")
+        ret_type = self.parse_type() if self.accept("->") else None
+
+        self.expect("{")
+        body = self.parse_expr(0)
+        self.expect("}")
+        # NB(@jroesch): you must stay in the type parameter scope until
+        # after you exit the body, you can reference the type parameters
+        # of your parent scopes.
+        type_params = [typ for _, typ in self.exit_type_param_scope()]
+        self.exit_var_scope()
+
+        attrs = tvm.ir.make_node("DictAttrs", **attr_list) if attr_list is not None else None
+        return function.Function(var_list, body, ret_type, type_params, attrs)
+
+    def parse_attr_seq(self):
+        """attrSeq: attr (',' attr)*"""
+        attrs = {}
+        while True:
+            name = self.expect("CNAME")
+            self.expect("=")
+            attrs[name] = self.parse_expr(0)
+            if not self.accept(","):
+                return attrs
+
+    def parse_var(self):
+        """var: localVar (':' typeExpr)?"""
+        start = self.pos
+        self.expect("%")
+        name = "_" if self.accept("_") else self.expect("CNAME")
+        typ = self.parse_type() if self.accept(":") else None
+        var = self.mk_var(name, typ)
+        return self.set_span(var, start)
+
+    # Expressions
+
+    def parse_expr(self, prec):
+        """Parse an expression whose operators bind at least as tight as prec."""
+        kinds = self.kinds
+        start = self.pos
+        # vars bound by the left hand side of `;;` live in their own scope
+        scope = self.var_scopes[-1]
+        mark = len(scope.names)
+        lhs = self.parse_primary()
+        while True:
+            kind = kinds[self.pos]
+            if kind == "(":
+                if prec > _CALL_PREC:
+                    return lhs
+                lhs = self.parse_call(lhs, start)
+            elif kind in _BINARY_PREC:
+                op_prec = _BINARY_PREC[kind]
+                if prec > op_prec:
+                    return lhs
+                self.pos += 1
+                rhs = self.parse_expr(op_prec + 1)
+                lhs = BINARY_OPS[kind](lhs, rhs)
+            elif kind == ".":
+                if prec > _PROJECTION_PREC:
+                    return lhs
+                self.pos += 1
+                lhs = expr.TupleGetItem(lhs, int(self.expect("NAT")))
+            elif kind == ";;":
+                if prec > _SEQ_PREC:
+                    return lhs
+                self.pos += 1
+                scope.rollback(mark)
+                var = self.mk_var("_", None)
+                body = self.parse_expr(_SEQ_PREC + 1)
+                lhs = expr.Let(var, lhs, body)
+            else:
+                return lhs
+
+    def parse_primary(self):
+        """Parse an expression that does not start with a sub expression."""
+        kind = self.kinds[self.pos]
+        start = self.pos
+        if kind == "%":
+            next_kind = self.kinds[self.pos + 1]
+            if next_kind == "NAT":
+                if self.kinds[self.pos + 2] == "=":
+                    return self.parse_graph()
+                index = int(self.texts[self.pos + 1])
+                self.pos += 2
+                if index >= len(self.graph_expr):
+                    raise ParseError("unbound graph var `%{0}`".format(index))
+                return self.graph_expr[index]
+            self.pos += 1
+            name = self.expect("CNAME")
+            local_var = self.lookup_var(name)
+            if local_var is None:
+                raise ParseError("unbound local var `{0}`".format(name))
+            return local_var
+        if kind == "CNAME":
+            return self.resolve_ident(self.parse_general_ident_text())
+        if kind == "(":
+            self.pos += 1
+            if self.accept(")"):
+                return expr.Tuple([])
+            first = self.parse_expr(0)
+            if self.accept(")"):
+                return first
+            self.expect(",")
+            fields = [first]
+            if self.kinds[self.pos] != ")":
+                fields.append(self.parse_expr(0))
+                while self.accept(","):
+                    fields.append(self.parse_expr(0))
+            self.expect(")")
+            return expr.Tuple(fields)
+        if kind == "NAT":
+            self.pos += 1
+            return expr.const(int(self.texts[start]))
+        if kind == "FLOAT":
+            self.pos += 1
+            return expr.const(float(self.texts[start][:-1]))
+        if kind == "BOOL_LIT":
+            self.pos += 1
+            return expr.const(self.texts[start] == "True")
+        if kind == "@":
+            self.pos += 1
+            var_name = self.expect("CNAME")
+            global_var = self.global_vars.get(var_name, None)
+            if global_var is None:
+                raise ParseError("unbound global var `{0}`".format(var_name))
+            return global_var
+        if kind == "let":
+            return self.parse_let()
+        if kind == "fn":
+            self.pos += 1
+            return self.set_span(self.parse_func_rest(), start)
+        if kind == "-":
+            self.pos += 1
+            val = self.parse_expr(_NEG_PREC)
+            if isinstance(val, expr.Constant) and val.data.asnumpy().ndim == 0:
+                # fold Neg in for scalars
+                return expr.const(-val.data.asnumpy().item())
+            return op.negative(val)
+        if kind == "if":
+            return self.parse_if()
+        if kind in ("match", "match?"):
+            return self.parse_match()
+        if kind == "[":
+            self.pos += 1
+            fields = []
+            if self.kinds[self.pos] != "]":
+                fields.append(self.parse_expr(0))
+                while self.accept(","):
+                    fields.append(self.parse_expr(0))
+            self.expect("]")
+            return tuple(fields)
+        if kind == "meta":
+            return self.parse_meta()
+        if kind == "QUOTED_STRING":
+            self.pos += 1
+            return literal_eval(self.texts[start])
+        return self.error("unexpected `{0}`".format(self.texts[start]))
+
+    def resolve_ident(self, name):
+        """Resolve a generalIdent to a type, constructor or operator."""
+        # Look through all type prefixes for a match.
+        for type_prefix in TYPE_PREFIXES:
+            if name.startswith(type_prefix):
+                return ty.scalar_type(name)
+        # Next, look it up in the local then global type params.
+        type_expr = self.lookup_typ(name)
+        if type_expr is None:
+            type_expr = self.global_type_vars.get(name, None)
+        if type_expr is not None:
+            # Zero-arity constructor calls fall into the general ident case, so in that case,
+            # we construct a constructor call with no args.
+            if isinstance(type_expr, adt.Constructor) and not type_expr.inputs:
+                type_expr = expr.Call(type_expr, [])
+            return type_expr
+        # Check if it's an operator.
+        if name in FUNC_OPS:
+            return FuncOp(FUNC_OPS[name])
+        return ExprOp(op.get(name))
+
+    def parse_call(self, func, start):
+        """Parse the argument list of a call to func."""
+        self.expect("(")
+        args = []
+        attrs = None
+        while self.kinds[self.pos] != ")":
+            if self.kinds[self.pos] == "CNAME" and self.kinds[self.pos + 1] == "=":
+                attrs = self.parse_attr_seq()
+                break
+            args.append(self.parse_expr(0))
+            if not self.accept(","):
+                break
+        self.expect(")")
+        if isinstance(func, OpWrapper):
+            res = func(args, attrs, [])
+        elif isinstance(func, adt.Constructor):
+            res = func(*args)
+        else:
+            res = expr.Call(func, args, attrs, [])
+        return self.set_span(res, start)
+
+    def parse_let(self):
+        """Parse a chain of let bindings and their body."""
+        bindings = []
+        while self.accept("let"):
+            var = self.parse_var()
+            self.expect("=")
+            self.enter_var_scope()
+            value = self.parse_expr(0)
+            self.exit_var_scope()
+            self.expect(";")
+            bindings.append((var, value))
+        # the body binds tighter than every operator a following binding
+        # would stop at, so the chain can be folded without recursion
+        body = self.parse_expr(_LET_PREC)
+        for var, value in reversed(bindings):
+            body = expr.Let(var, value, body)
+        return body
+
+    def parse_graph(self):
+        """Parse a chain of graph bindings and their body."""
+        start = self.pos
+        kinds = self.kinds
+        while (kinds[self.pos] == "%" and kinds[self.pos + 1] == "NAT"
+               and kinds[self.pos + 2] == "="):
+            graph_nid = int(self.texts[self.pos + 1])
+            self.pos += 3
+            self.enter_var_scope()
+            value = self.parse_expr(0)
+            self.exit_var_scope()
+            self.expect(";")
+            if graph_nid != len(self.graph_expr):
+                raise ParseError(
+                    "expected new graph variable to be `%{}`,".format(len(self.graph_expr)) + \
+                    "but got `%{}`".format(graph_nid))
+            self.graph_expr.append(value)
+        kont = self.parse_expr(_GRAPH_PREC)
+        return self.set_span(kont, start)
+
+    def parse_if(self):
+        """Construct a Relay If node. Creates a new scope for each branch."""
+        start = self.pos
+        self.expect("if")
+        self.expect("(")
+        cond = self.parse_expr(0)
+        self.expect(")")
+        branches = []
+        for keyword in (None, "else"):
+            if keyword:
+                self.expect(keyword)
+            self.enter_var_scope()
+            self.expect("{")
+            branches.append(self.parse_expr(0))
+            self.expect("}")
+            self.exit_var_scope()
+        return self.set_span(expr.If(cond, branches[0], branches[1]), start)
+
+    def parse_match(self):
+        """matchType expr '{' matchClauseList? '}'"""
+        complete_match = self.kinds[self.pos] == "match"
+        self.pos += 1
+        match_data = self.parse_expr(0)
+        self.expect("{")
+        parsed_clauses = []
+        while self.kinds[self.pos] != "}":
+            self.enter_var_scope()
+            pattern = self.parse_pattern()
+            self.expect("=>")
+            if self.accept("{"):
+                clause_body = self.parse_expr(0)
+                self.expect("}")
+            else:
+                clause_body = self.parse_expr(0)
+            self.exit_var_scope()
+            parsed_clauses.append(adt.Clause(pattern, clause_body))
+            if not self.accept(","):
+                break
+        self.expect("}")
+        return adt.Match(match_data, parsed_clauses, complete=complete_match)
+
+    def parse_pattern(self):
+        """Parse a match pattern."""
+        kind = self.kinds[self.pos]
+        if kind == "_":
+            self.pos += 1
+            return adt.PatternWildcard()
+        if kind == "%":
+            self.pos += 1
+            name = "_" if self.accept("_") else self.expect("CNAME")
+            typ = self.parse_type() if self.accept(":") else None
+            return adt.PatternVar(self.mk_var(name, typ=typ))
+        if kind == "CNAME":
+            constructor_name = self.expect("CNAME")
+            if constructor_name not in self.global_type_vars:
+                raise ParseError("unbound constructor `{0}`".format(constructor_name))
+            constructor = self.global_type_vars[constructor_name]
+            patterns = self.parse_pattern_list() if self.kinds[self.pos] == "(" else []
+            return adt.PatternConstructor(constructor, patterns)
+        return adt.PatternTuple(self.parse_pattern_list())
+
+    def parse_pattern_list(self):
+        """patternList: '(' pattern (',' pattern)* ')'"""
+        self.expect("(")
+        patterns = [self.parse_pattern()]
+        while self.accept(","):
+            patterns.append(self.parse_pattern())
+        self.expect(")")
+        return patterns
+
+    def parse_meta(self):
+        """meta : 'meta' '[' CNAME ']' '[' NAT ']'"""
+        self.expect("meta")
+        self.expect("[")
+        type_key = self.expect("CNAME")
+        self.expect("]")
+        self.expect("[")
+        index = int(self.expect("NAT"))
+        self.expect("]")
+        return self.meta[type_key][index]
+
+    # Types
+
+    def parse_type(self):
+        """Parse a typeExpr, the incomplete type is None."""
+        kind = self.kinds[self.pos]
+        if kind == "CNAME":
+            func = self.resolve_ident(self.parse_general_ident_text())
+            if self.kinds[self.pos] != "[":
+                return func
+            self.pos += 1
+            args = [self.parse_type()]
+            while self.accept(","):
+                args.append(self.parse_type())
+            self.expect("]")
+            return ty.TypeCall(func, args)
+        if kind == "Tensor":
+            self.pos += 1
+            self.expect("[")
+            shape = self.parse_shape_list()
+            self.expect(",")
+            dtype = self.parse_type()
+            self.expect("]")
+            if not isinstance(dtype, ty.TensorType):
+                raise ParseError("expected dtype to be a Relay base type.")
+            return ty.TensorType(shape, dtype.dtype)
+        if kind == "(":
+            self.pos += 1
+            if self.accept(")"):
+                return ty.TupleType([])
+            first = self.parse_type()
+            if self.accept(")"):
+                return first
+            self.expect(",")
+            fields = [first]
+            if self.kinds[self.pos] != ")":
+                fields.append(self.parse_type())
+                while self.accept(","):
+                    fields.append(self.parse_type())
+            self.expect(")")
+            return ty.TupleType(fields)
+        if kind == "fn":
+            self.pos += 1
+            if self.kinds[self.pos] == "[":
+                # the type params of function types are not used
+                self.parse_type_param_names()
+            self.expect("(")
+            arg_types = []
+            if self.kinds[self.pos] != ")":
+                arg_types.append(self.parse_type())
+                while self.accept(","):
+                    arg_types.append(self.parse_type())
+            self.expect(")")
+            self.expect("->")
+            ret_type = self.parse_type()
+            return ty.FuncType(arg_types, ret_type, [], None)
+        if kind == "_":
+            self.pos += 1
+            return None
+        return self.error("expected a type but got `{0}`".format(self.texts[self.pos]))
+
+    def parse_shape_list(self):
+        """shapeList: '(' ')' | '(' shape (',' shape)+ ')' | shape"""
+        if self.kinds[self.pos] != "(":
+            return [self.parse_shape()]
+        self.pos += 1
+        if self.accept(")"):
+            return []
+        shape = [self.parse_shape()]
+        while self.accept(","):
+            shape.append(self.parse_shape())
+        self.expect(")")
+        return shape
+
+    def parse_shape(self):
+        """shape: meta | '(' shape ')' | NAT"""
+        kind = self.kinds[self.pos]
+        if kind == "meta":
+            return self.parse_meta()
+        if kind == "(":
+            self.pos += 1
+            shape = self.parse_shape()
+            self.expect(")")
+            return shape
+        return int(self.expect("NAT"))
+
+
+__source_name_counter__ = 0
+
+def fromtext(data, source_name=None):
+    """Parse a Relay program.
+
+    Parameters
+    ----------
+    data : str
+        The Relay text, starting with the version.
+
+    source_name : str or SourceName, optional
+        The source name of the spans.
+
+    Returns
+    -------
+    result : Union[relay.Expr, IRModule]
+        The module of the definitions, or the expression of the program.
+    """
+    if data == "":
+        raise ParseError("cannot parse the empty string.")
+
+    if source_name is None:
+        source_name = "source_file{0}".format(__source_name_counter__)
+
+    if isinstance(source_name, str):
+        source_name = SourceName(source_name)
+
+    return RelayTextParser(data, source_name).parse_prog()
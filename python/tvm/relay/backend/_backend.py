@@ -17,6 +17,7 @@
 """The interface of expr function exposed from C++."""
 import tvm._ffi
 import tvm.driver
+from tvm.ir import profiling
 
 
 @tvm._ffi.register_func("relay.backend.lower")
@@ -46,7 +47,9 @@ def lower(sch, inputs, func_name, source_func):
     import traceback
 
     try:
-        f = tvm.driver.lower(sch, inputs, name=func_name)
+        with profiling.scope(func_name, "lower") as prof_scope:
+            f = tvm.driver.lower(sch, inputs, name=func_name)
+            prof_scope.record(f)
         # logging.debug("lower function %s", func_name)
         # logging.debug("%s", _build.lower(sch, inputs, simple_mode=True))
     except Exception:
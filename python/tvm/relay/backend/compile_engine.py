@@ -22,6 +22,7 @@ import logging
 import numpy as np
 import tvm
 from tvm import te
+from tvm.ir import profiling
 from tvm.runtime import Object
 from ... import target as _target
 from ... import autotvm
@@ -32,6 +33,10 @@ from . import _backend
 
 logger = logging.getLogger('compile_engine')
 
+# implementations picked by select_implementation, see _selection_key
+_SELECTION_CACHE = {}
+_SELECTION_CACHE_SIZE = 4096
+
 
 @tvm._ffi.register_object("relay.LoweredOutput")
 class LoweredOutput(Object):
@@ -143,6 +148,43 @@ def get_valid_implementations(op, attrs, inputs, out_type, target):
     return ret
 
 
+def _selection_key(op, attrs, inputs, out_type, target, use_autotvm):
+    """Get the key identifying an implementation selection.
+
+    Returns None when the selection can not be reused, i.e. when the shapes
+    are symbolic, when AutoTVM is extracting tasks or when a dispatch context
+    in use has a state that is not captured by its version.
+    """
+    env = autotvm.task.TaskExtractEnv.current
+    if env is not None and env.tracing:
+        # task extraction needs the compute of every implementation
+        return None
+    shapes = []
+    for tensor in inputs:
+        if not all(isinstance(dim, tvm.tir.IntImm) for dim in tensor.shape):
+            return None
+        shapes.append((tuple(int(dim) for dim in tensor.shape), tensor.dtype))
+    versions = ()
+    if use_autotvm:
+        ctx = autotvm.task.DispatchContext.current
+        while ctx is not None:
+            if not ctx.cacheable:
+                return None
+            versions += (ctx.version,)
+            ctx = ctx._old_ctx
+    # the strategy function itself is part of the key so that overriding
+    # it, e.g. with TempOpAttr, does not reuse stale selections
+    return (op.name, op.get_attr("FTVMStrategy"),
+            tvm.ir.structural_hash(attrs) if attrs is not None else 0,
+            tuple(shapes), tvm.ir.structural_hash(out_type),
+            str(target), use_autotvm, versions)
+
+
+def clear_selection_cache():
+    """Clear the implementations memoized by select_implementation."""
+    _SELECTION_CACHE.clear()
+
+
 def select_implementation(op, attrs, inputs, out_type, target, use_autotvm=True):
     """Select the best implementation from the op strategy.
 
@@ -155,6 +197,10 @@ def select_implementation(op, attrs, inputs, out_type, target, use_autotvm=True)
 
     Note that this function doesn't support op with symbolic input shapes.
 
+    The selection is memoized for calls with the same op, attributes, input
+    shapes and dtypes, target and AutoTVM dispatch context versions, so that
+    repeated layers only compute the outputs of the selected implementation.
+
     Parameters
     ----------
     op : relay.op.Op
@@ -180,6 +226,20 @@ def select_implementation(op, attrs, inputs, out_type, target, use_autotvm=True)
     ret : tuple(relay.op.OpImplementation, List[tvm.te.Tensor])
         The best op implementation and the corresponding output tensors.
     """
+    key = _selection_key(op, attrs, inputs, out_type, target, use_autotvm)
+    if key is not None and key in _SELECTION_CACHE:
+        impl = _SELECTION_CACHE[key]
+        return impl, impl.compute(attrs, inputs, out_type)
+
+    best_impl, outs = _select_implementation(op, attrs, inputs, out_type, target, use_autotvm)
+    if key is not None:
+        if len(_SELECTION_CACHE) >= _SELECTION_CACHE_SIZE:
+            _SELECTION_CACHE.clear()
+        _SELECTION_CACHE[key] = best_impl
+    return best_impl, outs
+
+
+def _select_implementation(op, attrs, inputs, out_type, target, use_autotvm):
     all_impls = get_valid_implementations(op, attrs, inputs, out_type, target)
 
     best_plevel_impl = None
@@ -245,15 +305,16 @@ def lower_call(call, inputs, target):
             env.tracing = False
             reenable_tracing = True
 
-    if not is_dyn:
-        best_impl, outputs = select_implementation(
-            op, call.attrs, inputs, ret_type, target)
-        logger.info("Use implementation %s for op %s", best_impl.name, op.name)
-    else:
-        # TODO(@icemelon9): Allow tvm to generate multiple kernels for dynamic shapes.
-        #   Currently, we just use the implementation with highest plevel
-        best_impl, outputs = select_implementation(
-            op, call.attrs, inputs, ret_type, target, use_autotvm=False)
+    with profiling.scope(op.name, "strategy"):
+        if not is_dyn:
+            best_impl, outputs = select_implementation(
+                op, call.attrs, inputs, ret_type, target)
+            logger.info("Use implementation %s for op %s", best_impl.name, op.name)
+        else:
+            # TODO(@icemelon9): Allow tvm to generate multiple kernels for dynamic shapes.
+            #   Currently, we just use the implementation with highest plevel
+            best_impl, outputs = select_implementation(
+                op, call.attrs, inputs, ret_type, target, use_autotvm=False)
 
     # re-enable AutoTVM tracing
     if reenable_tracing:
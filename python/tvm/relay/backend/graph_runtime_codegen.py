@@ -49,6 +49,7 @@ class GraphRuntimeCodegen(object):
         self._list_params_name = self._mod["list_params_name"]
         self._get_param_by_name = self._mod["get_param_by_name"]
         self._get_irmodule = self._mod["get_irmodule"]
+        self._get_external_modules = self._mod["get_external_modules"]
         self._setup(mod, target)
 
     def _setup(self, mod, target):
@@ -90,3 +91,13 @@ class GraphRuntimeCodegen(object):
             arr.copyto(param)
             params[key] = param
         return graph_json, lowered_func, params
+
+    def get_external_modules(self):
+        """Get the runtime modules generated by external codegen.
+
+        Returns
+        -------
+        ext_mods : List[tvm.runtime.Module]
+            The modules to be imported into the built module.
+        """
+        return list(self._get_external_modules())
@@ -0,0 +1,260 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Incremental build of Relay models.
+
+Rebuilding a model after a small edit only generates code for the fused
+functions that changed. Every lowered primitive function is fingerprinted
+and compiled on its own into an object file named after the fingerprint.
+The functions are renamed after their fingerprints as well, so a function
+keeps its object file when the numbering of the fused functions shifts.
+The object files of a build are then linked into a shared library.
+
+Lowering is not repeated for unchanged functions either, since the compile
+engine keeps the lowered functions of the process.
+
+.. code-block:: python
+
+    builder = relay.backend.incremental_build.IncrementalBuilder("/tmp/objects")
+    graph, lib, params = builder.build(mod, "llvm", params=params)
+    # edit mod
+    graph, lib, params = builder.build(mod, "llvm", params=params)
+    print(builder.stats)
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import tvm
+from tvm.ir import IRModule
+from tvm.contrib import cc as _cc, util as _util
+from tvm.runtime import packed_func as _packed_func
+from ... import target as _target, autotvm
+from .. import build_module as _build_module
+from . import graph_runtime_codegen as _graph_gen
+
+logger = logging.getLogger('relay')
+
+
+def _is_linkable(target, target_host=None):
+    """Whether functions built for the target can be linked from object files."""
+    target = _target.create(target)
+    if target.target_name != "llvm":
+        return False
+    return target_host is None or _target.create(target_host).target_name == "llvm"
+
+
+def _fingerprint(func, target, target_host):
+    """Compute the name independent fingerprint of a lowered function.
+
+    Returns
+    -------
+    symbol : str
+        The global symbol of the function after renaming.
+
+    digest : str
+        The hex digest of the function, target and build configuration.
+    """
+    # drop the numbering that the compile engine appends to make names unique
+    base = re.sub(r"_\d+$", "", str(func.attrs["global_symbol"]))
+    build_cfg = _target.BuildConfig.current()
+    # pylint: disable=protected-access
+    cfg = ["%s=%s" % (name, getattr(build_cfg, name))
+           for name in sorted(_target.BuildConfig._object_defaults)]
+    payload = "|".join([tvm.__version__, base, str(target), str(target_host)] + cfg +
+                       [tvm.ir.save_json(func.with_attr("global_symbol", base))])
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    return "%s_%s" % (base, digest[:16]), digest
+
+
+def _rename_graph_funcs(graph_json, renames):
+    graph = json.loads(graph_json)
+    for node in graph["nodes"]:
+        if node["op"] == "tvm_op" and node["attrs"]["func_name"] in renames:
+            node["attrs"]["func_name"] = renames[node["attrs"]["func_name"]]
+    return json.dumps(graph, indent=2)
+
+
+class IncrementalBuilder(object):
+    """Build Relay models, reusing the object code of unchanged fused functions.
+
+    Functions of llvm targets are built one per object file, other targets
+    are built as usual and imported into the linked library. The returned
+    module is loaded from the linked library at lib_path, so it is deployed
+    by copying that file rather than by export_library.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        The directory of the object files. They are shared with later
+        builders on the same directory. Defaults to a temporary directory
+        that lives as long as the builder.
+
+    n_parallel : int, optional
+        The number of changed functions compiled concurrently.
+
+    Attributes
+    ----------
+    stats : list of dict
+        The time in seconds of each stage, and the number of reused and
+        compiled functions, for every build.
+    """
+    def __init__(self, cache_dir=None, n_parallel=1):
+        if cache_dir is None:
+            self._temp = _util.tempdir()
+            cache_dir = self._temp.temp_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.n_parallel = n_parallel
+        self.lib_path = None
+        self.stats = []
+        self._num_builds = 0
+
+    def _object(self, digest):
+        return os.path.join(self.cache_dir, digest + ".o")
+
+    def _compile(self, units, target_host):
+        pass_ctx = tvm.transform.PassContext.current()
+        build_cfg = _target.BuildConfig.current()
+        build_cache = tvm.driver.BuildCache.current() or autotvm.util.EmptyContext()
+        def _compile_unit(unit):
+            digest, inputs = unit
+            # Scopes are thread local, enter them again in the worker.
+            with pass_ctx, build_cfg, build_cache, _packed_func.ReleaseGIL():
+                rt_mod = tvm.build(inputs, target_host=target_host)
+            # write to a temporary file first so that concurrent
+            # builders never link a partial object
+            tmp_path = "%s.%d.tmp.o" % (self._object(digest), os.getpid())
+            rt_mod.save(tmp_path)
+            os.replace(tmp_path, self._object(digest))
+
+        with ThreadPoolExecutor(max_workers=max(self.n_parallel, 1)) as pool:
+            list(pool.map(_compile_unit, units))
+
+    def build(self, mod, target=None, target_host=None, params=None):
+        """Build a Relay module to run on TVM graph runtime.
+
+        Parameters
+        ----------
+        mod : :py:class:`~tvm.IRModule`
+            The IR module to build.
+
+        target : str, :any:`tvm.target.Target`, or dict of str(i.e. device/context
+        name) to str/tvm.target.Target, optional
+            For heterogeneous compilation, it is a dictionary indicating context to
+            target mapping. For homogeneous compilation, it is a build target.
+
+        target_host : str or :any:`tvm.target.Target`, optional
+            Host compilation target, if target is device.
+
+        params : dict of str to NDArray
+            Input parameters to the graph that do not change
+            during inference time. Used for constant folding.
+
+        Returns
+        -------
+        graph_json : str
+            The json string that can be accepted by graph runtime.
+
+        mod : tvm.Module
+            The module containing necessary libraries.
+
+        params : dict
+            The parameters of the final graph.
+        """
+        if not isinstance(mod, IRModule):
+            raise ValueError("Type of input parameter mod must be tvm.IRModule")
+        tgts = _build_module._update_target(target)
+        if isinstance(target_host, (str, _target.Target)):
+            target_host = _target.create(target_host)
+        elif target_host:
+            raise ValueError("target host must be the type of str, " +
+                             "tvm.target.Target, or None")
+
+        # If current dispatch context is fallback context (the default root context),
+        # then load pre-tuned parameters from TopHub
+        if isinstance(autotvm.DispatchContext.current, autotvm.FallbackContext):
+            tophub_context = autotvm.tophub.context(list(tgts.values()))
+        else:
+            tophub_context = autotvm.util.EmptyContext()
+
+        stats = {}
+        start = time.time()
+        with tophub_context:
+            opt_mod, _ = _build_module.BuildModule().optimize(mod, tgts, params)
+            stats["optimize"] = time.time() - start
+
+            start = time.time()
+            graph_gen = _graph_gen.GraphRuntimeCodegen(None, tgts)
+            graph_json, lowered_funcs, opt_params = graph_gen.codegen(opt_mod["main"])
+            stats["lower"] = time.time() - start
+
+        start = time.time()
+        renames = {}
+        objects = {}
+        units = []
+        remaining = {}
+        for tgt, funcs in lowered_funcs.items():
+            if not _is_linkable(tgt, target_host):
+                remaining[tgt] = funcs
+                continue
+            for gvar, func in funcs.functions.items():
+                symbol, digest = _fingerprint(func, tgt, target_host)
+                renames[gvar.name_hint] = symbol
+                if digest in objects:
+                    continue
+                objects[digest] = self._object(digest)
+                if not os.path.isfile(objects[digest]):
+                    func = func.with_attr("global_symbol", symbol)
+                    units.append((digest, {tgt: IRModule({symbol: func})}))
+        self._compile(units, target_host)
+        stats["reused"] = len(objects) - len(units)
+        stats["compiled"] = len(units)
+        stats["codegen"] = time.time() - start
+
+        start = time.time()
+        if objects:
+            # link a new library per build, a loaded library can not be overwritten
+            old_lib_path = self.lib_path
+            self.lib_path = os.path.join(self.cache_dir, "lib%d_%d.so" % (os.getpid(),
+                                                                          self._num_builds))
+            self._num_builds += 1
+            _cc.create_shared(self.lib_path, sorted(objects.values()))
+            rt_mod = tvm.runtime.load_module(self.lib_path)
+            if old_lib_path is not None and os.path.exists(old_lib_path):
+                # modules loaded from it stay valid
+                os.remove(old_lib_path)
+            if remaining:
+                rt_mod.import_module(tvm.build(remaining, target_host=target_host))
+        elif remaining:
+            rt_mod = tvm.build(remaining, target_host=target_host)
+        else:
+            # nothing to link, leave the empty module to the default build
+            return _build_module.build(mod, target, target_host, params)
+        for ext_mod in graph_gen.get_external_modules():
+            rt_mod.import_module(ext_mod)
+        stats["link"] = time.time() - start
+
+        self.stats.append(stats)
+        logger.info("Incremental build: optimize %.2f s, lower %.2f s, codegen %.2f s "
+                    "(%d compiled, %d reused), link %.2f s",
+                    stats["optimize"], stats["lower"], stats["codegen"],
+                    stats["compiled"], stats["reused"], stats["link"])
+        return _rename_graph_funcs(graph_json, renames), rt_mod, opt_params
@@ -0,0 +1,312 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Persistent on-disk cache of compiled fused functions.
+
+The cache stores the optimized LLVM bitcode of every lowered primitive
+function, keyed by the structural hash of the function, the target and
+the build configuration. The function is stored next to the bitcode, so
+that a hit is confirmed by structural equality rather than trusting the
+64-bit hash alone. Since the lowered function already carries the
+schedule picked by the applied autotvm config, a different config gives a
+different key. Entries are shared between relay.build calls and processes
+and are evicted in least recently used order once the cache grows past
+its size limit.
+
+.. code-block:: python
+
+    with relay.backend.kernel_cache.KernelCache("/tmp/kernels") as cache:
+        graph, lib, params = relay.build(mod, "llvm", params=params)
+    print(cache.stats())
+"""
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+
+import tvm
+from tvm.ir import IRModule
+from ... import target as _target
+
+logger = logging.getLogger('relay')
+
+# environment variable to override the default cache location
+KERNEL_CACHE_DIR_ENV_VAR = "TVM_KERNEL_CACHE_DIR"
+
+KERNEL_CACHE_ROOT_PATH = os.path.join(os.path.expanduser('~'), ".tvm", "kernel_cache")
+
+_ENTRY_SUFFIX = ".bc"
+_FUNC_SUFFIX = ".json"
+
+
+def _write_text(path, text):
+    with open(path, "w") as out_file:
+        out_file.write(text)
+
+
+class KernelCache(object):
+    """On-disk cache of compiled fused functions.
+
+    Entering the cache makes it the current one, relay.build then only
+    generates code for the functions that are not found in it.
+
+    Parameters
+    ----------
+    cache_dir : str, optional
+        The directory holding the entries. Defaults to the value of
+        the TVM_KERNEL_CACHE_DIR environment variable, or ~/.tvm/kernel_cache.
+
+    max_size : int, optional
+        The maximum total size of the entries in bytes.
+    """
+    current = None
+
+    def __init__(self, cache_dir=None, max_size=1 << 30):
+        if cache_dir is None:
+            cache_dir = os.environ.get(KERNEL_CACHE_DIR_ENV_VAR, KERNEL_CACHE_ROOT_PATH)
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._old_cache = None
+
+    def __enter__(self):
+        self._old_cache = KernelCache.current
+        KernelCache.current = self
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        KernelCache.current = self._old_cache
+
+    @staticmethod
+    def is_cacheable(target, target_host=None):
+        """Whether functions built for the target can be cached."""
+        target = _target.create(target)
+        if target.target_name != "llvm":
+            return False
+        return target_host is None or _target.create(target_host).target_name == "llvm"
+
+    @staticmethod
+    def key(func, target, target_host=None):
+        """Compute the cache key of a lowered function.
+
+        Parameters
+        ----------
+        func : tvm.tir.PrimFunc
+            The lowered function.
+
+        target : str or tvm.target.Target
+            The target the function is built for.
+
+        target_host : str or tvm.target.Target, optional
+            The host target.
+
+        Returns
+        -------
+        key : str
+            The hex digest identifying the compiled function.
+        """
+        build_cfg = _target.BuildConfig.current()
+        cfg = ["%s=%s" % (name, getattr(build_cfg, name))
+               for name in sorted(_target.BuildConfig._object_defaults)]
+        payload = "|".join([tvm.__version__,
+                            "%x" % tvm.ir.structural_hash(func),
+                            str(target),
+                            str(target_host)] + cfg)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + _ENTRY_SUFFIX)
+
+    def _func_path(self, key):
+        return os.path.join(self.cache_dir, key + _FUNC_SUFFIX)
+
+    def _remove(self, path):
+        for entry_path in [path, path[:-len(_ENTRY_SUFFIX)] + _FUNC_SUFFIX]:
+            try:
+                os.remove(entry_path)
+            except FileNotFoundError:
+                # removed by another process
+                pass
+
+    def load(self, key, input_mod):
+        """Load the module of a cache entry.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        input_mod : IRModule
+            The lowered function the entry must have been built from.
+
+        Returns
+        -------
+        mod : tvm.runtime.Module or None
+            The compiled module, or None on a miss.
+        """
+        path = self._path(key)
+        mod = None
+        if os.path.isfile(path):
+            try:
+                with open(self._func_path(key)) as func_file:
+                    cached_mod = tvm.ir.load_json(func_file.read())
+                if tvm.ir.structural_equal(cached_mod, input_mod):
+                    # refresh the access time used for eviction
+                    os.utime(path)
+                    mod = tvm.runtime.load_module(path)
+                else:
+                    logger.warning("Kernel cache key collision on %s", key)
+            except (OSError, tvm.TVMError) as err:
+                logger.warning("Failed to load kernel cache entry %s: %s", path, err)
+                mod = None
+        with self._lock:
+            if mod is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return mod
+
+    def _write(self, path, suffix, write):
+        # write to a temporary file first so that concurrent
+        # readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(suffix=suffix, dir=self.cache_dir)
+        os.close(fd)
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def save(self, key, mod, input_mod):
+        """Store a compiled module in the cache.
+
+        Only llvm modules without imports can be stored, other modules
+        are ignored.
+
+        Parameters
+        ----------
+        key : str
+            The cache key.
+
+        mod : tvm.runtime.Module
+            The compiled module.
+
+        input_mod : IRModule
+            The lowered function the module was built from.
+        """
+        if mod.type_key != "llvm" or mod.imported_modules:
+            return
+        # the function goes first, as the bitcode marks the entry as present
+        self._write(self._func_path(key), _FUNC_SUFFIX,
+                    lambda path: _write_text(path, tvm.ir.save_json(input_mod)))
+        self._write(self._path(key), _ENTRY_SUFFIX, mod.save)
+        self._evict()
+
+    def lookup(self, lowered_funcs, target_host=None):
+        """Split the lowered functions of relay.build into cached and missing ones.
+
+        Parameters
+        ----------
+        lowered_funcs : Dict[str, IRModule]
+            The lowered functions per target.
+
+        target_host : str or tvm.target.Target, optional
+            The host target.
+
+        Returns
+        -------
+        cached_mods : List[tvm.runtime.Module]
+            The modules of the functions found in the cache.
+
+        missing : List[Tuple[str, Dict[str, IRModule]]]
+            The cache key and build input of each missing function, every
+            function is built on its own so that it can be stored.
+
+        remaining : Dict[str, IRModule]
+            The functions of targets that can not be cached.
+        """
+        cached_mods = []
+        missing = []
+        remaining = {}
+        for tgt, funcs in lowered_funcs.items():
+            if not self.is_cacheable(tgt, target_host):
+                remaining[tgt] = funcs
+                continue
+            for gvar, func in funcs.functions.items():
+                key = self.key(func, tgt, target_host)
+                input_mod = IRModule({gvar: func})
+                mod = self.load(key, input_mod)
+                if mod is not None:
+                    cached_mods.append(mod)
+                else:
+                    missing.append((key, {tgt: input_mod}))
+        return cached_mods, missing, remaining
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(_ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                # removed by another process
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def _evict(self):
+        entries = sorted(self._entries())
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total_size <= self.max_size:
+                break
+            self._remove(path)
+            total_size -= size
+            with self._lock:
+                self.evictions += 1
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        for _, _, path in self._entries():
+            self._remove(path)
+
+    def stats(self):
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        stats : dict
+            The hit and miss counts and hit rate of this cache object,
+            and the number and total size of the entries on disk.
+        """
+        entries = self._entries()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": float(self.hits) / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": len(entries),
+            "size": sum(size for _, size, _ in entries),
+        }
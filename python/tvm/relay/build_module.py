@@ -19,18 +19,23 @@ Construct the necessary state for the TVM graph runtime
 from a Relay expression.
 """
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 
-from tvm.ir import IRModule
+import tvm
+from tvm.ir import IRModule, profiling
 
 from tvm.tir import expr as tvm_expr
 from .. import nd as _nd, target as _target, autotvm
 from ..contrib import graph_runtime as _graph_rt
+from ..runtime import packed_func as _packed_func
 from . import _build_module
 from . import ty as _ty
 from . import expr as _expr
 from . import function as _function
 from .backend import interpreter as _interpreter
+from .backend import graph_runtime_codegen as _graph_gen
+from .backend import kernel_cache as _kernel_cache
 from .backend.vm import VMExecutor
 
 def _update_target(target):
@@ -125,6 +130,92 @@ class BuildModule(object):
 
         return graph_json, mod, params
 
+    def build_parallel(self, mod, target, target_host=None, params=None, n_parallel=2):
+        """Build like :py:meth:`build`, but generate code of the lowered
+        functions concurrently.
+
+        The primitive functions are lowered in order by the compile engine,
+        then split into n_parallel groups. Each group is built into its own
+        runtime module in a separate thread, and the modules are linked
+        together by importing them into the first one.
+
+        When a :py:class:`~tvm.relay.backend.kernel_cache.KernelCache` is
+        active, the functions found in it are loaded instead, and the missing
+        ones are built one per module and stored in the cache.
+
+        When there is nothing to split, the lowered functions are built
+        serially in one module, without optimizing the module again.
+
+        Parameters
+        ----------
+        mod : :py:class:`~tvm.IRModule`
+            The IRModule to build.
+
+        target : dict of IntImm to tvm.target.Target
+            The targets, as returned by _update_target.
+
+        target_host : str or :any:`tvm.target.Target`, optional
+            Host compilation target.
+
+        params : dict of str to NDArray
+            Input parameters to the graph.
+
+        n_parallel : int
+            The number of functions groups built concurrently.
+
+        Returns
+        -------
+        graph_json : str
+            The json string that can be accepted by graph runtime.
+
+        mod : tvm.Module
+            The module containing necessary libraries.
+
+        params : dict
+            The parameters of the final graph.
+        """
+        with profiling.scope("optimize", "build"):
+            opt_mod, _ = self.optimize(mod, target, params)
+        with profiling.scope("graph_codegen", "build"):
+            graph_gen = _graph_gen.GraphRuntimeCodegen(None, target)
+            graph_json, lowered_funcs, opt_params = graph_gen.codegen(opt_mod["main"])
+
+        cache = _kernel_cache.KernelCache.current
+        cached_mods = []
+        units = []
+        if cache is not None:
+            cached_mods, units, lowered_funcs = cache.lookup(lowered_funcs, target_host)
+        if lowered_funcs:
+            chunks = _split_lowered_funcs(lowered_funcs, n_parallel)
+            units += [(None, chunk) for chunk in chunks or [lowered_funcs]]
+
+        pass_ctx = tvm.transform.PassContext.current()
+        build_cfg = _target.BuildConfig.current()
+        build_cache = tvm.driver.BuildCache.current() or autotvm.util.EmptyContext()
+        def _build_unit(unit):
+            key, chunk = unit
+            # Scopes are thread local, enter them again in the worker.
+            with pass_ctx, build_cfg, build_cache, _packed_func.ReleaseGIL():
+                rt_mod = tvm.build(chunk, target_host=target_host)
+            if key is not None:
+                # a cached unit holds the single function of the entry
+                cache.save(key, rt_mod, next(iter(chunk.values())))
+            return rt_mod
+
+        if not units and not cached_mods:
+            rt_mods = [_empty_module(target, target_host)]
+        elif len(units) == 1:
+            rt_mods = [_build_unit(units[0])] + cached_mods
+        else:
+            with ThreadPoolExecutor(max_workers=max(n_parallel, 1)) as pool:
+                rt_mods = list(pool.map(_build_unit, units)) + cached_mods
+        rt_mod = rt_mods[0]
+        for other in rt_mods[1:]:
+            rt_mod.import_module(other)
+        for ext_mod in graph_gen.get_external_modules():
+            rt_mod.import_module(ext_mod)
+        return graph_json, rt_mod, opt_params
+
     def optimize(self, mod, target=None, params=None):
         """
         Parameters
@@ -181,7 +272,51 @@ class BuildModule(object):
         return ret
 
 
-def build(mod, target=None, target_host=None, params=None):
+def _empty_module(target, target_host):
+    """Create the module of a graph without lowered functions, as the
+    default build does."""
+    if not target_host:
+        for dev_type, tgt in target.items():
+            if dev_type.value == _nd.cpu(0).device_type:
+                target_host = tgt
+                break
+    llvm_create = tvm._ffi.get_global_func("codegen.LLVMModuleCreate", allow_missing=True)
+    if not target_host:
+        target_host = "llvm" if llvm_create is not None else "stackvm"
+    target_host = _target.create(target_host)
+    if target_host.target_name == "llvm":
+        return llvm_create(str(target_host), "empty_module")
+    # the code is not empty so that saving the module does not complain
+    return tvm._ffi.get_global_func("runtime.CSourceModuleCreate")(";", "")
+
+
+def _split_lowered_funcs(lowered_funcs, n_parallel):
+    """Split the lowered functions into groups built independently.
+
+    Every group gets at least two functions of each target, so that no
+    group is built as a single entry function.
+
+    Returns
+    -------
+    chunks : List[Dict[str, IRModule]]
+        The groups, or an empty list if there is no gain in splitting.
+    """
+    n_chunks = n_parallel
+    for tgt, funcs in lowered_funcs.items():
+        if _target.create(tgt).device_name == "vta":
+            return []
+        n_chunks = min(n_chunks, len(funcs.functions) // 2)
+    if n_chunks < 2:
+        return []
+    chunks = [{} for _ in range(n_chunks)]
+    for tgt, funcs in lowered_funcs.items():
+        items = sorted(funcs.functions.items(), key=lambda kv: kv[0].name_hint)
+        for i, (gvar, func) in enumerate(items):
+            chunks[i % n_chunks].setdefault(tgt, {})[gvar] = func
+    return [{tgt: IRModule(funcs) for tgt, funcs in chunk.items()} for chunk in chunks]
+
+
+def build(mod, target=None, target_host=None, params=None, n_parallel=1):
     """Helper function that builds a Relay function to run on TVM graph
     runtime.
 
@@ -208,6 +343,13 @@ def build(mod, target=None, target_host=None, params=None):
         Input parameters to the graph that do not change
         during inference time. Used for constant folding.
 
+    n_parallel : int, optional
+        The number of threads used to generate code of the lowered functions.
+        With n_parallel > 1 the functions are built into several modules
+        that are imported into the returned one.
+        The functions are also built separately when a
+        :py:class:`~tvm.relay.backend.kernel_cache.KernelCache` is active.
+
     Returns
     -------
     graph_json : str
@@ -246,9 +388,14 @@ def build(mod, target=None, target_host=None, params=None):
     else:
         tophub_context = autotvm.util.EmptyContext()
 
-    with tophub_context:
+    with tophub_context, profiling.scope("relay.build", "build"):
         bld_mod = BuildModule()
-        graph_json, mod, params = bld_mod.build(mod, target, target_host, params)
+        if n_parallel > 1 or _kernel_cache.KernelCache.current is not None \
+                or profiling.CompileProfiler.current is not None:
+            graph_json, mod, params = bld_mod.build_parallel(
+                mod, target, target_host, params, n_parallel)
+        else:
+            graph_json, mod, params = bld_mod.build(mod, target, target_host, params)
     return graph_json, mod, params
 
 
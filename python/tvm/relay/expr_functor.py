@@ -24,59 +24,114 @@ from .expr import RefCreate, RefRead, RefWrite
 from .adt import Constructor, Match, Clause
 from .op import Op
 
+# the visit method of each expression type
+_VISIT_METHODS = {
+    Function: "visit_function",
+    Call: "visit_call",
+    Let: "visit_let",
+    Var: "visit_var",
+    GlobalVar: "visit_global_var",
+    If: "visit_if",
+    Tuple: "visit_tuple",
+    TupleGetItem: "visit_tuple_getitem",
+    Constant: "visit_constant",
+    Op: "visit_op",
+    RefCreate: "visit_ref_create",
+    RefRead: "visit_ref_read",
+    RefWrite: "visit_ref_write",
+    Constructor: "visit_constructor",
+    Match: "visit_match",
+}
+
+
+def _no_operands(_):
+    return ()
+
+
+# the operands visited by ExprVisitor, in order
+_OPERANDS = {
+    Function: lambda f: [f.body],
+    Call: lambda c: [c.op] + list(c.args),
+    Let: lambda l: [l.var, l.value, l.body],
+    If: lambda i: [i.cond, i.true_branch, i.false_branch],
+    Tuple: lambda t: list(t.fields),
+    TupleGetItem: lambda t: [t.tuple_value],
+    RefCreate: lambda r: [r.value],
+    RefRead: lambda r: [r.ref],
+    RefWrite: lambda r: [r.ref, r.value],
+    Match: lambda m: [m.data] + [c.rhs for c in m.clauses],
+    Var: _no_operands,
+    GlobalVar: _no_operands,
+    Constant: _no_operands,
+    Op: _no_operands,
+    Constructor: _no_operands,
+}
+
+
+def _lookup(table, cls, default=None):
+    """Find the entry of the closest base class and remember it for cls."""
+    for base in cls.__mro__:
+        if base in table:
+            table[cls] = table[base]
+            return table[base]
+    return default
+
+
 class ExprFunctor:
     """
     An abstract visitor defined over Expr.
 
     Defines the default dispatch over expressions, and
     implements memoization.
+
+    Subclasses can set iterative to True when their visit methods only
+    visit the operands of the expression, as ExprVisitor and ExprMutator
+    do. The operands are then visited before the expression with an
+    explicit stack, in the same order, so that deep graphs do not exceed
+    the recursion limit.
     """
+    iterative = False
+    _expanding = False
+
     def __init__(self):
         self.memo_map = {}
 
-    # pylint: disable=no-else-return
     def visit(self, expr):
         """Apply the visitor to an expression."""
         if expr in self.memo_map:
             return self.memo_map[expr]
+        if self.iterative and not self._expanding:
+            return self._visit_iterative(expr)
 
-        if isinstance(expr, Function):
-            res = self.visit_function(expr)
-        elif isinstance(expr, Call):
-            res = self.visit_call(expr)
-        elif isinstance(expr, Let):
-            res = self.visit_let(expr)
-        elif isinstance(expr, Var):
-            res = self.visit_var(expr)
-        elif isinstance(expr, GlobalVar):
-            res = self.visit_global_var(expr)
-        elif isinstance(expr, If):
-            res = self.visit_if(expr)
-        elif isinstance(expr, Tuple):
-            res = self.visit_tuple(expr)
-        elif isinstance(expr, TupleGetItem):
-            res = self.visit_tuple_getitem(expr)
-        elif isinstance(expr, Constant):
-            res = self.visit_constant(expr)
-        elif isinstance(expr, Op):
-            res = self.visit_op(expr)
-        elif isinstance(expr, RefCreate):
-            res = self.visit_ref_create(expr)
-        elif isinstance(expr, RefRead):
-            res = self.visit_ref_read(expr)
-        elif isinstance(expr, RefWrite):
-            res = self.visit_ref_write(expr)
-        elif isinstance(expr, Constructor):
-            res = self.visit_constructor(expr)
-        elif isinstance(expr, Match):
-            res = self.visit_match(expr)
-        else:
+        method = _VISIT_METHODS.get(type(expr)) or _lookup(_VISIT_METHODS, type(expr))
+        if method is None:
             raise Exception("warning unhandled case: {0}".format(type(expr)))
+        res = getattr(self, method)(expr)
 
         self.memo_map[expr] = res
 
         return res
 
+    def _visit_iterative(self, expr):
+        """Visit the operands in post order, so that each visit method
+        finds the operands memoized and returns without recursion."""
+        self._expanding = True
+        try:
+            stack = [(expr, False)]
+            while stack:
+                node, ready = stack.pop()
+                if ready:
+                    res = self.visit(node)
+                elif node not in self.memo_map:
+                    stack.append((node, True))
+                    operands = _OPERANDS.get(type(node)) or \
+                        _lookup(_OPERANDS, type(node), _no_operands)
+                    stack.extend((x, False) for x in reversed(operands(node)))
+        finally:
+            self._expanding = False
+        # the last visit is the one of expr
+        return res
+
     def visit_function(self, _):
         raise NotImplementedError()
 
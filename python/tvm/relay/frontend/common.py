@@ -21,11 +21,12 @@ import logging
 import numpy as np
 
 import tvm
-from tvm.ir import IRModule
+from tvm.ir import IRModule, TensorType, TupleType
 from topi.util import get_const_tuple
 
 from .. import expr as _expr
 from .. import function as _function
+from ..expr_functor import ExprMutator
 from .. import transform as _transform
 from .. import op as _op
 from .. import analysis
@@ -454,8 +455,137 @@ def get_name(node):
     return name
 
 
-def infer_type(node, mod=None):
-    """A method to infer the type of an intermediate node in the relay graph."""
+def _is_concrete_type(ty):
+    """Whether a type can be reused to annotate a variable."""
+    if isinstance(ty, TensorType):
+        return True
+    if isinstance(ty, TupleType):
+        return all(_is_concrete_type(field) for field in ty.fields)
+    return False
+
+
+class _TypedSubexprReplacer(ExprMutator):
+    """Replace the sub-expressions whose type is already known by
+    variables annotated with that type, so that type inference only
+    needs to visit the newly created part of the graph."""
+    def __init__(self, typed_exprs):
+        super().__init__()
+        self._typed_exprs = typed_exprs
+        self._counter = 0
+
+    def visit(self, expr):
+        if expr in self.memo_map:
+            return self.memo_map[expr]
+        if isinstance(expr, (_expr.Call, _expr.Tuple, _expr.TupleGetItem)) \
+                and expr in self._typed_exprs:
+            ty = self._typed_exprs[expr].checked_type
+            if _is_concrete_type(ty):
+                ret = _expr.var("_typed_%d" % self._counter, type_annotation=ty)
+                self._counter += 1
+                self.memo_map[expr] = ret
+                return ret
+        return super().visit(expr)
+
+
+class InferenceContext(object):
+    """Context that caches the results of :py:func:`infer_type` and
+    :py:func:`infer_value` while a frontend converts a model.
+
+    Type inference is incremental: the sub-expressions that have been
+    inferred before are replaced by typed variables, so each call only
+    runs InferType over the nodes created since. Constant evaluation is
+    memoized by the structural hash of the evaluated function and the
+    identity of the parameters it reads.
+
+    Examples
+    --------
+    .. code-block:: python
+
+        with InferenceContext():
+            # repeated calls on the growing graph reuse earlier results
+            shape = infer_shape(node)
+    """
+    current = None
+
+    def __init__(self):
+        self._typed_exprs = {}
+        self._values = {}
+        self._old_ctx = None
+
+    def infer_type(self, node, mod=None):
+        """Incrementally infer the type of a node.
+
+        Parameters
+        ----------
+        node : relay.Expr
+            The expression to be inferred.
+
+        mod : Optional[IRModule]
+            The module holding the global definitions used by node.
+
+        Returns
+        -------
+        ret : relay.Expr
+            An expression whose checked_type is the type of node.
+        """
+        if node in self._typed_exprs:
+            return self._typed_exprs[node]
+        if isinstance(node, _function.Function):
+            return _infer_type(node, mod)
+        body = _TypedSubexprReplacer(self._typed_exprs).visit(node)
+        func = _function.Function(analysis.free_vars(body), body)
+        if isinstance(mod, IRModule):
+            mod["main"] = func
+            new_mod = _transform.InferType()(mod)
+        else:
+            new_mod = IRModule.from_expr(func)
+        ret = new_mod["main"].body
+        self._typed_exprs[node] = ret
+        return ret
+
+    def infer_value(self, input_val, params, mod=None):
+        """Evaluate an expression, reusing the result of a structurally
+        equal expression evaluated with the same parameters before.
+
+        Parameters
+        ----------
+        input_val : relay.Expr
+            The expression to be evaluated.
+
+        params : dict of str to NDArray
+            The values of the free variables of input_val.
+
+        mod : Optional[IRModule]
+            The module holding the global definitions used by input_val.
+
+        Returns
+        -------
+        ret : NDArray or Object
+            The evaluation result.
+        """
+        free_vars = analysis.free_vars(input_val)
+        func = _function.Function(free_vars, input_val)
+        inputs = tuple(params[var.name_hint] for var in free_vars)
+        key = (tvm.ir.structural_hash(func), tuple(id(x) for x in inputs))
+        for cached_func, cached_inputs, value in self._values.get(key, []):
+            if all(x is y for x, y in zip(inputs, cached_inputs)) and \
+                    tvm.ir.structural_equal(func, cached_func):
+                return value
+        value = _evaluate_with_interpreter(func, inputs, mod)
+        # inputs are kept alive so that their ids cannot be reused.
+        self._values.setdefault(key, []).append((func, inputs, value))
+        return value
+
+    def __enter__(self):
+        self._old_ctx = InferenceContext.current
+        InferenceContext.current = self
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        InferenceContext.current = self._old_ctx
+
+
+def _infer_type(node, mod=None):
     if isinstance(mod, IRModule):
         mod["main"] = _function.Function([], node)
         mod = _transform.InferType()(mod)
@@ -471,6 +601,16 @@ def infer_type(node, mod=None):
 
     return ret
 
+
+def infer_type(node, mod=None):
+    """A method to infer the type of an intermediate node in the relay graph.
+
+    The inference is incremental when called within an InferenceContext.
+    """
+    if InferenceContext.current is not None:
+        return InferenceContext.current.infer_type(node, mod)
+    return _infer_type(node, mod)
+
 def infer_channels(inputs, transpose=False):
     """A hack for getting 'channels' or 'units' since caffe2 does not provide
     these attributes. We check the shape of weights provided to get the number.
@@ -492,37 +632,34 @@ def infer_shape(inputs, mod=None):
     return checked_type
 
 
+def _evaluate_with_interpreter(func, inputs, mod=None):
+    """Evaluate a function with the interpreter, reusing the kernels
+    already compiled by the compile engine instead of building a module."""
+    if isinstance(mod, IRModule):
+        mod["main"] = func
+    else:
+        mod = IRModule.from_expr(func)
+    exc = tvm.relay.create_executor("debug", mod=mod, ctx=tvm.cpu(), target="llvm")
+    inputs = [x if isinstance(x, tvm.nd.NDArray) else tvm.nd.array(x) for x in inputs]
+    return exc.evaluate()(*inputs)
+
+
 def infer_value(input_val, params, mod=None):
     """A hack for getting the value of an expression by evaluating a
     portion of the relay graph. This is often needed for functions that
     whose output shape depends on the value of a tensor.
+
+    The result is memoized when called within an InferenceContext.
     """
-    try:
-        # TODO(kevinthesun): Use VM for all cases.
-        # pylint: disable=import-outside-toplevel
-        from tvm.contrib import graph_runtime
-        # Check that all free variables have associated parameters.
-        assert all(var.name_hint in params.keys() for var in analysis.free_vars(
-            input_val)), "All inputs to infer must be available in params."
-        func = _function.Function(analysis.free_vars(input_val), input_val)
-        with tvm.relay.build_config(opt_level=0):
-            graph, lib, params = tvm.relay.build(func, target="llvm", params=params)
-        ctx = tvm.cpu(0)
-        m = graph_runtime.create(graph, lib, ctx)
-        m.set_input(**params)
-        m.run()
-        return m.get_output(0)
-    except Exception:
-        if isinstance(mod, IRModule):
-            mod["main"] = _function.Function(analysis.free_vars(input_val), input_val)
-        else:
-            mod = IRModule.from_expr(input_val)
-        exc = tvm.relay.create_executor("debug", mod=mod, ctx=tvm.cpu(), target="llvm")
-        inputs = []
-        for param in mod['main'].params:
-            inputs.append(tvm.nd.array(params[param.name_hint]))
-        result = exc.evaluate()(*inputs)
-        return result
+    # Check that all free variables have associated parameters.
+    assert all(var.name_hint in params.keys() for var in analysis.free_vars(
+        input_val)), "All inputs to infer must be available in params."
+    if InferenceContext.current is not None:
+        return InferenceContext.current.infer_value(input_val, params, mod)
+    free_vars = analysis.free_vars(input_val)
+    func = _function.Function(free_vars, input_val)
+    return _evaluate_with_interpreter(
+        func, [params[var.name_hint] for var in free_vars], mod)
 
 
 def infer_value_simulated(input_val, params):
@@ -29,6 +29,7 @@ from .. import op as _op
 from .common import AttrCvt, Renamer
 from .common import get_relay_op, new_var, infer_shape, infer_channels
 from .common import infer_type, infer_value, infer_value_simulated, get_name
+from .common import InferenceContext
 
 __all__ = ['from_onnx']
 
@@ -1892,5 +1893,6 @@ def from_onnx(model,
             opset = model.opset_import[0].version if model.opset_import else 1
         except AttributeError:
             opset = 1
-    mod, params = g.from_onnx(graph, opset)
+    with InferenceContext():
+        mod, params = g.from_onnx(graph, opset)
     return mod, params
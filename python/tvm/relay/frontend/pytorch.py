@@ -35,6 +35,7 @@ from .common import get_relay_op
 from .common import infer_shape as _infer_shape
 from .common import infer_value as _infer_value
 from .common import infer_type as _infer_type
+from .common import InferenceContext
 from ..prelude import Prelude, StaticTensorArrayOps
 
 from . import qnn_torch
@@ -2113,8 +2114,9 @@ def from_pytorch(script_module, input_shapes, custom_convert_map=None):
         qnn_torch.add_quant_params(tvm_params, weight_quant_params)
         convert_map.update(qnn_torch.convert_map)
 
-    ret = convert_operators(_get_operator_nodes(graph.nodes()),
-                            outputs, ret_name, convert_map, prelude)
+    with InferenceContext():
+        ret = convert_operators(_get_operator_nodes(graph.nodes()),
+                                outputs, ret_name, convert_map, prelude)
 
     mod["main"] = tvm.relay.Function(_analysis.free_vars(ret[0]), ret[0])
 
@@ -20,6 +20,7 @@
 """TF: Tensorflow frontend."""
 import warnings
 from collections import defaultdict
+from collections.abc import MutableMapping
 
 # Numpy support
 import numpy as np
@@ -41,6 +42,7 @@ from .common import infer_shape as _infer_shape
 from .common import infer_channels as _infer_channels
 from .common import infer_value as _infer_value
 from .common import infer_value_simulated as _infer_value_simulated
+from .common import InferenceContext
 
 __all__ = ['from_tensorflow']
 
@@ -2691,6 +2693,59 @@ class Loop:
         return self._loop
 
 
+def _tensor_proto_to_numpy(tensor):
+    """Convert a TensorProto to numpy array, as a view of its tensor_content
+    when possible instead of the copy made by tensor_util.MakeNdarray."""
+    from tensorflow.python.framework import dtypes, tensor_util
+    content = tensor.tensor_content
+    if content:
+        dtype = dtypes.as_dtype(tensor.dtype).as_numpy_dtype
+        shape = tensor_util.TensorShapeProtoToList(tensor.tensor_shape)
+        return np.frombuffer(content, dtype=dtype).reshape(shape)
+    return tensor_util.MakeNdarray(tensor)
+
+
+class _LazyParamDict(MutableMapping):
+    """Parameter dict used by the low memory import mode.
+
+    Const tensors are kept as TensorProto until a converter or the final
+    module asks for them. On first access a tensor is converted into an
+    NDArray and the content of its TensorProto is released.
+    """
+    def __init__(self):
+        self._arrays = {}
+        self._tensors = {}
+
+    def add_tensor(self, name, tensor):
+        self._tensors[name] = tensor
+
+    def __getitem__(self, name):
+        if name not in self._arrays:
+            tensor = self._tensors.pop(name)
+            self._arrays[name] = tvm.nd.array(_tensor_proto_to_numpy(tensor))
+            tensor.Clear()
+        return self._arrays[name]
+
+    def __setitem__(self, name, value):
+        self._tensors.pop(name, None)
+        self._arrays[name] = value
+
+    def __delitem__(self, name):
+        if name in self._arrays:
+            del self._arrays[name]
+        else:
+            del self._tensors[name]
+
+    def __contains__(self, name):
+        return name in self._arrays or name in self._tensors
+
+    def __iter__(self):
+        return iter(list(self._arrays) + list(self._tensors))
+
+    def __len__(self):
+        return len(self._arrays) + len(self._tensors)
+
+
 class GraphProto(object):
     """ A helper class for handling relay graph copying from Tensorflow GraphDef.
     Definition:
@@ -2713,8 +2768,10 @@ class GraphProto(object):
         self._loop_var_order = {}
         self._hash2tfnode = {}
         self._while_loop_name_set = set()
+        self._low_memory = False
 
-    def from_tensorflow(self, graph, layout="NHWC", shape=None, outputs=None):
+    def from_tensorflow(self, graph, layout="NHWC", shape=None, outputs=None,
+                        low_memory=False):
         """Construct relay nodes from tensorflow graph definition - GraphDef.
 
         Follow the tensorflow graph definition to parse and convert it to Relay.
@@ -2744,6 +2801,11 @@ class GraphProto(object):
         outputs : List of output tensor names (Optional)
             if not specified then the last node is assumed as graph output.
 
+        low_memory : bool (Optional)
+            Convert Const nodes to params lazily, as nodes are converted.
+            The tensor content of the converted Const nodes is released
+            from graph, so graph cannot be imported again afterwards.
+
         Returns
         -------
         mod : tvm.IRModule
@@ -2763,6 +2825,9 @@ class GraphProto(object):
         self._in_shape = shape
         self._layout = layout
         self._graph = graph
+        self._low_memory = low_memory
+        if low_memory:
+            self._params = _LazyParamDict()
 
         if missing_operators:
             freezed_ops = [op for op in missing_operators if op in _freezed_graph_pruned_op_list]
@@ -2882,6 +2947,12 @@ class GraphProto(object):
         out = out[0] if len(out) == 1 else _expr.Tuple(out)
         func = _function.Function(analysis.free_vars(out), out)
         self._mod["main"] = func
+        if low_memory:
+            # Only the params used by the module are ever converted.
+            params = {v.name_hint: self._params[v.name_hint]
+                      for v in func.params if v.name_hint in self._params}
+            self._params = _LazyParamDict()
+            return self._mod, params
         return self._mod, self._params
 
     def _parse_import_prerequisites(self, graph):
@@ -2914,6 +2985,8 @@ class GraphProto(object):
                 "Unable to import tensorflow which is required {}".format(e))
 
         if key == 'value':
+            if self._low_memory and self._add_lazy_param(name, value.tensor):
+                return
             np_array = tensor_util.MakeNdarray(value.tensor)
 
             if np_array.dtype == np.dtype(object):
@@ -2939,6 +3012,20 @@ class GraphProto(object):
                 raise NotImplementedError \
                     ("Other attributes for a Const(param) Node {} ? .".format(key))
 
+    def _add_lazy_param(self, name, tensor):
+        """Register a Const tensor to be converted on first use.
+        Returns False if the tensor has to be converted immediately."""
+        from tensorflow.python.framework import dtypes, tensor_util
+
+        dtype = dtypes.as_dtype(tensor.dtype)
+        shape = tensor_util.TensorShapeProtoToList(tensor.tensor_shape)
+        if dtype == dtypes.string or not shape:
+            return False
+        self._params.add_tensor(name, tensor)
+        self._nodes[name] = [_expr.var(name, shape=shape,
+                                       dtype=np.dtype(dtype.as_numpy_dtype).name)]
+        return True
+
     def _get_attr(self, buf):
         """Returns the value of the attr of this buf with the given `name`.
 
@@ -3258,7 +3345,7 @@ class GraphProto(object):
 
         return self._nodes[node_name]
 
-def from_tensorflow(graph, layout="NHWC", shape=None, outputs=None):
+def from_tensorflow(graph, layout="NHWC", shape=None, outputs=None, low_memory=False):
     """Load tensorflow graph which is a python tensorflow graph object into relay.
     The companion parameters will be handled automatically.
 
@@ -3276,6 +3363,11 @@ def from_tensorflow(graph, layout="NHWC", shape=None, outputs=None):
     outputs : List of output tensor names (Optional)
         if not specified then the last node is assumed as graph output.
 
+    low_memory : bool (Optional)
+        Convert the Const nodes lazily and release their tensor content from
+        graph once converted, which lowers the peak memory usage of importing
+        large graphs. graph cannot be imported again afterwards.
+
     Returns
     -------
     mod : tvm.IRModule
@@ -3285,5 +3377,6 @@ def from_tensorflow(graph, layout="NHWC", shape=None, outputs=None):
         Dict of converted parameters stored in tvm.nd.NDArray format
     """
     g = GraphProto()
-    mod, params = g.from_tensorflow(graph, layout, shape, outputs)
+    with InferenceContext():
+        mod, params = g.from_tensorflow(graph, layout, shape, outputs, low_memory)
     return mod, params
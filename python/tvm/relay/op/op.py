@@ -18,6 +18,7 @@
 """The base node types for the Relay language."""
 import tvm._ffi
 from tvm.driver import lower, build
+from tvm.ir import profiling
 
 from ..expr import RelayExpr
 from ...target import get_native_generic_func, GenericFunc
@@ -217,7 +218,20 @@ class OpStrategy(Object):
         plevel : int
             The priority level of implementation.
         """
-        _OpStrategyAddImplementation(self, compute, schedule, name, plevel)
+        _OpStrategyAddImplementation(self, _profiled(compute, name, "compute"),
+                                     _profiled(schedule, name, "schedule"), name, plevel)
+
+
+def _profiled(func, name, category):
+    # the strategies are created during the compilation, leave the
+    # functions untouched when no profiler is recording it
+    if profiling.CompileProfiler.current is None:
+        return func
+
+    def _func(*args):
+        with profiling.scope(name, category):
+            return func(*args)
+    return _func
 
 
 def _wrap_default_fstrategy(compute, schedule, name):
@@ -16,8 +16,17 @@
 # under the License.
 # pylint: disable=invalid-name
 """Helper utility to save parameter dicts."""
+import ctypes
+import json
+import mmap
+import struct
+from collections.abc import Mapping
+
+import numpy as np
+
 import tvm
 import tvm._ffi
+from tvm.runtime import ndarray as _nd
 
 
 _save_param_dict = tvm._ffi.get_global_func("tvm.relay._save_param_dict")
@@ -72,7 +81,209 @@ def load_param_dict(param_bytes):
     params : dict of str to NDArray
         The parameter dictionary.
     """
-    if isinstance(param_bytes, (bytes, str)):
+    if not isinstance(param_bytes, bytearray):
         param_bytes = bytearray(param_bytes)
     load_arr = _load_param_dict(param_bytes)
     return {v.name : v.array for v in load_arr}
+
+
+# Magic number of the memory-mappable parameter file format.
+_PARAM_FILE_MAGIC = 0xF7E58D4F05049CB8
+_PARAM_FILE_VERSION = 1
+# Same as kAllocAlignment in the runtime.
+_PARAM_FILE_ALIGNMENT = 64
+
+
+def _align_up(value, alignment):
+    return (value + alignment - 1) // alignment * alignment
+
+
+def save_param_file(params, path, alignment=_PARAM_FILE_ALIGNMENT):
+    """Save parameter dictionary to a memory-mappable parameter file.
+
+    Unlike :py:func:`save_param_dict`, every tensor in the file starts at
+    an offset aligned to ``alignment`` bytes, so the file can be loaded
+    with :py:func:`load_param_file` without copying tensor data.
+
+    The layout of the file is::
+
+        uint64 magic | uint64 version | uint64 index_size
+        index (utf-8 json) | padding | aligned tensor data ...
+
+    Parameters
+    ----------
+    params : dict of str to NDArray or numpy.ndarray
+        The parameter dictionary.
+
+    path : str
+        The path of the file to be written.
+
+    alignment : int, optional
+        The byte alignment of each tensor in the file.
+    """
+    if alignment <= 0 or alignment & (alignment - 1):
+        raise ValueError("alignment must be a power of two, got %d" % alignment)
+    entries = []
+    offset = 0
+    for name, value in params.items():
+        if isinstance(value, _nd.NDArray):
+            dtype, shape = value.dtype, value.shape
+        else:
+            value = np.asarray(value)
+            dtype, shape = str(value.dtype), value.shape
+        if tvm.runtime.DataType(dtype).lanes != 1:
+            raise ValueError("Vector dtype %s is not supported in param file" % dtype)
+        nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        entries.append({"name": name, "dtype": dtype, "shape": [int(x) for x in shape],
+                        "offset": offset, "nbytes": nbytes})
+        offset = _align_up(offset + nbytes, alignment)
+
+    index = json.dumps({"alignment": alignment, "params": entries}).encode("utf-8")
+    data_start = _align_up(24 + len(index), alignment)
+    with open(path, "wb") as fo:
+        fo.write(struct.pack("<QQQ", _PARAM_FILE_MAGIC, _PARAM_FILE_VERSION, len(index)))
+        fo.write(index)
+        for entry in entries:
+            value = params[entry["name"]]
+            if isinstance(value, _nd.NDArray):
+                value = value.asnumpy()
+            fo.seek(data_start + entry["offset"])
+            fo.write(np.ascontiguousarray(value).tobytes())
+        # make sure the file covers the padding of the last tensor.
+        fo.truncate(data_start + offset)
+
+
+class ParamFile(Mapping):
+    """A memory-mapped parameter file created by :py:func:`save_param_file`.
+
+    Parameters are exposed lazily: indexing the mapping returns a CPU
+    NDArray that is a view on the mapped file, created on first access.
+    The mapping is copy-on-write, so untouched pages stay shared between
+    all processes that map the same file.
+
+    Parameters
+    ----------
+    path : str
+        The path of the parameter file.
+    """
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as fi:
+            header = fi.read(24)
+            if len(header) != 24:
+                raise ValueError("Invalid parameter file %s" % path)
+            magic, version, index_size = struct.unpack("<QQQ", header)
+            if magic != _PARAM_FILE_MAGIC or version != _PARAM_FILE_VERSION:
+                raise ValueError("Invalid parameter file %s" % path)
+            index = json.loads(fi.read(index_size).decode("utf-8"))
+            self._data_start = _align_up(24 + index_size, index["alignment"])
+            self._entries = {x["name"]: x for x in index["params"]}
+            self._mmap = mmap.mmap(fi.fileno(), 0, access=mmap.ACCESS_COPY)
+        self._views = {}
+
+    def __getitem__(self, name):
+        view = self._views.get(name, None)
+        if view is None:
+            view = self._make_view(self._entries[name])
+            self._views[name] = view
+        return view
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def asnumpy(self, name):
+        """Get a numpy view of a parameter without copying.
+
+        Parameters
+        ----------
+        name : str
+            The parameter name.
+
+        Returns
+        -------
+        arr : numpy.ndarray
+            The array view on the mapped file.
+        """
+        entry = self._entries[name]
+        count = entry["nbytes"] // np.dtype(entry["dtype"]).itemsize
+        arr = np.frombuffer(self._mmap, dtype=entry["dtype"], count=count,
+                            offset=self._data_start + entry["offset"])
+        return arr.reshape(entry["shape"])
+
+    def materialize(self, name, ctx=_nd.cpu(0)):
+        """Copy a parameter into a newly allocated NDArray.
+
+        Parameters
+        ----------
+        name : str
+            The parameter name.
+
+        ctx : TVMContext, optional
+            The context of the result array.
+
+        Returns
+        -------
+        arr : NDArray
+            An NDArray that owns its data.
+        """
+        entry = self._entries[name]
+        ret = _nd.empty(entry["shape"], entry["dtype"], ctx)
+        return ret.copyfrom(self.asnumpy(name))
+
+    def _make_view(self, entry):
+        np_arr = self.asnumpy(entry["name"])
+        tvm_arr, shape = _nd.numpyasarray(np_arr)
+        view = _nd._make_array(ctypes.pointer(tvm_arr), True, False)
+        # the view does not own its memory, keep the backing buffers alive.
+        view._param_file_ref = (np_arr, tvm_arr, shape)
+        return view
+
+    def close(self):
+        """Release the mapping.
+
+        All the views obtained from this file must be released before.
+        """
+        self._views = {}
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        self.close()
+
+
+def load_param_file(path, lazy=True):
+    """Load a parameter file created by :py:func:`save_param_file`.
+
+    Parameters
+    ----------
+    path : str
+        The path of the parameter file.
+
+    lazy : bool, optional
+        Whether to return the memory-mapped :py:class:`ParamFile` directly.
+        Otherwise every parameter is materialized into its own NDArray.
+
+    Returns
+    -------
+    params : ParamFile or dict of str to NDArray
+        The parameter dictionary.
+
+    Examples
+    --------
+    .. code-block:: python
+
+       relay.save_param_file(params, "deploy.params")
+       module = graph_runtime.create(graph, lib, tvm.cpu(0))
+       # parameters are copied from the mapped file straight into the module.
+       module.load_params(relay.load_param_file("deploy.params"))
+    """
+    param_file = ParamFile(path)
+    if lazy:
+        return param_file
+    with param_file:
+        return {name: param_file.materialize(name) for name in param_file}
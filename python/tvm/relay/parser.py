@@ -16,15 +16,100 @@
 # under the License.
 """A parser for Relay's text format."""
 from __future__ import absolute_import
+import hashlib
+import logging
+import os
+import tempfile
+
+import tvm
 from .. import register_func
+from .base import __STD_PATH__
 
+logger = logging.getLogger('relay')
 
-@register_func("relay.fromtext")
-def fromtext(data, source_name=None):
-    """Parse a Relay program."""
+# environment variable to enable a persistent cache of the parsed std library
+STD_CACHE_DIR_ENV_VAR = "TVM_RELAY_STD_CACHE_DIR"
+
+# std library modules parsed by this process, keyed by the digest of their source
+_STD_MODULES = {}
+
+
+def _parse(data, source_name):
     # pylint: disable=import-outside-toplevel
-    from tvm.relay import _parser
-    x = _parser.fromtext(data + "\n", source_name)
+    from tvm.relay import _text_parser
+    x = _text_parser.fromtext(data + "\n", source_name)
     if x is None:
         raise Exception("cannot parse: ", data)
     return x
+
+
+def _is_std_source(source_name):
+    if not isinstance(source_name, str):
+        return False
+    return os.path.dirname(os.path.realpath(source_name)) == os.path.realpath(__STD_PATH__)
+
+
+def _copy(mod):
+    return tvm.IRModule(mod.functions, mod.type_definitions)
+
+
+def _save_std(mod, path, source_name):
+    cache_dir = os.path.dirname(path)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # write to a temporary file first so that concurrent
+        # readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(suffix=".json", dir=cache_dir)
+        with os.fdopen(fd, "w") as fo:
+            fo.write(tvm.ir.save_json(mod))
+        os.replace(tmp_path, path)
+    except OSError as err:
+        logger.warning("Failed to cache the parsed std library %s: %s", source_name, err)
+    finally:
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _load_std(data, source_name):
+    """Load a std library module, parsing its source only when it is not cached.
+
+    When STD_CACHE_DIR_ENV_VAR is set, the parsed module is serialized to
+    that directory so that later processes skip the parser as well. Every
+    call returns a new module, which the caller can update.
+    """
+    # pylint: disable=import-outside-toplevel
+    from tvm.relay import _text_parser
+    payload = "|".join([tvm.__version__, str(_text_parser.PARSER_VERSION), data])
+    digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    if digest in _STD_MODULES:
+        return _copy(_STD_MODULES[digest])
+
+    cache_dir = os.environ.get(STD_CACHE_DIR_ENV_VAR)
+    path = os.path.join(cache_dir, digest + ".json") if cache_dir else None
+    mod = None
+    if path is not None and os.path.isfile(path):
+        try:
+            with open(path) as fi:
+                mod = tvm.ir.load_json(fi.read())
+        except (OSError, tvm.TVMError) as err:
+            logger.warning("Failed to load the parsed std library %s: %s", path, err)
+            mod = None
+    if mod is None:
+        mod = _parse(data, source_name)
+        if path is not None:
+            _save_std(mod, path, source_name)
+    _STD_MODULES[digest] = mod
+    return _copy(mod)
+
+
+@register_func("relay.fromtext")
+def fromtext(data, source_name=None):
+    """Parse a Relay program.
+
+    Modules of the Relay std library are parsed once per process, and
+    once per cache directory when STD_CACHE_DIR_ENV_VAR is set.
+    """
+    if _is_std_source(source_name):
+        return _load_std(data, source_name)
+    return _parse(data, source_name)
@@ -573,6 +573,11 @@ class StaticTensorArrayOps(object):
 
     def register(self):
         """Register all tensor array ops in Prelude"""
+        # the ops only depend on the dtype and shape, skip repeated registrations
+        key = self.get_name('tensor_t')
+        if key in self.prelude.static_tensor_arrays:
+            return
+        self.prelude.static_tensor_arrays.add(key)
         self.define_tensor_adt()
         self.define_tensor_take()
         self.define_tensor_concatenate()
@@ -1228,15 +1233,57 @@ class TensorArrayOps(object):
         # TODO(wweic): Gather fails in PartialEvaluate
         # self.define_tensor_array_gather()
 
+TENSOR_ARRAY_DTYPES = ['float32',
+                       'float16',
+                       'float64',
+                       'int32',
+                       'uint8',
+                       'int8',
+                       'int16',
+                       'uint16',
+                       'int64']
+
+
 class Prelude:
-    """Contains standard definitions."""
+    """Contains standard definitions.
+
+    The tensor array ops of a dtype are only defined once they are first
+    requested, e.g. through get_var.
+    """
 
     def __init__(self, mod=None):
         if mod is None:
             mod = IRModule()
         self.mod = mod
+        self.tensor_array_dtypes = set()
+        self.static_tensor_arrays = set()
         self.load_prelude()
 
+    def __getattr__(self, name):
+        # only called for missing attributes, which may belong to the
+        # tensor array ops of a dtype that has not been registered yet
+        registered = self.__dict__.get("tensor_array_dtypes")
+        if registered is not None:
+            base = name[:-len("_t")] if name.endswith("_t") else name
+            for dtype in TENSOR_ARRAY_DTYPES:
+                if base.endswith("_" + dtype) and dtype not in registered:
+                    self.register_tensor_array(dtype)
+                    return getattr(self, name)
+        raise AttributeError("'Prelude' object has no attribute '%s'" % name)
+
+    def register_tensor_array(self, dtype):
+        """Define the tensor array ops of a dtype if they are not defined yet.
+
+        Parameters
+        ----------
+        dtype : str
+            The data type of the tensors.
+        """
+        if dtype in self.tensor_array_dtypes:
+            return
+        self.tensor_array_dtypes.add(dtype)
+        TensorArrayOps(self, dtype).register()
+
     def get_name(self, canonical, dtype):
         """Get name corresponding to the canonical name"""
         if canonical == 'tensor_t':
@@ -1245,6 +1292,7 @@ class Prelude:
 
     def get_var(self, canonical, dtype):
         """Get var corresponding to the canonical name"""
+        self.register_tensor_array(dtype)
         name = self.get_name(canonical, dtype)
         return getattr(self, name)
 
@@ -1258,7 +1306,10 @@ class Prelude:
         return getattr(self, name)
 
     def load_prelude(self):
-        """Parses the Prelude from Relay's text format into a module."""
+        """Parses the Prelude from Relay's text format into a module.
+
+        The parsed std library is cached, see relay.parser.
+        """
         # TODO(@jroesch): we should remove this helper when we port over prelude
         self.mod.import_from_std("prelude.rly")
 
@@ -1304,15 +1355,3 @@ class Prelude:
         ]
         for global_def in GLOBAL_DEFS:
             setattr(self, global_def, self.mod.get_global_var(global_def))
-
-        for dtype in ['float32',
-                      'float16',
-                      'float64',
-                      'int32',
-                      'uint8',
-                      'int8',
-                      'int16',
-                      'uint16',
-                      'int64']:
-            tensor_array_ops = TensorArrayOps(self, dtype)
-            tensor_array_ops.register()
@@ -17,11 +17,12 @@
 """Find scales for quantization on the dataset."""
 from __future__ import absolute_import
 import logging
-import multiprocessing as mp
+from multiprocessing.pool import ThreadPool
 import numpy as np
 import tvm
 import tvm.driver
 from tvm.ir import IRModule
+from tvm.runtime import packed_func as _packed_func
 
 from . import _quantize
 from . import quantize
@@ -31,7 +32,8 @@ from .. import analysis as _analysis
 from .. import transform as _transform
 from .. import build_module as _build_module
 from ...contrib import graph_runtime
-from .kl_divergence import _find_scale_by_kl
+from .kl_divergence import _find_scale_by_kl_hist
+from ._histogram import StreamingHistogram, find_scale_by_percentile, find_scale_by_mse
 
 
 def _get_profile_runtime(mod):
@@ -53,11 +55,9 @@ def _get_profile_runtime(mod):
     return runtime
 
 
-def collect_stats(mod, dataset, chunk_by=-1):
-    """Given an annotated graph, create a profile graph to collect profile data from the
-    calibration dataset. This pass collects simulated_quantize op input into a tuple.
-    Simulated_quantize ops are rewritten to identity mode. The tuple is the output of the profile
-    graph.
+def collect_histograms(mod, dataset, num_bins=8001):
+    """Given an annotated graph, run the calibration dataset once through the
+    profile graph and keep a streaming histogram of every simulated_quantize op input.
 
     Parameters
     ----------
@@ -67,39 +67,53 @@ def collect_stats(mod, dataset, chunk_by=-1):
     dataset: Iterable[NDArray]
         The calibration dataset.
 
-    chunk_by: optional, int
-        The size of chunk to be returned in one iteration. It is meant to be
-        used for reducing memory usage. If not specified, return samples for
-        all layers in one chunk.
+    num_bins: optional, int
+        The number of bins of each histogram, must be odd.
 
     Returns
     -------
-    ret: Iterable[list of ndarray]
-        List of output data of each layer, chunked by the chunk_by parameter
+    ret: list of StreamingHistogram
+        The histogram of each layer.
     """
-    logging.info("collecting statistics for calibration...")
+    logging.info("collecting histograms for calibration...")
     runtime = _get_profile_runtime(mod)
-    num_outputs = runtime.get_num_outputs()
-    chunk_by = num_outputs if chunk_by == -1 else chunk_by
-
-    for i in range(0, num_outputs, chunk_by):
-        outputs = [[] for i in range(min(chunk_by, num_outputs - i))]
-        for batch in dataset:
-            runtime.set_input(**batch)
-            runtime.run()
-            for j in range(i, min(i+chunk_by, num_outputs)):
-                outputs[j-i].append(runtime.get_output(j).asnumpy())
-        yield [np.concatenate(output).reshape(-1) for output in outputs]
-
-
-def _kl_scale(mod, dataset):
+    hists = [StreamingHistogram(num_bins) for _ in range(runtime.get_num_outputs())]
+    for batch in dataset:
+        runtime.set_input(**batch)
+        runtime.run()
+        for i, hist in enumerate(hists):
+            hist.update(runtime.get_output(i).asnumpy())
+    return hists
+
+
+def _histogram_scale(mod, dataset, hists=None):
+    """Find the input scales in one pass over the dataset, the search
+    runs on the histograms of the layers in parallel."""
     cfg = quantize.current_qconfig()
-    chunk_by = cfg.calibrate_chunk_by
-    scales = []
-    for samples in collect_stats(mod, dataset, chunk_by):
-        logging.info("finding threshold with kl for calibration...")
-        with mp.Pool() as pool:
-            scales += list(pool.map(_find_scale_by_kl, samples))
+    if cfg.calibrate_mode == 'kl_divergence':
+        def search(hist):
+            return _find_scale_by_kl_hist(hist.hist, hist.edges, hist.min_val)
+    elif cfg.calibrate_mode == 'percentile':
+        percentile = cfg.calibrate_percentile
+        def search(hist):
+            return find_scale_by_percentile(hist, percentile)
+    else:
+        nbit = cfg.nbit_input
+        def search(hist):
+            return find_scale_by_mse(hist, nbit)
+
+    if hists is None:
+        hists = collect_histograms(mod, dataset)
+    logging.info("finding threshold with %s for calibration...", cfg.calibrate_mode)
+    def search_nogil(hist):
+        # ReleaseGIL only covers the calls of the current thread, so that
+        # each worker runs its KL search in the FFI without the GIL. The
+        # numpy searches only overlap where numpy drops the GIL itself.
+        with _packed_func.ReleaseGIL():
+            return search(hist)
+
+    with ThreadPool() as pool:
+        scales = pool.map(search_nogil, hists)
 
     def func(_):
         scale = scales[func.scale_idx]
@@ -168,7 +182,7 @@ def _global_scale(sq_call): # pylint: disable=unused-argument
     return cfg.global_scale
 
 
-def calibrate(dataset=None):
+def calibrate(dataset=None, histograms=None):
     """The calibrate procedure will try to calculate the content of
     dom_scale, nbit, clip_min, clip_max for every `simulated_quantize`
     operator.
@@ -178,6 +192,10 @@ def calibrate(dataset=None):
     dataset: Optional[Iterable[NDArray]]
         The calibration dataset.
 
+    histograms: Optional[list of StreamingHistogram]
+        Histograms collected by collect_histograms on the same annotated
+        module, used instead of running the dataset again.
+
     Returns
     -------
     ret: Function
@@ -187,8 +205,8 @@ def calibrate(dataset=None):
         """make transform.module pass happy"""
         cfg = quantize.current_qconfig()
 
-        if cfg.calibrate_mode == 'kl_divergence':
-            input_scale_func = _kl_scale(mod, dataset)
+        if cfg.calibrate_mode in ('kl_divergence', 'percentile', 'mse'):
+            input_scale_func = _histogram_scale(mod, dataset, histograms)
         elif cfg.calibrate_mode == 'global_scale':
             input_scale_func = _global_scale
         else:
@@ -0,0 +1,164 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Streaming histograms of layer outputs and the scale searches on them."""
+import numpy as np
+
+
+class StreamingHistogram(object):
+    """Histogram of a stream of tensors on a symmetric range around zero.
+
+    When a tensor exceeds the current range, the range grows by an odd
+    integer factor so that the existing bins merge exactly into the wider
+    ones. The range is thus at most three times the maximum absolute value
+    seen, at the cost of a coarser resolution.
+
+    Parameters
+    ----------
+    num_bins : int
+        The number of bins, must be odd so that zero is a bin center.
+    """
+    def __init__(self, num_bins=8001):
+        assert num_bins % 2 == 1, "num_bins must be odd"
+        self.num_bins = num_bins
+        self.hist = np.zeros(num_bins, dtype=np.int64)
+        self.thres = 0.0
+        self.min_val = np.inf
+        self.max_val = -np.inf
+
+    @property
+    def count(self):
+        """Number of values added."""
+        return int(self.hist.sum())
+
+    @property
+    def edges(self):
+        """The bin edges."""
+        return np.linspace(-self.thres, self.thres, self.num_bins + 1)
+
+    def update(self, arr):
+        """Add the values of a tensor.
+
+        Parameters
+        ----------
+        arr : numpy.ndarray
+            The tensor.
+        """
+        arr = np.asarray(arr).reshape(-1)
+        if arr.size == 0:
+            return
+        min_val, max_val = float(np.min(arr)), float(np.max(arr))
+        self.min_val = min(self.min_val, min_val)
+        self.max_val = max(self.max_val, max_val)
+        thres = max(abs(min_val), abs(max_val))
+        if thres == 0.0 and self.thres == 0.0:
+            self.hist[self.num_bins // 2] += arr.size
+            return
+        if self.thres == 0.0:
+            # only zeros so far, they stay in the center bin
+            self.thres = thres
+        elif thres > self.thres:
+            self._grow(int(np.ceil(thres / self.thres)) | 1)
+        hist, _ = np.histogram(arr, bins=self.num_bins, range=(-self.thres, self.thres))
+        self.hist += hist
+
+    def _grow(self, factor):
+        half = self.num_bins // 2
+        offsets = np.arange(-half, half + 1)
+        index = (offsets + (factor - 1) // 2) // factor + half
+        self.hist = np.bincount(index, weights=self.hist,
+                                minlength=self.num_bins).astype(np.int64)
+        self.thres *= factor
+
+    def folded(self):
+        """Histogram of the absolute values.
+
+        Returns
+        -------
+        counts : numpy.ndarray
+            The counts of the num_bins // 2 + 1 bins of absolute values.
+
+        centers : numpy.ndarray
+            The absolute value at the center of each bin.
+        """
+        half = self.num_bins // 2
+        counts = self.hist[half:].astype(np.float64)
+        counts[1:] += self.hist[half - 1::-1]
+        width = 2.0 * self.thres / self.num_bins
+        return counts, np.arange(half + 1) * width
+
+
+def find_scale_by_percentile(hist, percentile=99.99):
+    """Find the threshold covering a percentile of the absolute values.
+
+    Parameters
+    ----------
+    hist : StreamingHistogram
+        The histogram of the tensor.
+
+    percentile : float
+        The percentile in [0, 100].
+
+    Returns
+    -------
+    thres : float
+        The threshold.
+    """
+    counts, centers = hist.folded()
+    total = counts.sum()
+    if total == 0 or hist.thres == 0.0:
+        return 0.0
+    width = centers[1] - centers[0] if len(centers) > 1 else 2.0 * hist.thres
+    cdf = np.cumsum(counts) / total
+    idx = min(int(np.searchsorted(cdf, percentile / 100.0)), len(counts) - 1)
+    max_abs = max(abs(hist.min_val), abs(hist.max_val))
+    return float(min(centers[idx] + width / 2, max_abs))
+
+
+def find_scale_by_mse(hist, nbit=8, num_candidates=128):
+    """Find the threshold minimizing the mean squared quantization error.
+
+    The error of a threshold is the clipping error of the values above it
+    plus the rounding error of a uniform quantizer with nbit bits below it.
+
+    Parameters
+    ----------
+    hist : StreamingHistogram
+        The histogram of the tensor.
+
+    nbit : int
+        The number of bits of the signed quantized values.
+
+    num_candidates : int
+        The number of evenly spaced candidate thresholds.
+
+    Returns
+    -------
+    thres : float
+        The threshold.
+    """
+    counts, centers = hist.folded()
+    max_abs = max(abs(hist.min_val), abs(hist.max_val))
+    if counts.sum() == 0 or max_abs == 0.0:
+        return 0.0
+    candidates = np.linspace(max_abs / num_candidates, max_abs, num_candidates)
+    step = candidates / (2 ** (nbit - 1) - 1)
+    clipped = centers[None, :] > candidates[:, None]
+    err = np.where(clipped,
+                   (centers[None, :] - candidates[:, None]) ** 2,
+                   (step ** 2 / 12)[:, None])
+    err = (err * counts[None, :]).sum(axis=1)
+    return float(candidates[np.argmin(err)])
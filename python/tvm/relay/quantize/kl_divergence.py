@@ -35,7 +35,19 @@ def _find_scale_by_kl(arr, quantized_dtype='int8',
     min_val = np.min(arr)
     max_val = np.max(arr)
     thres = max(abs(min_val), abs(max_val))
+    hist, hist_edges = np.histogram(arr, bins=num_bins, range=(-thres, thres))
+    return _find_scale_by_kl_hist(hist, hist_edges, min_val, quantized_dtype,
+                                  num_quantized_bins)
+
+
+def _find_scale_by_kl_hist(hist, hist_edges, min_val, quantized_dtype='int8',
+                           num_quantized_bins=255):
+    """Find the optimal threshold from the histogram of a tensor.
 
+    The histogram must have an odd number of bins on a range symmetric
+    around zero, see _find_scale_by_kl.
+    """
+    num_bins = len(hist)
     if min_val >= 0 and quantized_dtype in ['uint8']:
         # We need to move negative bins to positive bins to fit uint8 range.
         num_quantized_bins = num_quantized_bins * 2 + 1
@@ -44,8 +56,15 @@ def _find_scale_by_kl(arr, quantized_dtype='int8',
         ptr = arr.ctypes.data_as(ctypes.POINTER(ctypes_type))
         return ctypes.cast(ptr, ctypes.c_void_p)
 
-    hist, hist_edges = np.histogram(arr, bins=num_bins, range=(-thres, thres))
-    hist_ptr = get_pointer(hist.astype(np.int32), ctypes.c_int)
+    int32_max = np.iinfo(np.int32).max
+    hist = np.asarray(hist, dtype=np.int64)
+    if hist.max() > int32_max:
+        # rescale, rounding up so that non-empty bins stay non-empty
+        hist = -(-hist // int(np.ceil(hist.max() / int32_max)))
+    # keep the converted arrays alive while their pointers are used
+    hist = hist.astype(np.int32)
+    hist_edges = np.asarray(hist_edges, dtype=np.float32)
+    hist_ptr = get_pointer(hist, ctypes.c_int)
     hist_edges_ptr = get_pointer(hist_edges, ctypes.c_float)
 
     return _quantize.FindScaleByKLMinimization(hist_ptr, hist_edges_ptr,
@@ -16,6 +16,7 @@
 # under the License.
 #pylint: disable=unused-argument, not-context-manager
 """Automatic quantization toolkit."""
+import warnings
 import tvm.ir
 import tvm
 from tvm.runtime import Object
@@ -84,6 +85,7 @@ class QConfig(Object):
         "debug_enabled_ops": None,
         "rounding": "UPWARD",
         "calibrate_chunk_by": -1,
+        "calibrate_percentile": 99.99,
     }
 
     # pylint: disable=no-member
@@ -144,9 +146,16 @@ def qconfig(**kwargs):
         Number of bit for every kind of annotate field.
 
     calibrate_mode: str
-        The calibration mode. 'global_scale' or 'kl_divergence'.
+        The calibration mode. 'global_scale', 'kl_divergence', 'percentile' or 'mse'.
         global_scale: use global scale
         kl_divergence: find scales by kl divergence on the dataset.
+        percentile: find scales covering calibrate_percentile of the absolute values.
+        mse: find scales minimizing the mean squared quantization error.
+        The last three modes run the dataset once and search the scales on
+        streaming histograms of the layer outputs.
+
+    calibrate_percentile: float
+        The percentile used by the percentile calibration mode.
 
     global_scale: float
         The global scale for calibration.
@@ -175,11 +184,19 @@ def qconfig(**kwargs):
     rounding: "UPWARD" or "TONEAREST"
         Rounding direction for fixed point multiplications.
 
+    calibrate_chunk_by: int
+        Deprecated and ignored.
+
     Returns
     -------
     config: QConfig
         The quantization configuration
     """
+    if "calibrate_chunk_by" in kwargs:
+        warnings.warn(
+            "calibrate_chunk_by is deprecated and ignored, the calibration "
+            "runs the dataset once and keeps streaming histograms of all layers",
+            DeprecationWarning)
     node_args = {k: v if k not in kwargs else kwargs[k]
                  for k, v in QConfig._node_defaults.items()}
     return tvm.ir.make_node("relay.quantize.QConfig", **node_args)
@@ -0,0 +1,284 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Sweep quantization configs and compare their accuracy and latency.
+
+Every config is quantized in the main process. Annotated modules and
+calibration histograms are cached and shared between the configs that
+only differ in the calibration or realization options. The quantized
+modules are then built and evaluated in parallel worker processes, and
+latency is measured in one worker at a time.
+
+.. code-block:: python
+
+    def top1(module):
+        ...
+        return accuracy
+
+    sweep = relay.quantize.QConfigSweep(mod, params, calib_dataset, top1)
+    results = sweep.run(relay.quantize.sweep.grid(
+        calibrate_mode=["global_scale", "kl_divergence", "percentile"],
+        skip_conv_layers=[[0], []]))
+    print(relay.quantize.sweep.format_table(results))
+"""
+import itertools
+import logging
+import multiprocessing
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import tvm
+from tvm.contrib import graph_runtime
+
+from . import quantize as _quantize
+from . import _calibrate
+from .. import transform as _transform
+from .. import build_module as _build_module
+
+logger = logging.getLogger("quantize")
+
+# the qconfig fields the annotated module depends on
+_ANNOTATE_FIELDS = ("skip_conv_layers", "debug_enabled_ops", "dtype_input")
+
+_HISTOGRAM_MODES = ("kl_divergence", "percentile", "mse")
+
+SweepResult = namedtuple("SweepResult", ["config", "accuracy", "latency", "pareto", "error"])
+
+# serializes the latency measurements of the workers
+_TIMING_LOCK = None
+
+
+def grid(**options):
+    """Create the cartesian product of qconfig options.
+
+    Parameters
+    ----------
+    options : dict of str to list
+        The values of each qconfig option.
+
+    Returns
+    -------
+    configs : list of dict
+        The qconfig keyword arguments of every combination.
+    """
+    names = sorted(options)
+    return [dict(zip(names, values))
+            for values in itertools.product(*[options[name] for name in names])]
+
+
+def pareto_front(results):
+    """Mark the results that are not dominated in accuracy and latency.
+
+    Parameters
+    ----------
+    results : list of SweepResult
+        The results of a sweep.
+
+    Returns
+    -------
+    results : list of SweepResult
+        The results with the pareto field set, sorted by latency.
+    """
+    valid = [res for res in results if res.error is None]
+    marked = []
+    for res in valid:
+        dominated = any(
+            other.accuracy >= res.accuracy and other.latency <= res.latency and
+            (other.accuracy > res.accuracy or other.latency < res.latency)
+            for other in valid)
+        marked.append(res._replace(pareto=not dominated))
+    marked.sort(key=lambda res: res.latency)
+    return marked + [res._replace(pareto=False) for res in results if res.error is not None]
+
+
+def format_table(results):
+    """Format sweep results as a text table, pareto optimal rows are starred."""
+    res = "%-3s %-10s %-12s %s\n" % ("", "accuracy", "latency(ms)", "config")
+    res += "-" * 60 + "\n"
+    for item in results:
+        config = "float" if item.config is None else \
+            ", ".join("%s=%s" % (k, v) for k, v in sorted(item.config.items()))
+        if item.error is not None:
+            res += "%-3s %-10s %-12s %s: %s\n" % ("", "-", "-", config, item.error)
+            continue
+        res += "%-3s %-10.4f %-12.4f %s\n" % (
+            "*" if item.pareto else "", item.accuracy, item.latency * 1e3, config)
+    return res
+
+
+def _init_worker(lock):
+    global _TIMING_LOCK
+    _TIMING_LOCK = lock
+
+
+def _evaluate(mod, target, evaluate, number, repeat):
+    """Build and evaluate a module, runs in a worker process."""
+    with _transform.build_config(opt_level=3):
+        graph, lib, params = _build_module.build(mod, target=target)
+    ctx = tvm.context(str(target), 0)
+    module = graph_runtime.create(graph, lib, ctx)
+    module.set_input(**params)
+    accuracy = float(evaluate(module))
+    ftimer = module.module.time_evaluator("run", ctx, number=number, repeat=repeat)
+    if _TIMING_LOCK is not None:
+        with _TIMING_LOCK:
+            costs = ftimer().results
+    else:
+        costs = ftimer().results
+    return accuracy, float(np.median(costs))
+
+
+class QConfigSweep(object):
+    """Quantize a model with many configs and evaluate each of them.
+
+    Parameters
+    ----------
+    mod : tvm.IRModule
+        The float model.
+
+    params : dict of str to NDArray
+        The parameters of the model.
+
+    dataset : list of dict of str to NDArray
+        The calibration dataset.
+
+    evaluate : function of GraphModule to float
+        Computes the accuracy of a built model. It runs in spawned worker
+        processes, so it must be a module level function.
+
+    target : str or tvm.target.Target, optional
+        The target to build and measure on.
+
+    n_parallel : int, optional
+        The number of worker processes, defaults to the number of CPUs.
+
+    number : int, optional
+        The number of runs in one latency measurement.
+
+    repeat : int, optional
+        The number of latency measurements, the median is reported.
+    """
+    def __init__(self, mod, params, dataset, evaluate, target="llvm",
+                 n_parallel=None, number=10, repeat=3):
+        self.mod = _quantize.prerequisite_optimize(mod, params)
+        self.dataset = dataset
+        self.evaluate = evaluate
+        self.target = target
+        self.n_parallel = n_parallel or multiprocessing.cpu_count()
+        self.number = number
+        self.repeat = repeat
+        self._annotated = {}
+        self._histograms = {}
+
+    @staticmethod
+    def _annotate_key(config):
+        return tuple((name, repr(config.get(name, _quantize.QConfig._node_defaults[name])))
+                     for name in _ANNOTATE_FIELDS)
+
+    def _annotate(self, key):
+        if key not in self._annotated:
+            seq = tvm.transform.Sequential([_quantize.partition(), _quantize.annotate()])
+            with tvm.transform.PassContext(opt_level=3, required_pass=["QuantizeAnnotate"]):
+                with _quantize.quantize_context():
+                    self._annotated[key] = seq(self.mod)
+        return self._annotated[key]
+
+    def quantize(self, config):
+        """Quantize the model with a config, reusing the cached annotated
+        module and calibration histograms.
+
+        Parameters
+        ----------
+        config : dict
+            The qconfig keyword arguments.
+
+        Returns
+        -------
+        mod : tvm.IRModule
+            The quantized model.
+        """
+        with _quantize.qconfig(**config) as cfg:
+            key = self._annotate_key(config)
+            annotated = self._annotate(key)
+            histograms = None
+            if cfg.calibrate_mode in _HISTOGRAM_MODES:
+                if key not in self._histograms:
+                    self._histograms[key] = _calibrate.collect_histograms(
+                        annotated, self.dataset)
+                histograms = self._histograms[key]
+            calibrate_pass = tvm.transform.module_pass(
+                _calibrate.calibrate(self.dataset, histograms), opt_level=1,
+                name="QuantizeCalibrate")
+            passes = [calibrate_pass]
+            if not cfg.do_simulation:
+                passes.append(_quantize.realize())
+            passes.append(_transform.FoldConstant())
+            with tvm.transform.PassContext(opt_level=3,
+                                           required_pass=["QuantizeCalibrate",
+                                                          "QuantizeRealize"]):
+                with _quantize.quantize_context():
+                    return tvm.transform.Sequential(passes)(annotated)
+
+    def run(self, configs, include_float=True):
+        """Evaluate the configs.
+
+        Parameters
+        ----------
+        configs : list of dict
+            The qconfig keyword arguments of each config, see grid.
+
+        include_float : bool, optional
+            Whether to evaluate the float model as well, its config is None.
+
+        Returns
+        -------
+        results : list of SweepResult
+            The results sorted by latency, see pareto_front.
+        """
+        configs = ([None] if include_float else []) + list(configs)
+        errors = {}
+        mods = {}
+        for i, config in enumerate(configs):
+            try:
+                mods[i] = self.mod if config is None else self.quantize(config)
+            except (tvm.TVMError, ValueError) as err:
+                errors[i] = str(err).split("\n")[-1]
+
+        manager = multiprocessing.Manager()
+        results = []
+        # spawn rather than fork, the runtime threads of the calibration
+        # are not fork safe
+        with ProcessPoolExecutor(self.n_parallel,
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_init_worker,
+                                 initargs=(manager.Lock(),)) as executor:
+            futures = {i: executor.submit(_evaluate, mod, self.target, self.evaluate,
+                                          self.number, self.repeat)
+                       for i, mod in mods.items()}
+            for i, config in enumerate(configs):
+                accuracy = latency = None
+                error = errors.get(i)
+                if i in futures:
+                    try:
+                        accuracy, latency = futures[i].result()
+                    except Exception as err:  # pylint: disable=broad-except
+                        error = str(err).split("\n")[-1]
+                if error is not None:
+                    logger.warning("Config %s failed: %s", config, error)
+                results.append(SweepResult(config, accuracy, latency, False, error))
+        manager.shutdown()
+        return pareto_front(results)
@@ -54,6 +54,7 @@ class TrackerCode(object):
     UPDATE_INFO = 5
     SUMMARY = 6
     GET_PENDING_MATCHKEYS = 7
+    REPORT = 8
 
 RPC_SESS_MASK = 128
 
@@ -17,6 +17,7 @@
 """RPC client tools"""
 from __future__ import absolute_import
 
+import hashlib
 import os
 import socket
 import struct
@@ -40,6 +41,8 @@ class RPCSession(object):
         self._sess = sess
         self._tbl_index = base._SessTableIndex(sess)
         self._remote_funcs = {}
+        # the (url, port) of the server when obtained from a tracker
+        self.server_addr = None
 
     def get_function(self, name):
         """Get function from the session.
@@ -76,7 +79,7 @@ class RPCSession(object):
         ctx._rpc_sess = self
         return ctx
 
-    def upload(self, data, target=None):
+    def upload(self, data, target=None, cache=True):
         """Upload file to remote runtime temp folder
 
         Parameters
@@ -86,6 +89,10 @@ class RPCSession(object):
 
         target : str, optional
             The path in remote
+
+        cache : bool, optional
+            Whether to look the content up in the upload cache of the
+            server first, and only send it when it is not there.
         """
         if isinstance(data, bytearray):
             if not target:
@@ -96,10 +103,30 @@ class RPCSession(object):
             if not target:
                 target = os.path.basename(data)
 
+        digest = self._upload_cache_digest(blob) if cache else None
+        if digest and self._remote_funcs["upload_cache_lookup"](digest, target):
+            return
         if "upload" not in self._remote_funcs:
             self._remote_funcs["upload"] = self.get_function(
                 "tvm.rpc.server.upload")
         self._remote_funcs["upload"](target, blob)
+        if digest:
+            self._remote_funcs["upload_cache_insert"](digest, target)
+
+    def _upload_cache_digest(self, blob):
+        """Get the key of the blob in the upload cache of the server,
+        or None when the server has no upload cache."""
+        if "upload_cache_lookup" not in self._remote_funcs:
+            try:
+                self._remote_funcs["upload_cache_lookup"] = self.get_function(
+                    "tvm.rpc.server.upload_cache_lookup")
+                self._remote_funcs["upload_cache_insert"] = self.get_function(
+                    "tvm.rpc.server.upload_cache_insert")
+            except AttributeError:
+                self._remote_funcs["upload_cache_lookup"] = None
+        if self._remote_funcs["upload_cache_lookup"] is None:
+            return None
+        return hashlib.sha256(blob).hexdigest()
 
     def download(self, path):
         """Download file from remote temp folder.
@@ -187,6 +214,7 @@ class LocalSession(RPCSession):
         self.context = nd.context
         self.get_function = tvm._ffi.get_global_func
         self._temp = util.tempdir()
+        self.server_addr = None
 
     def upload(self, data, target=None):
         if isinstance(data, bytearray):
@@ -253,12 +281,20 @@ class TrackerSession(object):
         res = ""
         res += "Server List\n"
         res += "----------------------------\n"
-        res += "server-address\tkey\n"
+        res += "server-address\tkey\tlatency\tfail\tcalib\tstatus\n"
         res += "----------------------------\n"
         for item in data["server_info"]:
             addr = item["addr"]
             res += addr[0] + ":" + str(addr[1]) + "\t"
-            res += item["key"] + "\n"
+            res += item["key"]
+            health = item.get("health")
+            if health:
+                res += "\t%s\t%s\t%s\t%s" % (
+                    "-" if health["latency"] is None else "%.3gs" % health["latency"],
+                    "-" if health["failure_rate"] is None else "%.2f" % health["failure_rate"],
+                    "-" if health["calibration"] is None else "%.3g" % health["calibration"],
+                    "quarantined (%s)" % health["reason"] if health["quarantined"] else "ok")
+            res += "\n"
             key = item['key'].split(':')[1]   # 'server:rasp3b` -> 'rasp3b'
             if key not in total_ct:
                 total_ct[key] = 0
@@ -276,15 +312,16 @@ class TrackerSession(object):
             max_key_len = 0
 
         res += "Queue Status\n"
-        title = ("%%-%ds" % max_key_len + "   total  free  pending\n") % 'key'
+        title = ("%%-%ds" % max_key_len + "   total  free  quarantined  pending\n") % 'key'
         separate_line = '-' * len(title) + '\n'
         res += separate_line + title + separate_line
         for k in keys:
             total = total_ct.get(k, 0)
             free, pending = queue_info[k]["free"], queue_info[k]["pending"]
+            quarantined = queue_info[k].get("quarantined", 0)
             if total or pending:
-                res += ("%%-%ds" % max_key_len + "   %-5d  %-4d  %-7d\n") % \
-                       (k, total, free, pending)
+                res += ("%%-%ds" % max_key_len + "   %-5d  %-4d  %-11d  %-7d\n") % \
+                       (k, total, free, quarantined, pending)
         res += separate_line
         return res
 
@@ -318,7 +355,9 @@ class TrackerSession(object):
                 if value[0] != base.TrackerCode.SUCCESS:
                     raise RuntimeError("Invalid return value %s" % str(value))
                 url, port, matchkey = value[1]
-                return connect(url, port, matchkey, session_timeout)
+                sess = connect(url, port, matchkey, session_timeout)
+                sess.server_addr = (url, port)
+                return sess
             except socket.error as err:
                 self.close()
                 last_err = err
@@ -328,6 +367,37 @@ class TrackerSession(object):
             "Cannot request %s after %d retry, last_error:%s" % (
                 key, max_retry, str(last_err)))
 
+    def report(self, server_addr, latency=None, success=None, calibration=None):
+        """Report the health of a server obtained from the tracker.
+
+        The tracker quarantines the servers whose reports are outliers
+        among the servers of the same key.
+
+        Parameters
+        ----------
+        server_addr : tuple of (str, int)
+            The server_addr of the session returned by request.
+
+        latency : float, optional
+            The time in seconds it took to use the server.
+
+        success : bool, optional
+            Whether the use of the server succeeded.
+
+        calibration : float, optional
+            The result of a calibration kernel, larger is better.
+
+        Returns
+        -------
+        found : bool
+            Whether the server is still registered in the tracker.
+        """
+        record = {"latency": latency, "success": success, "calibration": calibration}
+        if self._sock is None:
+            self._connect()
+        base.sendjson(self._sock, [base.TrackerCode.REPORT, list(server_addr), record])
+        return base.recvjson(self._sock) == base.TrackerCode.SUCCESS
+
     def request_and_run(self,
                         key,
                         func,
@@ -0,0 +1,145 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Periodic calibration of the devices registered in a RPC tracker.
+
+The monitor requests the free servers of a key one by one, measures the
+memory bandwidth of each device with the kernels of :any:`tvm.contrib.peak`
+and reports the results to the tracker. The tracker quarantines the
+servers whose bandwidth is far below the one of their peers.
+
+.. code-block:: python
+
+    monitor = tvm.rpc.health.HealthMonitor("localhost", 9190, "v100", "cuda")
+    monitor.start()
+"""
+import logging
+import threading
+
+from .client import connect_tracker
+
+logger = logging.getLogger("RPCTracker")
+
+
+class HealthMonitor(object):
+    """Calibrate the servers of a key at a fixed interval.
+
+    Parameters
+    ----------
+    tracker_host : str
+        The host url of the tracker.
+
+    tracker_port : int
+        The port of the tracker.
+
+    key : str
+        The device key of the servers to calibrate.
+
+    target : str or :any:`tvm.target.Target`
+        The GPU target of the devices.
+
+    target_host : str or :any:`tvm.target.Target`, optional
+        The host target.
+
+    interval : float, optional
+        The number of seconds between two calibration rounds.
+
+    priority : int, optional
+        The priority of the requests of the monitor.
+
+    n_times : int, optional
+        The number of runs of the calibration kernel.
+    """
+    def __init__(self, tracker_host, tracker_port, key, target, target_host=None,
+                 interval=600.0, priority=0, n_times=10):
+        self.tracker_host = tracker_host
+        self.tracker_port = tracker_port
+        self.key = key
+        self.target = target
+        self.target_host = target_host
+        self.interval = interval
+        self.priority = priority
+        self.n_times = n_times
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def calibrate(self, remote):
+        """Measure the memory bandwidth of a remote device.
+
+        Parameters
+        ----------
+        remote : RPCSession
+            The session of the device.
+
+        Returns
+        -------
+        gbps : float
+            The bandwidth in gigabytes per second, or -1 when the
+            calibration kernel can not be built for the target.
+        """
+        # pylint: disable=import-outside-toplevel
+        from .. import target as _target
+        from ..contrib import peak
+        target = _target.create(self.target)
+        ctx = remote.context(target.target_name, 0)
+        return peak.measure_bandwidth_sum(1 << 22, 32, 1, "float", 32, 4,
+                                          target, self.target_host, remote, ctx,
+                                          self.n_times)
+
+    def run_once(self):
+        """Calibrate the currently free servers of the key.
+
+        Returns
+        -------
+        results : dict of (str, int) to float
+            The bandwidth of each calibrated server.
+        """
+        tracker = connect_tracker(self.tracker_host, self.tracker_port)
+        queue_info = tracker.summary()["queue_info"].get(self.key, {})
+        # hold the sessions so that every request gets a different server
+        sessions = [tracker.request(self.key, priority=self.priority)
+                    for _ in range(queue_info.get("free", 0))]
+        results = {}
+        for remote in sessions:
+            gbps = self.calibrate(remote)
+            if gbps < 0:
+                logger.warning("Cannot calibrate %s with target %s", self.key, self.target)
+                continue
+            results[remote.server_addr] = gbps
+            tracker.report(remote.server_addr, calibration=gbps)
+        return results
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.run_once()
+            except (OSError, RuntimeError) as err:
+                logger.warning("Calibration of %s failed: %s", self.key, err)
+            self._stop_event.wait(self.interval)
+
+    def start(self):
+        """Start calibrating in a background thread."""
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        """Stop the background thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
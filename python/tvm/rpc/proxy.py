@@ -25,6 +25,7 @@ the proxy server will forward the message between the client and server.
 from __future__ import absolute_import
 
 import os
+import json
 import logging
 import socket
 import multiprocessing
@@ -37,6 +38,7 @@ try:
     from tornado import gen
     from tornado import websocket
     from tornado import ioloop
+    from tornado.concurrent import Future
     from . import tornado_util
 except ImportError as error_msg:
     raise ImportError(
@@ -48,8 +50,39 @@ from .server import _server_env
 from .._ffi.base import py_str
 
 
+class ForwardStats(object):
+    """Traffic statistics of a forwarded connection."""
+    def __init__(self):
+        self.start_time = time.time()
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.messages_in = 0
+        self.messages_out = 0
+        self.peak_queue_nbytes = 0
+        self.pauses = 0
+
+    def summary(self, queue_nbytes):
+        """Summary of the statistics with the current queue depth."""
+        duration = max(time.time() - self.start_time, 1e-9)
+        return {"bytes_in": self.bytes_in,
+                "bytes_out": self.bytes_out,
+                "messages_in": self.messages_in,
+                "messages_out": self.messages_out,
+                "throughput_in": self.bytes_in / duration,
+                "throughput_out": self.bytes_out / duration,
+                "queue_nbytes": queue_nbytes,
+                "peak_queue_nbytes": self.peak_queue_nbytes,
+                "pauses": self.pauses,
+                "duration": duration}
+
+
 class ForwardHandler(object):
-    """Forward handler to forward the message."""
+    """Forward handler to forward the message.
+
+    The bytes waiting to be sent to a handler are bounded by the
+    max_buffer_size of the proxy, reading from its peer is paused once
+    the bound is reached and resumed when half of it is drained.
+    """
     def _init_handler(self):
         """Initialize handler."""
         self._init_message = bytes()
@@ -64,6 +97,7 @@ class ForwardHandler(object):
         self.match_key = None
         self.forward_proxy = None
         self.alloc_time = None
+        self.stats = ForwardStats()
 
     def __del__(self):
         logging.info("Delete %s...", self.name())
@@ -97,11 +131,42 @@ class ForwardHandler(object):
         """Event when the initialization is completed"""
         self._proxy.handler_ready(self)
 
+    def queue_nbytes(self):
+        """Number of bytes waiting to be sent to this connection."""
+        raise NotImplementedError()
+
+    def forward(self, message):
+        """Send a message from the peer to this connection."""
+        self.stats.bytes_out += len(message)
+        self.stats.messages_out += 1
+        self.send_data(message)
+        queue_nbytes = self.queue_nbytes()
+        self.stats.peak_queue_nbytes = max(self.stats.peak_queue_nbytes, queue_nbytes)
+        return queue_nbytes
+
+    def on_drain(self):
+        """Resume the peer once the queue of this connection is drained enough."""
+        peer = self.forward_proxy
+        if peer and peer.reading_paused and \
+                self.queue_nbytes() <= self._proxy.max_buffer_size // 2:
+            peer.resume_reading()
+
+    def metrics(self):
+        """Traffic metrics of this connection."""
+        res = self.stats.summary(self.queue_nbytes())
+        res["name"] = self.name()
+        res["paused"] = self.reading_paused
+        return res
+
     def on_data(self, message):
         """on data"""
         assert isinstance(message, bytes)
         if self.forward_proxy:
-            self.forward_proxy.send_data(message)
+            self.stats.bytes_in += len(message)
+            self.stats.messages_in += 1
+            if self.forward_proxy.forward(message) > self._proxy.max_buffer_size:
+                self.stats.pauses += 1
+                self.pause_reading()
         else:
             while message and self._init_req_nbytes > len(self._init_message):
                 nbytes = self._init_req_nbytes - len(self._init_message)
@@ -136,12 +201,15 @@ class ForwardHandler(object):
                 self._proxy._client_pool.pop(key)
             if self._proxy._server_pool.get(key, None) == self:
                 self._proxy._server_pool.pop(key)
+        self._proxy._paired.discard(self)
         self._done = True
         self.forward_proxy = None
 
 
 class TCPHandler(tornado_util.TCPHandler, ForwardHandler):
     """Event driven TCP handler."""
+    recv_size = 64 * 1024
+
     def __init__(self, sock, addr):
         super(TCPHandler, self).__init__(sock)
         self._init_handler()
@@ -153,6 +221,12 @@ class TCPHandler(tornado_util.TCPHandler, ForwardHandler):
     def send_data(self, message, binary=True):
         self.write_message(message, True)
 
+    def queue_nbytes(self):
+        return self.pending_nbytes
+
+    def on_write_progress(self):
+        self.on_drain()
+
     def on_message(self, message):
         self.on_data(message)
 
@@ -165,25 +239,76 @@ class TCPHandler(tornado_util.TCPHandler, ForwardHandler):
 
 
 class WebSocketHandler(websocket.WebSocketHandler, ForwardHandler):
-    """Handler for websockets."""
+    """Handler for websockets.
+
+    Messages sent within one iteration of the event loop are coalesced
+    into a single frame of up to coalesce_size bytes.
+    """
+    coalesce_size = 64 * 1024
+
     def __init__(self, *args, **kwargs):
         super(WebSocketHandler, self).__init__(*args, **kwargs)
         self._init_handler()
+        self._send_buffer = []
+        self._send_nbytes = 0
+        self._inflight_nbytes = 0
+        self._flush_scheduled = False
+        self._read_resume = None
 
     def name(self):
         return "WebSocketProxy:%s" % (self.rpc_key)
 
     def on_message(self, message):
         self.on_data(message)
+        # tornado does not deliver the next message before the returned future resolves
+        return self._read_resume
 
     def data_received(self, _):
         raise NotImplementedError()
 
     def send_data(self, message):
+        self._send_buffer.append(message)
+        self._send_nbytes += len(message)
+        if self._send_nbytes >= self.coalesce_size:
+            self._flush()
+        elif not self._flush_scheduled:
+            self._flush_scheduled = True
+            ioloop.IOLoop.current().add_callback(self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        if not self._send_buffer:
+            return
+        data = b"".join(self._send_buffer)
+        self._send_buffer = []
+        self._send_nbytes = 0
         try:
-            self.write_message(message, True)
+            future = self.write_message(data, True)
         except websocket.WebSocketClosedError as err:
             self.on_error(err)
+            return
+        if future is not None:
+            self._inflight_nbytes += len(data)
+            def _on_sent(_):
+                self._inflight_nbytes -= len(data)
+                self.on_drain()
+            future.add_done_callback(_on_sent)
+
+    def queue_nbytes(self):
+        return self._send_nbytes + self._inflight_nbytes
+
+    def pause_reading(self):
+        if self._read_resume is None:
+            self._read_resume = Future()
+
+    def resume_reading(self):
+        if self._read_resume is not None:
+            future, self._read_resume = self._read_resume, None
+            future.set_result(None)
+
+    @property
+    def reading_paused(self):
+        return self._read_resume is not None
 
     def on_close(self):
         if self.forward_proxy:
@@ -217,6 +342,16 @@ class RequestHandler(tornado.web.RequestHandler):
         self.write(self.page)
 
 
+class MetricsHandler(tornado.web.RequestHandler):
+    """Serves the traffic metrics of the paired connections as json."""
+    def data_received(self, _):
+        pass
+
+    def get(self, *args, **kwargs):
+        self.set_header("Content-Type", "application/json")
+        self.write(json.dumps(ProxyServerHandler.current.metrics()))
+
+
 class ProxyServerHandler(object):
     """Internal proxy server handler class."""
     current = None
@@ -228,12 +363,17 @@ class ProxyServerHandler(object):
                  timeout_server,
                  tracker_addr,
                  index_page=None,
-                 resource_files=None):
+                 resource_files=None,
+                 max_buffer_size=4 << 20):
         assert ProxyServerHandler.current is None
         ProxyServerHandler.current = self
+        self.max_buffer_size = max_buffer_size
+        # connections that are paired up and forwarding
+        self._paired = set()
         if web_port:
             handlers = [
                 (r"/ws", WebSocketHandler),
+                (r"/metrics", MetricsHandler),
             ]
             if index_page:
                 handlers.append(
@@ -285,6 +425,8 @@ class ProxyServerHandler(object):
     def _pair_up(self, lhs, rhs):
         lhs.forward_proxy = rhs
         rhs.forward_proxy = lhs
+        self._paired.add(lhs)
+        self._paired.add(rhs)
 
         lhs.send_data(struct.pack('<i', base.RPC_CODE_SUCCESS))
         lhs.send_data(struct.pack('<i', len(rhs.rpc_key)))
@@ -429,6 +571,10 @@ class ProxyServerHandler(object):
         else:
             self._handler_ready_proxy_mode(handler)
 
+    def metrics(self):
+        """Traffic metrics of the paired connections."""
+        return [handler.metrics() for handler in self._paired]
+
     def run(self):
         """Run the proxy server"""
         ioloop.IOLoop.current().start()
@@ -441,7 +587,8 @@ def _proxy_server(listen_sock,
                   timeout_server,
                   tracker_addr,
                   index_page,
-                  resource_files):
+                  resource_files,
+                  max_buffer_size):
     handler = ProxyServerHandler(listen_sock,
                                  listen_port,
                                  web_port,
@@ -449,7 +596,8 @@ def _proxy_server(listen_sock,
                                  timeout_server,
                                  tracker_addr,
                                  index_page,
-                                 resource_files)
+                                 resource_files,
+                                 max_buffer_size)
     handler.run()
 
 
@@ -487,6 +635,15 @@ class Proxy(object):
 
     resource_files : str, optional
         Path to local resources that can be included in the http request
+
+    max_buffer_size : int, optional
+        The maximum number of bytes buffered for a connection before
+        reading from its peer is paused.
+
+    Note
+    ----
+    When web_port is set, the traffic metrics of the paired connections
+    are served as json at http://host:web_port/metrics.
     """
     def __init__(self,
                  host,
@@ -497,7 +654,8 @@ class Proxy(object):
                  timeout_server=600,
                  tracker_addr=None,
                  index_page=None,
-                 resource_files=None):
+                 resource_files=None,
+                 max_buffer_size=4 << 20):
         sock = socket.socket(base.get_addr_family((host, port)), socket.SOCK_STREAM)
         self.port = None
         for my_port in range(port, port_end):
@@ -517,7 +675,7 @@ class Proxy(object):
             target=_proxy_server,
             args=(sock, self.port, web_port,
                   timeout_client, timeout_server,
-                  tracker_addr, index_page, resource_files))
+                  tracker_addr, index_page, resource_files, max_buffer_size))
         self.proc.start()
         sock.close()
         self.host = host
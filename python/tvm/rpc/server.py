@@ -27,6 +27,8 @@ Server is TCP based with the following protocol:
 # pylint: disable=invalid-name
 import os
 import ctypes
+import hashlib
+import shutil
 import socket
 import select
 import struct
@@ -37,6 +39,8 @@ import time
 import sys
 import signal
 import platform
+import string
+import tempfile
 import tvm._ffi
 
 from tvm._ffi.base import py_str
@@ -48,7 +52,108 @@ from . base import TrackerCode
 
 logger = logging.getLogger('RPCServer')
 
-def _server_env(load_library, work_path=None):
+
+class UploadCache(object):
+    """Content addressed cache of the files uploaded to a server.
+
+    The cache is shared by all the sessions of the server, a client asks
+    for the digest of a file first and only uploads it on a miss. Entries
+    are evicted in least recently used order once the total size goes
+    above the limit.
+
+    Parameters
+    ----------
+    path : str
+        The directory holding the entries.
+
+    max_size : int
+        The maximum total size of the entries in bytes.
+    """
+    def __init__(self, path, max_size):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.max_size = max_size
+
+    def _entry_path(self, digest):
+        if len(digest) != 64 or any(c not in string.hexdigits for c in digest):
+            raise ValueError("Invalid upload digest %s" % digest)
+        return os.path.join(self.path, digest)
+
+    def lookup(self, digest, dst):
+        """Place the file with the digest at dst.
+
+        Returns
+        -------
+        hit : bool
+            Whether the file is in the cache.
+        """
+        src = self._entry_path(digest)
+        if not os.path.isfile(src):
+            return False
+        try:
+            # refresh the access time used for eviction
+            os.utime(src)
+            # copy rather than link, a later upload to dst must not
+            # overwrite the entry
+            shutil.copyfile(src, dst)
+        except OSError as err:
+            # evicted in the meantime
+            logger.warning("Failed to use cached upload %s: %s", digest, err)
+            return False
+        logger.info("upload cache hit %s", dst)
+        return True
+
+    def insert(self, digest, src):
+        """Add the uploaded file src to the cache.
+
+        The file is only added when its content matches the digest the
+        client sent, so that a client can not put a wrong file in the cache
+        of the other sessions.
+        """
+        dst = self._entry_path(digest)
+        # copy to a temporary file first so that a concurrent
+        # session never sees a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            # hash the copy, which is what later sessions get
+            sha = hashlib.sha256()
+            with os.fdopen(fd, "wb") as tmp_file, open(src, "rb") as src_file:
+                for chunk in iter(lambda: src_file.read(1 << 20), b""):
+                    sha.update(chunk)
+                    tmp_file.write(chunk)
+            if sha.hexdigest() != digest.lower():
+                logger.warning("Refuse to cache upload %s, its digest is %s",
+                               digest, sha.hexdigest())
+                return
+            os.replace(tmp_path, dst)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.path):
+            if name.endswith(".tmp"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.path, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, name in entries:
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(os.path.join(self.path, name))
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+def _server_env(load_library, work_path=None, upload_cache=None):
     """Server environment function return temp dir"""
     if work_path:
         temp = work_path
@@ -68,6 +173,15 @@ def _server_env(load_library, work_path=None):
         logger.info("load_module %s", path)
         return m
 
+    if upload_cache is not None:
+        @tvm._ffi.register_func("tvm.rpc.server.upload_cache_lookup", override=True)
+        def upload_cache_lookup(digest, file_name):
+            return upload_cache.lookup(digest, temp.relpath(file_name))
+
+        @tvm._ffi.register_func("tvm.rpc.server.upload_cache_insert", override=True)
+        def upload_cache_insert(digest, file_name):
+            upload_cache.insert(digest, temp.relpath(file_name))
+
     libs = []
     load_library = load_library.split(":") if load_library else []
     for file_name in load_library:
@@ -77,10 +191,10 @@ def _server_env(load_library, work_path=None):
     temp.libs = libs
     return temp
 
-def _serve_loop(sock, addr, load_library, work_path=None):
+def _serve_loop(sock, addr, load_library, work_path=None, upload_cache=None):
     """Server loop"""
     sockfd = sock.fileno()
-    temp = _server_env(load_library, work_path)
+    temp = _server_env(load_library, work_path, upload_cache)
     base._ServerLoop(sockfd)
     if not work_path:
         temp.remove()
@@ -94,7 +208,8 @@ def _parse_server_opt(opts):
             ret["timeout"] = float(kv[9:])
     return ret
 
-def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
+def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr,
+                 upload_cache=None):
     """Listening loop of the server master."""
     def _accept_conn(listen_sock, tracker_conn, ping_period=2):
         """Accept connection from the other places.
@@ -198,7 +313,8 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
         work_path = util.tempdir()
         logger.info("connection from %s", addr)
         server_proc = multiprocessing.Process(target=_serve_loop,
-                                              args=(conn, addr, load_library, work_path))
+                                              args=(conn, addr, load_library, work_path,
+                                                    upload_cache))
         server_proc.deamon = True
         server_proc.start()
         # close from our side.
@@ -218,7 +334,7 @@ def _listen_loop(sock, port, rpc_key, tracker_addr, load_library, custom_addr):
         work_path.remove()
 
 
-def _connect_proxy_loop(addr, key, load_library):
+def _connect_proxy_loop(addr, key, load_library, upload_cache=None):
     key = "server:" + key
     retry_count = 0
     max_retry = 5
@@ -243,7 +359,7 @@ def _connect_proxy_loop(addr, key, load_library):
             opts = _parse_server_opt(remote_key.split()[1:])
             logger.info("connected to %s", str(addr))
             process = multiprocessing.Process(
-                target=_serve_loop, args=(sock, addr, load_library))
+                target=_serve_loop, args=(sock, addr, load_library, None, upload_cache))
             process.deamon = True
             process.start()
             sock.close()
@@ -314,6 +430,14 @@ class Server(object):
 
     silent: bool, optional
         Whether run this server in silent mode.
+
+    upload_cache_size : int, optional
+        The maximum size in bytes of the content addressed cache of
+        uploaded files, zero disables the cache.
+
+    upload_cache_path : str, optional
+        The directory of the upload cache, a temporary directory
+        living as long as the server is used by default.
     """
     def __init__(self,
                  host,
@@ -325,7 +449,9 @@ class Server(object):
                  key="",
                  load_library=None,
                  custom_addr=None,
-                 silent=False):
+                 silent=False,
+                 upload_cache_size=256 << 20,
+                 upload_cache_path=None):
         try:
             if base._ServerLoop is None:
                 raise RuntimeError("Please compile with USE_RPC=1")
@@ -340,6 +466,13 @@ class Server(object):
         if silent:
             logger.setLevel(logging.ERROR)
 
+        upload_cache = None
+        if upload_cache_size and not use_popen:
+            if upload_cache_path is None:
+                self._upload_cache_dir = util.tempdir()
+                upload_cache_path = self._upload_cache_dir.temp_dir
+            upload_cache = UploadCache(upload_cache_path, upload_cache_size)
+
         if use_popen:
             cmd = [sys.executable,
                    "-m", "tvm.exec.rpc_server",
@@ -355,6 +488,9 @@ class Server(object):
                 cmd += ["--custom-addr", custom_addr]
             if silent:
                 cmd += ["--silent"]
+            cmd += ["--upload-cache-size=%d" % upload_cache_size]
+            if upload_cache_path:
+                cmd += ["--upload-cache-path", upload_cache_path]
 
             # prexec_fn is not thread safe and may result in deadlock.
             # python 3.2 introduced the start_new_session parameter as
@@ -390,12 +526,13 @@ class Server(object):
             self.proc = multiprocessing.Process(
                 target=_listen_loop, args=(
                     self.sock, self.port, key, tracker_addr, load_library,
-                    self.custom_addr))
+                    self.custom_addr, upload_cache))
             self.proc.deamon = True
             self.proc.start()
         else:
             self.proc = multiprocessing.Process(
-                target=_connect_proxy_loop, args=((host, port), key, load_library))
+                target=_connect_proxy_loop,
+                args=((host, port), key, load_library, upload_cache))
             self.proc.deamon = True
             self.proc.start()
 
@@ -28,11 +28,18 @@ class TCPHandler(object):
     sock : Socket
         The TCP socket, will set it to non-blocking mode.
     """
+    # maximum number of bytes read at once
+    recv_size = 4096
+    # small pending messages are joined into one send of up to this size
+    coalesce_size = 64 * 1024
+
     def __init__(self, sock):
         self._sock = sock
         self._ioloop = ioloop.IOLoop.current()
         self._sock.setblocking(0)
         self._pending_write = []
+        self._pending_nbytes = 0
+        self._reading = True
         self._signal_close = False
         def _event_handler(_, events):
             self._event_handler(events)
@@ -67,8 +74,56 @@ class TCPHandler(object):
         if self._sock is None:
             raise IOError("socket is already closed")
         self._pending_write.append(message)
+        self._pending_nbytes += len(message)
         self._update_write()
 
+    @property
+    def pending_nbytes(self):
+        """Number of bytes waiting to be sent."""
+        return self._pending_nbytes
+
+    def pause_reading(self):
+        """Stop reading from the socket until resume_reading is called."""
+        self._reading = False
+        self._update_events()
+
+    def resume_reading(self):
+        """Resume reading from the socket."""
+        self._reading = True
+        self._update_events()
+
+    @property
+    def reading_paused(self):
+        """Whether reading from the socket is paused."""
+        return not self._reading
+
+    def on_write_progress(self):
+        """Called when part of the pending messages has been sent."""
+
+    def _update_events(self):
+        if self._sock is None:
+            return
+        events = self._ioloop.ERROR
+        if self._reading:
+            events |= self._ioloop.READ
+        if self._pending_write:
+            events |= self._ioloop.WRITE
+        self._ioloop.update_handler(self._sock.fileno(), events)
+
+    def _coalesce_pending(self):
+        """Join the small messages at the head of the pending list."""
+        if len(self._pending_write) < 2 or len(self._pending_write[0]) >= self.coalesce_size:
+            return
+        nbytes = 0
+        count = 0
+        for msg in self._pending_write:
+            if count and nbytes + len(msg) > self.coalesce_size:
+                break
+            nbytes += len(msg)
+            count += 1
+        if count > 1:
+            self._pending_write[:count] = [b"".join(self._pending_write[:count])]
+
     def _event_handler(self, events):
         """centeral event handler"""
         if (events & self._ioloop.ERROR) or (events & self._ioloop.READ):
@@ -79,12 +134,15 @@ class TCPHandler(object):
 
     def _update_write(self):
         """Update the state on write"""
+        nbytes_before = self._pending_nbytes
         while self._pending_write:
             try:
+                self._coalesce_pending()
                 msg = self._pending_write[0]
                 if self._sock is None:
                     return
                 nsend = self._sock.send(msg)
+                self._pending_nbytes -= nsend
                 if nsend != len(msg):
                     self._pending_write[0] = msg[nsend:]
                 else:
@@ -94,20 +152,19 @@ class TCPHandler(object):
                     break
                 self.on_error(err)
 
-        if self._pending_write:
-            self._ioloop.update_handler(
-                self._sock.fileno(), self._ioloop.READ | self._ioloop.ERROR | self._ioloop.WRITE)
-        else:
-            if self._signal_close:
-                self.close()
-            else:
-                self._ioloop.update_handler(
-                    self._sock.fileno(), self._ioloop.READ | self._ioloop.ERROR)
+        if self._sock is None:
+            return
+        if not self._pending_write and self._signal_close:
+            self.close()
+            return
+        self._update_events()
+        if self._pending_nbytes < nbytes_before:
+            self.on_write_progress()
 
     def _update_read(self):
         """Update state when there is read event"""
         try:
-            msg = bytes(self._sock.recv(4096))
+            msg = bytes(self._sock.recv(self.recv_size))
             if msg:
                 self.on_message(msg)
                 return True
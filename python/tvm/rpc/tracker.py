@@ -38,10 +38,20 @@ List of available APIs:
 - REQUEST: request a new resource from tracker
   - input: [TrackerCode.REQUEST, [key, user, priority]]
   - return: [TrackerCode.SUCCESS, [url, port, match-key]]
+- REPORT: report the health of a server obtained from the tracker
+  - input: [TrackerCode.REPORT, [url, port], record]
+  - return: TrackerCode.SUCCESS
+  - note: record is a dict with the optional fields latency (seconds),
+    success (bool) and calibration (a throughput, larger is better).
+
+Servers whose failure rate, latency or calibration result is an outlier
+among the servers of the same key are quarantined for a while, the
+tracker does not hand them out to clients until the quarantine expires.
 """
 # pylint: disable=invalid-name
 
 import heapq
+import collections
 import time
 import logging
 import socket
@@ -63,6 +73,104 @@ from .base import RPC_TRACKER_MAGIC, TrackerCode
 
 logger = logging.getLogger("RPCTracker")
 
+
+class HealthPolicy(object):
+    """Policy deciding when a server is quarantined.
+
+    Parameters
+    ----------
+    window : int
+        The number of latest reports kept for each server.
+
+    min_reports : int
+        The minimum number of reports of a server before its
+        latency or failure rate is judged.
+
+    max_failure_rate : float
+        A server whose failure rate is above this value and above twice
+        the median failure rate of its peers is quarantined.
+
+    straggler_factor : float
+        A server whose median latency is this many times the median of its
+        peers, or whose calibration result is this many times lower, is quarantined.
+
+    quarantine_time : float
+        The number of seconds a server stays in quarantine.
+    """
+    def __init__(self,
+                 window=64,
+                 min_reports=5,
+                 max_failure_rate=0.5,
+                 straggler_factor=2.0,
+                 quarantine_time=300.0):
+        self.window = window
+        self.min_reports = min_reports
+        self.max_failure_rate = max_failure_rate
+        self.straggler_factor = straggler_factor
+        self.quarantine_time = quarantine_time
+
+
+def _median(values):
+    values = sorted(values)
+    mid = len(values) // 2
+    if len(values) % 2:
+        return values[mid]
+    return (values[mid - 1] + values[mid]) / 2.0
+
+
+class ServerHealth(object):
+    """Health statistics of a server, collected from the reports of its users."""
+    def __init__(self, window=64):
+        self.latencies = collections.deque(maxlen=window)
+        self.failures = collections.deque(maxlen=window)
+        self.calibration = None
+        self.quarantine_until = 0.0
+        self.reason = ""
+
+    def report(self, record):
+        """Add a report of the server."""
+        if record.get("latency") is not None:
+            self.latencies.append(float(record["latency"]))
+        if record.get("success") is not None:
+            self.failures.append(0 if record["success"] else 1)
+        if record.get("calibration") is not None:
+            self.calibration = float(record["calibration"])
+
+    def latency(self):
+        """The median latency of the latest reports."""
+        return _median(self.latencies) if self.latencies else None
+
+    def failure_rate(self):
+        """The failure rate of the latest reports."""
+        return float(sum(self.failures)) / len(self.failures) if self.failures else None
+
+    def quarantined(self):
+        """Whether the server is in quarantine."""
+        return time.time() < self.quarantine_until
+
+    def quarantine(self, duration, reason):
+        """Put the server into quarantine.
+
+        The collected reports are dropped so that the server is judged
+        on new reports once it is released.
+        """
+        self.quarantine_until = time.time() + duration
+        self.reason = reason
+        self.latencies.clear()
+        self.failures.clear()
+        self.calibration = None
+
+    def summary(self):
+        """Summary of the health of the server."""
+        quarantined = self.quarantined()
+        return {"latency": self.latency(),
+                "failure_rate": self.failure_rate(),
+                "num_reports": max(len(self.latencies), len(self.failures)),
+                "calibration": self.calibration,
+                "quarantined": quarantined,
+                "reason": self.reason if quarantined else ""}
+
+
 class Scheduler(object):
     """Abstratc interface of scheduler."""
     def put(self, value):
@@ -116,9 +224,17 @@ class PriorityScheduler(Scheduler):
         self._values = []
         self._requests = []
 
+    def _pop_healthy_value(self):
+        for i, value in enumerate(self._values):
+            if not value[0].health.quarantined():
+                return self._values.pop(i)
+        return None
+
     def _schedule(self):
-        while self._requests and self._values:
-            value = self._values.pop(0)
+        while self._requests:
+            value = self._pop_healthy_value()
+            if value is None:
+                break
             item = heapq.heappop(self._requests)
             callback = item[-1]
             if callback(value[1:]):
@@ -139,9 +255,15 @@ class PriorityScheduler(Scheduler):
             self._values.remove(value)
             self._schedule()
 
+    def schedule(self):
+        """Hand out the resources released from quarantine."""
+        self._schedule()
+
     def summary(self):
         """Get summary information of the scheduler."""
-        return {"free": len(self._values),
+        quarantined = sum(1 for value in self._values if value[0].health.quarantined())
+        return {"free": len(self._values) - quarantined,
+                "quarantined": quarantined,
                 "pending": len(self._requests)}
 
 
@@ -164,6 +286,7 @@ class TCPEventHandler(tornado_util.TCPHandler):
         self.pending_matchkeys = set()
         self._tracker._connections.add(self)
         self.put_values = []
+        self.health = ServerHealth(tracker.health_policy.window)
 
     def name(self):
         """name of connection"""
@@ -171,7 +294,11 @@ class TCPEventHandler(tornado_util.TCPHandler):
 
     def summary(self):
         """Summary of this connection"""
-        return self._info
+        if not self.put_values:
+            return self._info
+        res = dict(self._info)
+        res["health"] = self.health.summary()
+        return res
 
     def _init_conn(self, message):
         """Initialie the connection"""
@@ -268,6 +395,11 @@ class TCPEventHandler(tornado_util.TCPHandler):
         elif code == TrackerCode.SUMMARY:
             status = self._tracker.summary()
             self.ret_value([TrackerCode.SUCCESS, status])
+        elif code == TrackerCode.REPORT:
+            if self._tracker.report(tuple(args[1]), args[2]):
+                self.ret_value(TrackerCode.SUCCESS)
+            else:
+                self.ret_value(TrackerCode.FAIL)
         else:
             logger.warning("Unknown tracker code %d", code)
             self.close()
@@ -282,8 +414,11 @@ class TCPEventHandler(tornado_util.TCPHandler):
 
 class TrackerServerHandler(object):
     """Tracker that tracks the resources."""
-    def __init__(self, sock, stop_key):
+    def __init__(self, sock, stop_key, health_policy=None):
         self._scheduler_map = {}
+        # (url, port) -> (key, connection) of each registered server
+        self._servers = {}
+        self.health_policy = health_policy or HealthPolicy()
         self._sock = sock
         self._sock.setblocking(0)
         self._ioloop = ioloop.IOLoop.current()
@@ -311,6 +446,7 @@ class TrackerServerHandler(object):
         """Report a new resource to the tracker."""
         if key not in self._scheduler_map:
             self._scheduler_map[key] = self.create_scheduler(key)
+        self._servers[(value[1], value[2])] = (key, value[0])
         self._scheduler_map[key].put(value)
 
     def request(self, key, user, priority, callback):
@@ -319,8 +455,84 @@ class TrackerServerHandler(object):
             self._scheduler_map[key] = self.create_scheduler(key)
         self._scheduler_map[key].request(user, priority, callback)
 
+    def report(self, addr, record):
+        """Report the health of a server.
+
+        Parameters
+        ----------
+        addr : tuple of (str, int)
+            The url and port of the server returned by the request.
+
+        record : dict
+            The health record.
+
+        Returns
+        -------
+        found : bool
+            Whether the server is registered.
+        """
+        if addr not in self._servers:
+            return False
+        key, conn = self._servers[addr]
+        conn.health.report(record)
+        self._check_health(key)
+        return True
+
+    def _check_health(self, key):
+        """Quarantine the outliers among the healthy servers of a key."""
+        policy = self.health_policy
+        peers = [conn for k, conn in self._servers.values()
+                 if k == key and not conn.health.quarantined()]
+
+        def _peer_median(conn, stat):
+            values = [stat(peer.health) for peer in peers if peer is not conn]
+            values = [x for x in values if x is not None]
+            return _median(values) if values else None
+
+        def _judged_stat(attr, getter):
+            def _stat(health):
+                if len(getattr(health, attr)) < policy.min_reports:
+                    return None
+                return getter(health)
+            return _stat
+
+        failure_stat = _judged_stat("failures", ServerHealth.failure_rate)
+        latency_stat = _judged_stat("latencies", ServerHealth.latency)
+
+        for conn in list(peers):
+            # never quarantine the last healthy server of a key
+            if len(peers) <= 1:
+                break
+            health = conn.health
+            reason = None
+            failure_rate = failure_stat(health)
+            if failure_rate is not None and failure_rate > policy.max_failure_rate:
+                median = _peer_median(conn, failure_stat)
+                if median is None or failure_rate > 2 * median:
+                    reason = "failure rate %.2f" % failure_rate
+            latency = latency_stat(health)
+            if reason is None and latency is not None:
+                median = _peer_median(conn, latency_stat)
+                if median is not None and latency > policy.straggler_factor * median:
+                    reason = "latency %.3g s, peer median %.3g s" % (latency, median)
+            if reason is None and health.calibration is not None:
+                median = _peer_median(conn, lambda h: h.calibration)
+                if median is not None and \
+                        health.calibration * policy.straggler_factor < median:
+                    reason = "calibration %.3g, peer median %.3g" % (
+                        health.calibration, median)
+            if reason is not None:
+                logger.warning("Quarantine %s for %g seconds: %s",
+                               conn.name(), policy.quarantine_time, reason)
+                health.quarantine(policy.quarantine_time, reason)
+                peers.remove(conn)
+                self._ioloop.call_later(policy.quarantine_time,
+                                        self._scheduler_map[key].schedule)
+
     def close(self, conn):
         self._connections.remove(conn)
+        for addr in [addr for addr, (_, c) in self._servers.items() if c is conn]:
+            del self._servers[addr]
         if 'key' in conn._info:
             key = conn._info['key'].split(':')[1]  # 'server:rasp3b' -> 'rasp3b'
             for value in conn.put_values:
@@ -350,8 +562,8 @@ class TrackerServerHandler(object):
         """Run the tracker server"""
         self._ioloop.start()
 
-def _tracker_server(listen_sock, stop_key):
-    handler = TrackerServerHandler(listen_sock, stop_key)
+def _tracker_server(listen_sock, stop_key, health_policy):
+    handler = TrackerServerHandler(listen_sock, stop_key, health_policy)
     handler.run()
 
 
@@ -373,12 +585,16 @@ class Tracker(object):
 
     silent: bool, optional
         Whether run in silent mode
+
+    health_policy : HealthPolicy, optional
+        The policy to quarantine unhealthy servers.
     """
     def __init__(self,
                  host,
                  port=9190,
                  port_end=9199,
-                 silent=False):
+                 silent=False,
+                 health_policy=None):
         if silent:
             logger.setLevel(logging.WARN)
 
@@ -399,7 +615,7 @@ class Tracker(object):
         logger.info("bind to %s:%d", host, self.port)
         sock.listen(1)
         self.proc = multiprocessing.Process(
-            target=_tracker_server, args=(sock, self.stop_key))
+            target=_tracker_server, args=(sock, self.stop_key, health_policy))
         self.proc.start()
         self.host = host
         # close the socket on this process
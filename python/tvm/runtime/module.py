@@ -18,7 +18,9 @@
 # pylint: disable=invalid-name, unused-import, import-outside-toplevel
 """Runtime Module namespace."""
 import ctypes
+import math
 import struct
+import time
 from collections import namedtuple
 
 import tvm._ffi
@@ -32,6 +34,66 @@ from . import _ffi_api
 # profile result of time evaluator
 ProfileResult = namedtuple("ProfileResult", ["mean", "results"])
 
+# profile result of adaptive time evaluator
+AdaptiveProfileResult = namedtuple(
+    "AdaptiveProfileResult",
+    ["mean", "results", "median", "iqr", "ci", "num_outliers", "unstable"])
+
+
+def _normal_ppf(prob):
+    """Inverse of the standard normal cumulative distribution function."""
+    low, high = -10.0, 10.0
+    for _ in range(100):
+        mid = (low + high) / 2
+        if 0.5 * (1 + math.erf(mid / math.sqrt(2))) < prob:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+def _quantile(sorted_costs, q):
+    """Linearly interpolated quantile of sorted values."""
+    pos = (len(sorted_costs) - 1) * q
+    lower = int(math.floor(pos))
+    upper = min(lower + 1, len(sorted_costs) - 1)
+    return sorted_costs[lower] + (sorted_costs[upper] - sorted_costs[lower]) * (pos - lower)
+
+
+def summarize_costs(costs, confidence=0.95):
+    """Compute robust statistics of time costs.
+
+    Parameters
+    ----------
+    costs : list of float
+        The measured costs.
+
+    confidence : float, optional
+        The confidence level of the interval on the median.
+
+    Returns
+    -------
+    result : AdaptiveProfileResult
+        The mean of the costs within the Tukey fences (1.5 IQR beyond
+        the quartiles), the median, the interquartile range, the
+        distribution-free confidence interval on the median and the
+        number of costs outside of the fences. unstable is left False.
+    """
+    data = sorted(costs)
+    num = len(data)
+    median = _quantile(data, 0.5)
+    q1, q3 = _quantile(data, 0.25), _quantile(data, 0.75)
+    iqr = q3 - q1
+    inliers = [x for x in data if q1 - 1.5 * iqr <= x <= q3 + 1.5 * iqr]
+    # order statistics bounding the median, from the normal
+    # approximation of the binomial distribution.
+    half_width = _normal_ppf(0.5 + confidence / 2) * math.sqrt(num) / 2
+    lower = max(int(math.floor(num / 2.0 - half_width)), 0)
+    upper = min(int(math.ceil(num / 2.0 + half_width)), num - 1)
+    return AdaptiveProfileResult(mean=sum(inliers) / len(inliers), results=tuple(costs),
+                                 median=median, iqr=iqr, ci=(data[lower], data[upper]),
+                                 num_outliers=num - len(inliers), unstable=False)
+
 
 class Module(object):
     """Runtime Module."""
@@ -223,6 +285,76 @@ class Module(object):
         except NameError:
             raise NameError("time_evaluate is only supported when RPC is enabled")
 
+    def adaptive_time_evaluator(self, func_name, ctx, number=10, min_repeat_ms=0,
+                                min_repeat=5, max_repeat=100, batch=5,
+                                rel_ci=0.05, confidence=0.95, time_budget=10.0):
+        """Get an evaluator that measures time cost of running function
+        until the estimate of the median is precise enough.
+
+        The costs are measured in batches of `batch` repeats, each one being
+        an average of `number` runs as in :py:meth:`time_evaluator`. The
+        measurement stops when the confidence interval on the median is
+        within `rel_ci` of the median, or when `max_repeat` costs have been
+        measured, or when `time_budget` is spent.
+
+        Parameters
+        ----------
+        func_name: str
+            The name of the function in the module.
+
+        ctx: TVMContext
+            The context we should run this function on.
+
+        number: int
+            The number of times to run this function for taking average.
+
+        min_repeat_ms: int, optional
+            The minimum duration of one `repeat` in milliseconds.
+
+        min_repeat: int, optional
+            The minimum number of costs measured.
+
+        max_repeat: int, optional
+            The maximum number of costs measured.
+
+        batch: int, optional
+            The number of costs measured between two checks.
+
+        rel_ci: float, optional
+            The target width of the confidence interval relative to the median.
+
+        confidence: float, optional
+            The confidence level of the interval.
+
+        time_budget: float, optional
+            The time after which the measurement stops, in seconds.
+
+        Returns
+        -------
+        ftimer : function
+            The function that takes same argument as func and returns an
+            AdaptiveProfileResult, see :py:func:`summarize_costs`. Its mean
+            excludes the outliers, and unstable is set when the confidence
+            interval did not get narrow enough.
+        """
+        feval = self.time_evaluator(func_name, ctx, number=number, repeat=batch,
+                                    min_repeat_ms=min_repeat_ms)
+
+        def evaluator(*args):
+            """Internal wrapped evaluator."""
+            costs = []
+            start = time.time()
+            while True:
+                costs.extend(feval(*args).results)
+                res = summarize_costs(costs, confidence)
+                converged = res.ci[1] - res.ci[0] <= rel_ci * res.median
+                if len(costs) >= min_repeat and converged:
+                    return res
+                if len(costs) >= max_repeat or time.time() - start >= time_budget:
+                    return res._replace(unstable=not converged)
+
+        return evaluator
+
     def _collect_dso_modules(self):
         """Helper function to collect dso modules, then return it."""
         visited, stack, dso_modules = set(), [], []
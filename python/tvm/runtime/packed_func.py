@@ -27,11 +27,13 @@ try:
     from tvm._ffi._cy3.core import _set_class_packed_func, _set_class_module
     from tvm._ffi._cy3.core import PackedFuncBase
     from tvm._ffi._cy3.core import convert_to_tvm_func
+    from tvm._ffi._cy3.core import _set_release_gil
 except (RuntimeError, ImportError):
     # pylint: disable=wrong-import-position
     from tvm._ffi._ctypes.packed_func import _set_class_packed_func, _set_class_module
     from tvm._ffi._ctypes.packed_func import PackedFuncBase
     from tvm._ffi._ctypes.packed_func import convert_to_tvm_func
+    from tvm._ffi._ctypes.packed_func import _set_release_gil
 
 
 PackedFuncHandle = ctypes.c_void_p
@@ -61,3 +63,28 @@ class PackedFunc(PackedFuncBase):
     """
 
 _set_class_packed_func(PackedFunc)
+
+
+class ReleaseGIL(object):
+    """Release the GIL during the packed function calls of the current thread.
+
+    Other python threads can then run while long calls such as code
+    generation are in progress. Python callbacks invoked by the calls
+    acquire the GIL again before running.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with tvm.runtime.packed_func.ReleaseGIL():
+            rt_mod = tvm.build(mod, target="llvm")
+    """
+    def __init__(self):
+        self._old_release = False
+
+    def __enter__(self):
+        self._old_release = _set_release_gil(True)
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        _set_release_gil(self._old_release)
@@ -20,6 +20,9 @@ The Relay Virtual Machine profiler.
 
 Provides extra APIs for profiling vm execution.
 """
+import json
+
+import numpy as np
 from tvm.runtime import _ffi_api
 from . import vm
 
@@ -28,16 +31,31 @@ def enabled():
     return hasattr(_ffi_api, "_VirtualMachineDebug")
 
 class VirtualMachineProfiler(vm.VirtualMachine):
-    """Relay profile VM runtime."""
-    def __init__(self, mod):
+    """Relay profile VM runtime.
+
+    Parameters
+    ----------
+    mod : tvm.runtime.Module or Executable
+        The VM executable.
+
+    window : int, optional
+        The number of most recent packed function calls and allocations
+        kept for the percentiles and the trace. The call counts and
+        cumulative times always cover every call since the last reset.
+        0 keeps all the events, long running services should set a window.
+    """
+    def __init__(self, mod, window=0):
         super(VirtualMachineProfiler, self).__init__(mod)
         m = mod.module if isinstance(mod, vm.Executable) else mod
         self.mod = _ffi_api._VirtualMachineDebug(m)
         self._init = self.mod["init"]
         self._invoke = self.mod["invoke"]
         self._get_stat = self.mod["get_stat"]
+        self._get_events = self.mod["get_events"]
+        self._set_window = self.mod["set_window"]
         self._set_input = self.mod["set_input"]
         self._reset = self.mod["reset"]
+        self.set_window(window)
 
     def get_stat(self, sort_by_time=True):
         """Get the statistics of executed ops.
@@ -55,5 +73,116 @@ class VirtualMachineProfiler(vm.VirtualMachine):
         """
         return self._get_stat(sort_by_time)
 
+    def set_window(self, window):
+        """Set the number of recent events kept.
+
+        Parameters
+        ----------
+        window : int
+            The number of events kept, 0 keeps all of them.
+        """
+        self._set_window(window)
+
+    def get_events(self):
+        """Get the raw profiling data.
+
+        Returns
+        -------
+        events : dict
+            The packed function names by index under "ops", the cumulative
+            [count, total, min, max] times of each of them under "op_stats",
+            the [packed index, start, duration] packed function calls under
+            "calls", the [start, duration, bytes, device type] allocations
+            under "allocs" and the cumulative [count, bytes, time] of the
+            allocations under "alloc_stats". Times are in microseconds
+            since the last reset.
+        """
+        return json.loads(self._get_events())
+
+    def get_stats(self, sort_by_time=True):
+        """Get the statistics of the executed packed functions.
+
+        Parameters
+        ----------
+        sort_by_time: Optional[Boolean]
+           Whether the records are sorted by cumulative time in descending order.
+
+        Returns
+        -------
+        stats : numpy.recarray
+            One record for each called packed function, with the fields name,
+            count, total_us, mean_us, min_us and max_us covering every call,
+            and p50_us, p90_us and p99_us computed over the calls in the window.
+        """
+        events = self.get_events()
+        samples = {}
+        for index, _, duration in events["calls"]:
+            samples.setdefault(str(index), []).append(duration)
+        op_stats = events["op_stats"]
+        indices = list(op_stats.keys())
+        if sort_by_time:
+            indices.sort(key=lambda index: op_stats[index][1], reverse=True)
+        names = [events["ops"][index] for index in indices]
+        dtype = [("name", "U%d" % max([len(name) for name in names] + [1])),
+                 ("count", "i8")]
+        dtype += [(field, "f8") for field in ("total_us", "mean_us", "min_us", "max_us",
+                                              "p50_us", "p90_us", "p99_us")]
+        stats = np.recarray((len(indices),), dtype=dtype)
+        for i, index in enumerate(indices):
+            count, total, min_value, max_value = op_stats[index]
+            if index in samples:
+                percentiles = np.percentile(samples[index], [50, 90, 99])
+            else:
+                percentiles = [np.nan] * 3
+            stats[i] = (names[i], count, total, total / count, min_value, max_value,
+                        percentiles[0], percentiles[1], percentiles[2])
+        return stats
+
+    def get_alloc_stats(self):
+        """Get the statistics of the storage allocations.
+
+        Returns
+        -------
+        stats : dict
+            The number of allocations "count", the allocated "bytes" and the
+            time spent allocating "total_us" since the last reset, and the
+            same numbers for the allocations in the window under
+            "window_count", "window_bytes" and "window_us".
+        """
+        events = self.get_events()
+        count, nbytes, total = events["alloc_stats"]
+        allocs = events["allocs"]
+        return {
+            "count": count,
+            "bytes": nbytes,
+            "total_us": total,
+            "window_count": len(allocs),
+            "window_bytes": sum(alloc[2] for alloc in allocs),
+            "window_us": sum(alloc[1] for alloc in allocs),
+        }
+
+    def dump_chrome_trace(self, path):
+        """Dump the packed function calls and allocations in the window
+        to a file in the Chrome trace format.
+
+        Parameters
+        ----------
+        path : str
+            The path of the trace file.
+        """
+        events = self.get_events()
+        trace = []
+        for index, start, duration in events["calls"]:
+            trace.append(dict(name=events["ops"][str(index)], cat="op", ph="X",
+                              ts=start, dur=duration, pid=1, tid=1))
+        for start, duration, nbytes, device_type in events["allocs"]:
+            trace.append(dict(name="alloc_storage", cat="memory", ph="X",
+                              ts=start, dur=duration, pid=1, tid=2,
+                              args=dict(bytes=nbytes, device_type=device_type)))
+        trace.sort(key=lambda e: e["ts"])
+        with open(path, "w") as trace_f:
+            json.dump(dict(displayTimeUnit="ns", traceEvents=trace), trace_f)
+
     def reset(self):
+        """Clear the statistics and the events."""
         self._reset()
@@ -20,12 +20,17 @@ The Relay Virtual Machine runtime.
 
 Implements a Python interface to executing the compiled VM object.
 """
+import queue
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import numpy as np
 
 import tvm
 from tvm._ffi.runtime_ctypes import TVMByteArray
 from tvm._ffi import base as _base
 from .object import Object
+from .packed_func import ReleaseGIL
 from . import _ffi_api, container
 
 def _convert(arg, cargs):
@@ -62,7 +67,9 @@ class Executable(object):
     def __init__(self, mod):
         self.mod = mod
         self._function_params = {}
+        self._function_param_index = {}
         self._save = self.mod["save"]
+        self._save_to_file = self.mod["save_to_file"]
         self._get_lib = self.mod["get_lib"]
         self._get_bytecode = self.mod["get_bytecode"]
         self._get_stats = self.mod["get_stats"]
@@ -165,6 +172,50 @@ from tvm import te
 
         return Executable(_ffi_api.Load_Executable(bytecode, lib))
 
+    def save_file(self, path, alignment=64):
+        """Save the Relay VM Executable to a memory-mappable file.
+
+        Unlike :py:meth:`save`, the constants are stored after the code with
+        every one of them aligned, so :py:meth:`load_file` can map the file
+        instead of reading it. The library is not included, it has to be
+        exported separately.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        alignment : int, optional
+            The alignment of the constants in bytes, must be a power of two.
+        """
+        self._save_to_file(path, alignment)
+
+    @staticmethod
+    def load_file(path, lib):
+        """Load an executable saved by :py:meth:`save_file`.
+
+        The file is memory mapped. The constants are created on first use
+        as CPU arrays pointing to the mapping, so the processes loading the
+        same file share its pages instead of holding a private copy.
+
+        Parameters
+        ----------
+        path : str
+            The path of the file.
+
+        lib : :py:class:`~tvm.runtime.Module`
+            The runtime module that contains the generated code.
+
+        Returns
+        -------
+        exec: Executable
+            An executable constructed using the provided artifacts.
+        """
+        if lib is not None and not isinstance(lib, tvm.runtime.Module):
+            raise TypeError("lib is expected to be the type of tvm.runtime.Module" +
+                            ", but received {}".format(type(lib)))
+        return Executable(_ffi_api.Load_Executable_File(path, lib))
+
     @property
     def lib(self):
         """Get the library that contains hardware dependent code.
@@ -269,6 +320,14 @@ from tvm import te
         self._function_params[func_name] = params
         return params
 
+    def get_function_param_index(self, func_name):
+        """Get the mapping from the parameter names of a VM Function to
+        their positions."""
+        if func_name not in self._function_param_index:
+            self._function_param_index[func_name] = {
+                name: i for i, name in enumerate(self.get_function_params(func_name))}
+        return self._function_param_index[func_name]
+
 
 class VirtualMachine(object):
     """Relay VM runtime."""
@@ -309,12 +368,13 @@ class VirtualMachine(object):
             Named arguments to the function.
         """
         if kwargs:
-            func_params = self._exec.get_function_params(func_name)
-            new_args = [None] * len(func_params)
-            assert len(args) + len(kwargs) == len(func_params)
+            param_index = self._exec.get_function_param_index(func_name)
+            new_args = [None] * len(param_index)
+            assert len(args) + len(kwargs) == len(param_index)
             for k in kwargs:
-                idx = func_params.index(k)
-                new_args[idx] = kwargs[k]
+                if k not in param_index:
+                    raise ValueError("%s is not a parameter of %s" % (k, func_name))
+                new_args[param_index[k]] = kwargs[k]
             idx = 0
             for i, arg in enumerate(new_args):
                 if arg is None:
@@ -364,3 +424,130 @@ class VirtualMachine(object):
             The output.
         """
         return self.invoke("main", *args, **kwargs)
+
+
+class VirtualMachinePool(object):
+    """A pool of Relay VMs sharing one executable, running independent
+    requests concurrently.
+
+    Every request is run on a VM of the pool that is not busy, so the
+    number of requests executing at the same time is bounded by the size
+    of the pool.
+
+    Parameters
+    ----------
+    exe : Executable
+        The executable shared by the VMs.
+
+    ctx : :py:class:`TVMContext`
+        The runtime context to run the code on.
+
+    size : int, optional
+        The number of VMs.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        with tvm.runtime.vm.VirtualMachinePool(exe, tvm.cpu(), size=4) as pool:
+            futures = pool.invoke_batch([{"data": x} for x in inputs])
+            outputs = [f.result() for f in futures]
+            latencies = [f.latency for f in futures]
+    """
+    def __init__(self, exe, ctx, size=4):
+        if not isinstance(exe, Executable):
+            raise TypeError("exe is expected to be the type of Executable, " +
+                            "but received {}".format(type(exe)))
+        self._exec = exe
+        self._vms = queue.Queue()
+        for _ in range(size):
+            vm = VirtualMachine(exe)
+            vm.init(ctx)
+            self._vms.put(vm)
+        self._executor = ThreadPoolExecutor(max_workers=size)
+
+    def _run(self, future, submit_time, func_name, args, kwargs):
+        if not future.set_running_or_notify_cancel():
+            return
+        vm = self._vms.get()
+        try:
+            start = time.time()
+            # let the other VMs of the pool run during the call
+            with ReleaseGIL():
+                result = vm.invoke(func_name, *args, **kwargs)
+            end = time.time()
+        except Exception as err:  # pylint: disable=broad-except
+            future.set_exception(err)
+            return
+        finally:
+            self._vms.put(vm)
+        future.run_time = end - start
+        future.latency = end - submit_time
+        future.set_result(result)
+
+    def submit(self, func_name, *args, **kwargs):
+        """Invoke a function asynchronously.
+
+        Parameters
+        ----------
+        func_name : str
+            The name of the function.
+
+        args : list[tvm.runtime.NDArray] or list[np.ndarray]
+            The arguments to the function.
+
+        kwargs: dict of str to tvm.runtime.NDArray or np.ndarray
+            Named arguments to the function.
+
+        Returns
+        -------
+        future : concurrent.futures.Future
+            The future of the output. Once done, its latency attribute holds
+            the seconds elapsed since the submission and its run_time
+            attribute the seconds spent in the VM.
+        """
+        future = Future()
+        self._executor.submit(self._run, future, time.time(), func_name, args, kwargs)
+        return future
+
+    def invoke_batch(self, requests, func_name="main"):
+        """Invoke a function on a list of independent requests.
+
+        Parameters
+        ----------
+        requests : list
+            The arguments of each request, either a list of positional
+            arguments or a dict of named arguments.
+
+        func_name : str, optional
+            The name of the function.
+
+        Returns
+        -------
+        futures : list[concurrent.futures.Future]
+            The future of the output of each request, see :py:meth:`submit`.
+        """
+        futures = []
+        for request in requests:
+            if isinstance(request, dict):
+                futures.append(self.submit(func_name, **request))
+            else:
+                futures.append(self.submit(func_name, *request))
+        return futures
+
+    def shutdown(self, wait=True):
+        """Stop accepting requests.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Whether to wait for the pending requests to finish.
+        """
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        self.shutdown()
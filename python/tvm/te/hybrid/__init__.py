@@ -33,16 +33,18 @@ import tvm._ffi
 from tvm.driver.build_module import form_body
 from tvm._ffi.base import decorate
 
+from .emulator import Emulator
 from .module import HybridModule
-from .parser import source_to_op
-from .util import _pruned_source
+from .parser import source_to_op, func_to_op
 
 
 def script(pyfunc):
     """Decorate a python function function as hybrid script.
 
     The hybrid function support emulation mode and parsing to
-    the internal language IR.
+    the internal language IR. The function is parsed once per signature
+    of tvm arguments, see func_to_op. Inside an Emulator, calls with numpy
+    arguments run as compiled kernels instead of being emulated in Python.
 
     Returns
     -------
@@ -53,16 +55,17 @@ def script(pyfunc):
     def wrapped_func(func, *args, **kwargs):
         from .util import _is_tvm_arg_types
         if _is_tvm_arg_types(args):
-            src = _pruned_source(func)
-            closure_vars = inspect.getclosurevars(func).nonlocals
-            closure_vars.update(inspect.getclosurevars(func).globals)
-            return source_to_op(src, args, func.__globals__, closure_vars)
-
-        from .runtime import _enter_hybrid_runtime, _restore_runtime
-        intersect = _enter_hybrid_runtime(func)
-        value = func(*args, **kwargs)
-        _restore_runtime(func, intersect)
-        return value
+            captured = inspect.getclosurevars(func)
+            closure_vars = dict(captured.nonlocals)
+            closure_vars.update(captured.globals)
+            return func_to_op(func, args, closure_vars)
+
+        emulator = Emulator.current()
+        if emulator is not None and not kwargs:
+            return emulator.run(func, args)
+
+        from .runtime import _emulate
+        return _emulate(func, args, kwargs)
 
     return decorate(pyfunc, wrapped_func)
 
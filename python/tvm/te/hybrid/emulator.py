@@ -0,0 +1,166 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Compiled emulation of hybrid script functions called with numpy arguments"""
+import inspect
+import threading
+
+import numpy
+
+import tvm
+from tvm import te
+from tvm._ffi.base import numeric_types
+
+from .parser import source_to_op
+from .runtime import _emulate
+from .util import _parsed_source, _closure_key
+
+_SCALAR_TYPES = numeric_types + (numpy.number, numpy.bool_)
+
+_EMULATOR_STATE = threading.local()
+
+
+def _scalar_dtype(value):
+    if isinstance(value, bool):
+        return 'bool'
+    if isinstance(value, int):
+        return 'int32'
+    if isinstance(value, float):
+        return 'float32'
+    return str(numpy.asarray(value).dtype)
+
+
+class Emulator(object):
+    """Run hybrid script functions called with numpy arguments as compiled kernels.
+
+    A hybrid script function called with numpy arguments is emulated by
+    running its body as Python code, which is slow for realistic sizes.
+    Inside an Emulator, the function is instead parsed to a HybridOp with
+    placeholders of the argument shapes and dtypes, built for the target,
+    and the kernel is called. Kernels are cached per function, argument
+    shapes, dtypes and scalar values, and captured variables.
+
+    Scalar arguments are baked into the kernel as constants. Arrays are
+    copied to the device, so in-place updates of the arguments are not
+    visible to the caller. Calls with other arguments, e.g. lists of
+    arrays, are emulated in Python.
+
+    An emulator only applies to the thread that entered it.
+
+    Parameters
+    ----------
+    target : str or tvm.target.Target, optional
+        The target the kernels are built for.
+
+    Example
+    -------
+    .. code-block:: python
+
+        with tvm.te.hybrid.Emulator():
+            out = my_hybrid_func(numpy_a, numpy_b)
+    """
+    def __init__(self, target="llvm"):
+        self.target = target
+        self.num_builds = 0
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _stack():
+        if not hasattr(_EMULATOR_STATE, "stack"):
+            _EMULATOR_STATE.stack = []
+        return _EMULATOR_STATE.stack
+
+    @staticmethod
+    def current():
+        """Get the emulator entered in the current thread.
+
+        Returns
+        -------
+        emulator : Emulator or None
+            The innermost emulator, or None outside of emulators.
+        """
+        stack = Emulator._stack()
+        return stack[-1] if stack else None
+
+    def __enter__(self):
+        Emulator._stack().append(self)
+        return self
+
+    def __exit__(self, ptype, value, trace):
+        Emulator._stack().pop()
+
+    def _build(self, func, args, closure_vars):
+        inputs = []
+        op_args = []
+        for i, arg in enumerate(args):
+            if isinstance(arg, numpy.ndarray):
+                tensor = te.placeholder(arg.shape, dtype=str(arg.dtype), name="arg%d" % i)
+                inputs.append(tensor)
+                op_args.append(tensor)
+            else:
+                op_args.append(tvm.runtime.const(arg, _scalar_dtype(arg)))
+        outs = source_to_op(_parsed_source(func), op_args, func.__globals__, closure_vars)
+        outs = outs if isinstance(outs, list) else [outs]
+        sch = te.create_schedule([out.op for out in outs])
+        mod = tvm.build(sch, inputs + outs, target=self.target)
+        out_types = [(tuple(int(dim) for dim in out.shape), out.dtype) for out in outs]
+        return mod, out_types
+
+    def run(self, func, args, closure_vars=None):
+        """Run a hybrid script function on numpy arguments.
+
+        Parameters
+        ----------
+        func : function
+            The undecorated hybrid script function.
+
+        args : list of numpy.ndarray or numbers
+            The arguments. Calls with arguments of other types are emulated
+            in Python.
+
+        closure_vars : dict, optional
+            The variables captured by the function, looked up when not given.
+
+        Returns
+        -------
+        res : numpy.ndarray or tuple of numpy.ndarray
+            The outputs of the function.
+        """
+        if not all(isinstance(arg, (numpy.ndarray,) + _SCALAR_TYPES) for arg in args):
+            return _emulate(func, args)
+        if closure_vars is None:
+            captured = inspect.getclosurevars(func)
+            closure_vars = dict(captured.nonlocals)
+            closure_vars.update(captured.globals)
+        signature = tuple((arg.shape, str(arg.dtype)) if isinstance(arg, numpy.ndarray)
+                          else (_scalar_dtype(arg), arg) for arg in args)
+        key = (func.__code__, signature, _closure_key(closure_vars))
+        with self._lock:
+            entry = self._cache.get(key)
+        if entry is None:
+            entry = self._build(func, args, closure_vars)
+            with self._lock:
+                self._cache[key] = entry
+                self.num_builds += 1
+
+        mod, out_types = entry
+        ctx = tvm.context(str(self.target), 0)
+        nd_args = [tvm.nd.array(arg, ctx) for arg in args if isinstance(arg, numpy.ndarray)]
+        nd_outs = [tvm.nd.empty(shape, dtype, ctx) for shape, dtype in out_types]
+        mod(*(nd_args + nd_outs))
+        res = [out.asnumpy() for out in nd_outs]
+        return res[0] if len(res) == 1 else tuple(res)
@@ -658,3 +658,147 @@ def source_to_op(src, args, symbols, closure_vars):
                                   parser.outputs, parser.parsed_body)
     res = [op.output(i) for i in range(len(parser.outputs))]
     return res[0] if len(res) == 1 else res
+
+
+# HybridOp templates of hybrid functions serialized to json, keyed by the code
+# object of the function and then by the signature of the call
+_OP_TEMPLATES = {}
+
+
+def _signature(args, closure_vars):
+    """Get a hashable key of the arguments a hybrid function is called with.
+
+    Symbolic variables are keyed by the position of their first occurrence,
+    so that a template can be instantiated for other variables. Returns None
+    together with an empty list when the call cannot be cached.
+    """
+    var_index = {}
+    variables = []
+    op_set = set()
+
+    def _var_key(var):
+        if var not in var_index:
+            var_index[var] = len(variables)
+            variables.append(var)
+        return ('var', var.dtype, var_index[var])
+
+    def _dim_key(dim):
+        if isinstance(dim, _expr.IntImm):
+            return dim.value
+        if isinstance(dim, _expr.Var):
+            return _var_key(dim)
+        return None
+
+    def _arg_key(arg):
+        if isinstance(arg, Tensor):
+            # inputs are replaced per operation, so every operation must occur once
+            if arg.op in op_set:
+                return None
+            op_set.add(arg.op)
+            dims = tuple(_dim_key(dim) for dim in arg.shape)
+            return None if None in dims else ('tensor', arg.dtype, dims)
+        if isinstance(arg, Array):
+            keys = tuple(_arg_key(x) for x in arg)
+            return None if None in keys else ('array',) + keys
+        if isinstance(arg, _expr.Var):
+            return _var_key(arg)
+        if isinstance(arg, _expr.ConstExpr):
+            return (type(arg).__name__, arg.dtype, arg.value)
+        return None
+
+    def _is_tvm_object(value):
+        if isinstance(value, (list, tuple)):
+            return any(_is_tvm_object(x) for x in value)
+        return isinstance(value, tvm.runtime.Object)
+
+    if any(_is_tvm_object(value) for value in closure_vars.values()):
+        return None, []
+    keys = tuple(_arg_key(arg) for arg in args)
+    if None in keys:
+        return None, []
+    target = tvm.target.Target.current(allow_none=True)
+    return (keys, util._closure_key(closure_vars), str(target)), variables
+
+
+def _make_template(op, variables):
+    """Serialize a HybridOp as a template, with placeholders for its inputs.
+
+    Replacing the inputs keeps the operations computing them, and everything
+    upstream of those, out of the template.
+    """
+    rmap = {}
+    inputs = []
+    for tensor in op.inputs:
+        ph = tvm.te.placeholder(tensor.shape, dtype=tensor.dtype, name=tensor.op.name)
+        rmap[tensor.op] = ph
+        inputs.append(ph)
+    body = util.replace_io(op.body, rmap)
+    template = tvm.te._ffi_api.HybridOp(op.name, "HybridOp", None, inputs,
+                                        op.outputs, body)
+    return tvm.ir.save_json(tvm.runtime.convert([variables, template]))
+
+
+def _instantiate(template, variables, args):
+    """Instantiate a serialized HybridOp template for the given arguments."""
+    template_vars, op = tvm.ir.load_json(template)
+    vmap = {var: new_var for var, new_var in zip(template_vars, variables)}
+    body = _ir_pass.Substitute(op.body, vmap) if vmap else op.body
+
+    input_tensors = []
+    def get_input_tensors(arg):
+        if isinstance(arg, Tensor):
+            input_tensors.append(arg)
+        elif isinstance(arg, Array):
+            for i in arg:
+                get_input_tensors(i)
+
+    for i in args:
+        get_input_tensors(i)
+    rmap = {tensor.op: new_tensor for tensor, new_tensor in zip(op.inputs, input_tensors)}
+    outputs = []
+    for out in op.outputs:
+        shape = [_ir_pass.Substitute(dim, vmap) if vmap else dim for dim in out.shape]
+        ph = tvm.te.placeholder(shape, dtype=out.dtype, name=out.op.name)
+        rmap[out.op] = ph
+        outputs.append(ph)
+    body = util.replace_io(body, rmap)
+    new_op = tvm.te._ffi_api.HybridOp(op.name, "HybridOp", None, input_tensors,
+                                      outputs, body)
+    res = [new_op.output(i) for i in range(len(outputs))]
+    return res[0] if len(res) == 1 else res
+
+
+def func_to_op(func, args, closure_vars):
+    """Lower a hybrid function, parsing its source only once per call signature.
+
+    The first call with a signature parses the function with source_to_op and
+    keeps the resulting HybridOp as a template. Later calls with the same
+    argument shapes, dtypes and captured values instantiate the template with
+    fresh loop variables and output buffers instead of parsing the source again.
+
+    Parameters
+    ----------
+    func : function
+        The undecorated hybrid function.
+
+    args : list of Tensors or Vars
+        The argument lists to the function.
+
+    closure_vars: dict
+        A dict of external name reference captured by this function.
+
+    Returns
+    -------
+    res : list of output tensors
+        The result of output tensors of the formed OpNode.
+    """
+    key, variables = _signature(args, closure_vars)
+    templates = _OP_TEMPLATES.setdefault(func.__code__, {})
+    if key is not None and key in templates:
+        return _instantiate(templates[key], variables, args)
+
+    res = source_to_op(util._parsed_source(func), args, func.__globals__, closure_vars)
+    if key is not None:
+        op = res.op if isinstance(res, Tensor) else res[0].op
+        templates[key] = _make_template(op, variables)
+    return res
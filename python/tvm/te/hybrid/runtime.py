@@ -161,3 +161,11 @@ def _restore_runtime(func, intersect):
         _globals.pop(elem)
     for k, v in intersect:
         _globals[k] = v
+
+
+def _emulate(func, args, kwargs=None):
+    """Run a hybrid script function as Python code with the emulation runtime"""
+    intersect = _enter_hybrid_runtime(func)
+    value = func(*args, **(kwargs or {}))
+    _restore_runtime(func, intersect)
+    return value
@@ -54,19 +54,80 @@ def is_docstring(node):
     return isinstance(node, ast.Expr) and isinstance(node.value, ast.Str)
 
 
+# sources and syntax trees of hybrid functions, keyed by their code objects
+_SOURCE_CACHE = {}
+_AST_CACHE = {}
+
+
 def _pruned_source(func):
-    """Prune source code's extra leading spaces"""
+    """Prune source code's extra leading spaces, the result is cached per function"""
+    code = getattr(func, '__code__', None)
+    if code in _SOURCE_CACHE:
+        return _SOURCE_CACHE[code]
     try:
         lines = inspect.getsource(func).split('\n')
         leading_space = len(lines[0]) - len(lines[0].lstrip(' '))
         lines = [line[leading_space:] for line in lines]
-        return '\n'.join(lines)
+        src = '\n'.join(lines)
     except IOError as err:
         if sys.version_info[0] == 2 and str(err) == 'could not get source code':
             logging.log(logging.CRITICAL, \
                         'This module is not fully operated under Python2... ' \
                         'Please move to Python3!')
             raise err
+        return None
+    if code is not None:
+        _SOURCE_CACHE[code] = src
+    return src
+
+
+def _parsed_source(func):
+    """Get the Python syntax tree of a function, the result is cached per function.
+
+    The hybrid parser only reads the tree, so the cached tree is shared by all calls.
+    """
+    code = getattr(func, '__code__', None)
+    if code in _AST_CACHE:
+        return _AST_CACHE[code]
+    root = ast.parse(_pruned_source(func))
+    if code is not None:
+        _AST_CACHE[code] = root
+    return root
+
+
+class _IdentityKey(object):
+    """Key an object by identity, keeping it alive as long as the key.
+
+    A bare id() could be reused by another object once the captured one
+    is collected, while the key is still in a cache.
+    """
+    __slots__ = ['value']
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return id(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, _IdentityKey) and other.value is self.value
+
+
+def _closure_key(closure_vars):
+    """Get a hashable key identifying the values of the captured variables.
+
+    Numbers, strings, numpy arrays and nested lists or tuples of them are
+    keyed by value, other objects such as functions and modules by identity.
+    """
+    def _value_key(value):
+        if isinstance(value, (list, tuple)):
+            return (type(value).__name__,) + tuple(_value_key(x) for x in value)
+        if value is None or isinstance(value, (str,) + numeric_types):
+            return value
+        if isinstance(value, numpy.ndarray):
+            return ('ndarray', str(value.dtype), value.shape, value.tobytes())
+        return _IdentityKey(value)
+    return tuple(sorted((name, _value_key(value)) for name, value in closure_vars.items()))
 
 
 def replace_io(body, rmap):
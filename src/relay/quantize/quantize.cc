@@ -124,6 +124,7 @@ TVM_STATIC_IR_FUNCTOR(ReprPrinter, vtable)
   p->stream << "nbit_weight=" << op->nbit_weight << ", ";
   p->stream << "nbit_activation=" << op->nbit_activation << ", ";
   p->stream << "calibrate_mode=" << op->calibrate_mode << ", ";
+  p->stream << "calibrate_percentile=" << op->calibrate_percentile << ", ";
   p->stream << "global_scale=" << op->global_scale << ", ";
   p->stream << "weight_scale=" << op->weight_scale << ", ";
   p->stream << "skip_conv_layers==" << op->skip_conv_layers << ", ";
@@ -79,6 +79,7 @@ class QConfigNode : public Object {
   Array<Expr> debug_enabled_ops = Array<Expr>(ObjectPtr<Object>(nullptr));
   std::string rounding = "UPWARD";
   int calibrate_chunk_by = -1;
+  double calibrate_percentile = 99.99;
 
   void VisitAttrs(AttrVisitor* v) {
     v->Visit("nbit_input", &nbit_input);
@@ -96,6 +97,7 @@ class QConfigNode : public Object {
     v->Visit("debug_enabled_ops", &debug_enabled_ops);
     v->Visit("rounding", &rounding);
     v->Visit("calibrate_chunk_by", &calibrate_chunk_by);
+    v->Visit("calibrate_percentile", &calibrate_percentile);
   }
 
   static constexpr const char* _type_key = "relay.quantize.QConfig";
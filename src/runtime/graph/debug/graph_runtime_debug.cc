@@ -26,6 +26,8 @@
 
 #include <chrono>
 #include <sstream>
+#include <unordered_map>
+#include <vector>
 #include "../graph_runtime.h"
 
 namespace tvm {
@@ -105,6 +107,68 @@ class GraphRuntimeDebug : public GraphRuntime {
     return os.str();
   }
 
+  /*!
+   * \brief Time each operation in the graph separately on every run.
+   * \param number The number of timed runs.
+   * \param warmup The number of untimed runs done first.
+   * \param capture_nodes The indices of the nodes whose outputs are copied
+   *        right after they execute in the last run, see GetCapturedOutput.
+   * \return A float64 NDArray of shape (number, number of nodes) holding the
+   *         time in microseconds of every node on every run, zero for
+   *         the nodes that do not execute an operator.
+   */
+  NDArray ProfileOps(int number, int warmup, const std::vector<int>& capture_nodes) {
+    for (int i = 0; i < warmup; ++i) {
+      GraphRuntime::Run();
+    }
+    std::vector<bool> capture(op_execs_.size(), false);
+    for (int nid : capture_nodes) {
+      CHECK_LT(static_cast<size_t>(nid), op_execs_.size());
+      capture[nid] = true;
+    }
+    captured_.clear();
+    int64_t num_nodes = static_cast<int64_t>(op_execs_.size());
+    NDArray times = NDArray::Empty({number, num_nodes}, DLDataType{kDLFloat, 64, 1},
+                                   TVMContext{kDLCPU, 0});
+    double* data = static_cast<double*>(times->data);
+    std::fill(data, data + number * num_nodes, 0.0);
+    for (int k = 0; k < number; ++k) {
+      for (size_t index = 0; index < op_execs_.size(); ++index) {
+        if (!op_execs_[index]) continue;
+        const TVMContext& ctx = data_entry_[entry_id(index, 0)]->ctx;
+        auto op_tbegin = std::chrono::high_resolution_clock::now();
+        op_execs_[index]();
+        TVMSynchronize(ctx.device_type, ctx.device_id, nullptr);
+        auto op_tend = std::chrono::high_resolution_clock::now();
+        data[k * num_nodes + index] = std::chrono::duration_cast<
+            std::chrono::duration<double> >(op_tend - op_tbegin).count() * 1e6;  // us
+        if (k == number - 1 && capture[index]) {
+          // Copy now, the storage may be reused by later nodes.
+          for (uint32_t j = 0; j < nodes_[index].param.num_outputs; ++j) {
+            const NDArray& out = data_entry_[entry_id(index, j)];
+            NDArray copy = NDArray::Empty(
+                std::vector<int64_t>(out->shape, out->shape + out->ndim), out->dtype, out->ctx);
+            copy.CopyFrom(out);
+            captured_[entry_id(index, j)] = copy;
+          }
+        }
+      }
+    }
+    return times;
+  }
+
+  /*!
+   * \brief Get an output captured by the last ProfileOps call.
+   * \param index The index of the node.
+   * \param eid The index of the output of the node.
+   */
+  NDArray GetCapturedOutput(int index, int eid) {
+    auto it = captured_.find(entry_id(index, eid));
+    CHECK(it != captured_.end())
+        << "Output " << eid << " of node " << GetNodeName(index) << " was not captured";
+    return it->second;
+  }
+
   /*!
    * \brief Run each operation and get the output.
    * \param index The index of op which needs to be returned.
@@ -158,6 +222,10 @@ void DebugGetNodeOutput(int index, DLTensor* data_out) {
 
   data_entry_[eid].CopyTo(data_out);
 }
+
+ private:
+  /*! \brief The outputs captured by ProfileOps, by entry id. */
+  std::unordered_map<uint32_t, NDArray> captured_;
 };
 
 
@@ -182,6 +250,22 @@ PackedFunc GraphRuntimeDebug::GetFunction(
           this->DebugGetNodeOutput(args[0], args[1]);
         }
       });
+  } else if (name == "profile_ops") {
+    return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
+      int number = args[0];
+      int warmup = args[1];
+      CHECK_GT(number, 0);
+      CHECK_GE(warmup, 0);
+      std::vector<int> capture_nodes;
+      for (int i = 2; i < args.num_args; ++i) {
+        capture_nodes.push_back(args[i]);
+      }
+      *rv = this->ProfileOps(number, warmup, capture_nodes);
+    });
+  } else if (name == "get_captured_output") {
+    return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
+        *rv = this->GetCapturedOutput(args[0], args[1]);
+      });
   } else if (name == "run_individual") {
     return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
       int number = args[0];
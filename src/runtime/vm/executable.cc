@@ -27,7 +27,11 @@
 #include <tvm/runtime/registry.h>
 #include <tvm/runtime/vm.h>
 
+#include <tvm/runtime/device_api.h>
+
 #include <algorithm>
+#include <cstring>
+#include <fstream>
 #include <memory>
 #include <iostream>
 #include <iomanip>
@@ -35,6 +39,13 @@
 #include <utility>
 #include <vector>
 
+#ifndef _WIN32
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+#endif
+
 #include "serialize_util.h"
 
 namespace tvm {
@@ -68,6 +79,12 @@ PackedFunc Executable::GetFunction(const std::string& name,
     return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
       *rv = this->Save();
     });
+  } else if (name == "save_to_file") {
+    return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
+      std::string path = args[0];
+      int64_t alignment = args[1];
+      this->SaveToFile(path, static_cast<size_t>(alignment));
+    });
   } else if (name == "get_function_arity") {
     return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
       std::string func_name = args[0];
@@ -149,8 +166,8 @@ std::string Executable::Stats() const {
 
   // Get the number of constants and the shape of each of them.
   oss << "  Constant shapes (# " << constants.size() << "): [";
-  for (const auto& it : constants) {
-    const auto constant = Downcast<NDArray>(it);
+  for (size_t i = 0; i < constants.size(); ++i) {
+    const auto constant = Downcast<NDArray>(GetConstant(i));
     const auto& shape = constant.Shape();
 
     // Scalar
@@ -203,7 +220,7 @@ void SaveHeader(dmlc::Stream* strm) {
   strm->Write(version);
 }
 
-TVMByteArray Executable::Save() {
+TVMByteArray Executable::Save(bool include_constants) {
   // Initialize the stream object.
   code_.clear();
   dmlc::MemoryStringStream strm(&code_);
@@ -215,7 +232,7 @@ TVMByteArray Executable::Save() {
   SaveGlobalSection(&strm);
 
   // Constant section.
-  SaveConstantSection(&strm);
+  SaveConstantSection(&strm, include_constants);
 
   // Primitive names.
   SavePrimitiveOpNames(&strm);
@@ -245,18 +262,25 @@ void Executable::SaveGlobalSection(dmlc::Stream* strm) {
   strm->Write(glbs);
 }
 
-void Executable::SaveConstantSection(dmlc::Stream* strm) {
-  std::vector<DLTensor*> arrays;
-  for (const auto& obj : this->constants) {
-    const auto cell = Downcast<runtime::NDArray>(obj);
-    arrays.push_back(const_cast<DLTensor*>(cell.operator->()));
-  }
+void Executable::SaveConstantSection(dmlc::Stream* strm, bool include_constants) {
   strm->Write(static_cast<uint64_t>(this->constants.size()));
-  for (const auto& it : arrays) {
-    runtime::SaveDLTensor(strm, it);
+  if (!include_constants) return;
+  for (size_t i = 0; i < this->constants.size(); ++i) {
+    const auto cell = Downcast<runtime::NDArray>(GetConstant(i));
+    runtime::SaveDLTensor(strm, cell.operator->());
   }
 }
 
+ObjectRef Executable::GetConstant(Index index) const {
+  CHECK_LT(static_cast<size_t>(index), constants.size());
+  if (constants[index].defined()) {
+    return constants[index];
+  }
+  CHECK(constant_loader != nullptr) << "Constant " << index << " is not loaded";
+  NDArray constant = constant_loader(index);
+  return constant;
+}
+
 void Executable::SavePrimitiveOpNames(dmlc::Stream* strm) {
   std::vector<std::string> primitive_names;
   for (const auto& it : this->primitive_map) {
@@ -467,10 +491,12 @@ void LoadHeader(dmlc::Stream* strm) {
   STREAM_CHECK(version == TVM_VERSION, "version");
 }
 
-runtime::Module Executable::Load(const std::string& code, const runtime::Module lib) {
+runtime::Module Executable::Load(const std::string& code, const runtime::Module lib,
+                                 PackedFunc constant_loader) {
   auto exec = make_object<Executable>();
   exec->lib = lib;
   exec->code_ = code;
+  exec->constant_loader = constant_loader;
   dmlc::MemoryStringStream strm(&exec->code_);
 
   // Load header.
@@ -505,6 +531,11 @@ void Executable::LoadConstantSection(dmlc::Stream* strm) {
   STREAM_CHECK(strm->Read(&sz, sizeof(sz)), "constant");
 
   size_t size = static_cast<size_t>(sz);
+  if (constant_loader != nullptr) {
+    // The tensors are stored outside of the code, they are loaded on first use.
+    this->constants.resize(size);
+    return;
+  }
   // Load each of the constants.
   for (size_t i = 0; i < size; i++) {
     runtime::NDArray constant;
@@ -738,6 +769,178 @@ void Executable::LoadCodeSection(dmlc::Stream* strm) {
   }
 }
 
+inline size_t AlignUp(size_t value, size_t alignment) {
+  return (value + alignment - 1) / alignment * alignment;
+}
+
+/*!
+ * \brief A private mapping of a file. The pages are shared with the other
+ *  processes mapping the same file until they are written to.
+ */
+class MappedFile {
+ public:
+  explicit MappedFile(const std::string& path) {
+#ifndef _WIN32
+    int fd = open(path.c_str(), O_RDONLY);
+    CHECK_GE(fd, 0) << "Cannot open file " << path;
+    struct stat st;
+    CHECK_EQ(fstat(fd, &st), 0) << "Cannot stat file " << path;
+    size_ = static_cast<size_t>(st.st_size);
+    void* addr = mmap(nullptr, size_, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, 0);
+    close(fd);
+    CHECK(addr != MAP_FAILED) << "Cannot map file " << path;
+    data_ = static_cast<char*>(addr);
+#else
+    // No mapping, read the file into an aligned buffer instead.
+    std::ifstream fs(path, std::ios::in | std::ios::binary);
+    CHECK(!fs.fail()) << "Cannot open file " << path;
+    fs.seekg(0, std::ios::end);
+    size_ = static_cast<size_t>(fs.tellg());
+    fs.seekg(0, std::ios::beg);
+    buffer_.resize(size_ + kAllocAlignment);
+    data_ = reinterpret_cast<char*>(
+        AlignUp(reinterpret_cast<size_t>(buffer_.data()), kAllocAlignment));
+    fs.read(data_, size_);
+#endif
+  }
+
+  ~MappedFile() {
+#ifndef _WIN32
+    munmap(data_, size_);
+#endif
+  }
+
+  char* data() const { return data_; }
+
+  size_t size() const { return size_; }
+
+ private:
+  char* data_;
+  size_t size_;
+#ifdef _WIN32
+  std::vector<char> buffer_;
+#endif
+};
+
+/*! \brief A constant stored in the executable file. */
+struct FileConstantEntry {
+  DLDataType dtype;
+  std::vector<int64_t> shape;
+  uint64_t offset;
+  uint64_t nbytes;
+};
+
+/*! \brief The manager of a tensor pointing into a mapped file. */
+struct MappedTensor {
+  std::shared_ptr<MappedFile> file;
+  std::vector<int64_t> shape;
+  DLManagedTensor tensor;
+
+  static void Deleter(DLManagedTensor* self) {
+    delete static_cast<MappedTensor*>(self->manager_ctx);
+  }
+};
+
+/*
+ * The file starts with the magic number and the size of the metadata.
+ * The metadata holds the code saved without the constant tensors, the
+ * alignment, and the type, shape, offset and size of each constant. The
+ * data of the constants follows, every constant being aligned.
+ */
+void Executable::SaveToFile(const std::string& path, size_t alignment) {
+  CHECK(alignment != 0 && (alignment & (alignment - 1)) == 0)
+      << "alignment must be a power of two, got " << alignment;
+  std::vector<NDArray> arrays;
+  std::string meta;
+  dmlc::MemoryStringStream strm(&meta);
+  Save(false);
+  strm.Write(code_);
+  strm.Write(static_cast<uint64_t>(alignment));
+  strm.Write(static_cast<uint64_t>(constants.size()));
+  uint64_t offset = 0;
+  for (size_t i = 0; i < constants.size(); ++i) {
+    NDArray array = Downcast<NDArray>(GetConstant(i));
+    if (array->ctx.device_type != kDLCPU) {
+      array = array.CopyTo(DLContext{kDLCPU, 0});
+    }
+    uint64_t nbytes = GetDataSize(*array.operator->());
+    strm.Write(array->dtype);
+    strm.Write(array.Shape());
+    strm.Write(offset);
+    strm.Write(nbytes);
+    arrays.push_back(array);
+    offset = AlignUp(offset + nbytes, alignment);
+  }
+
+  std::ofstream fs(path, std::ios::out | std::ios::binary);
+  CHECK(!fs.fail()) << "Cannot open " << path;
+  uint64_t header[2] = {kTVMVMExecutableFileMagic, static_cast<uint64_t>(meta.size())};
+  fs.write(reinterpret_cast<const char*>(header), sizeof(header));
+  fs.write(meta.data(), meta.size());
+  size_t pos = sizeof(header) + meta.size();
+  size_t data_start = AlignUp(pos, alignment);
+  std::string buffer;
+  for (const auto& array : arrays) {
+    size_t nbytes = GetDataSize(*array.operator->());
+    size_t aligned = AlignUp(pos, alignment);
+    buffer.assign(aligned - pos, '\0');
+    fs.write(buffer.data(), buffer.size());
+    buffer.resize(nbytes);
+    array.CopyToBytes(&buffer[0], nbytes);
+    fs.write(buffer.data(), nbytes);
+    pos = aligned + nbytes;
+  }
+  // pad the last constant
+  buffer.assign(AlignUp(pos, alignment) - pos, '\0');
+  fs.write(buffer.data(), buffer.size());
+  CHECK_EQ(data_start + offset, AlignUp(pos, alignment));
+}
+
+runtime::Module Executable::LoadFromFile(const std::string& path, const runtime::Module lib) {
+  auto file = std::make_shared<MappedFile>(path);
+  uint64_t header[2];
+  CHECK_GE(file->size(), sizeof(header)) << "Invalid VM executable file " << path;
+  std::memcpy(header, file->data(), sizeof(header));
+  STREAM_CHECK(header[0] == kTVMVMExecutableFileMagic, "header");
+  CHECK_LE(sizeof(header) + header[1], file->size()) << "Invalid VM executable file " << path;
+  dmlc::MemoryFixedSizeStream strm(file->data() + sizeof(header), header[1]);
+  std::string code;
+  uint64_t alignment, num_constants;
+  STREAM_CHECK(strm.Read(&code), "code");
+  STREAM_CHECK(strm.Read(&alignment), "constant");
+  STREAM_CHECK(strm.Read(&num_constants), "constant");
+  size_t data_start = AlignUp(sizeof(header) + header[1], alignment);
+  auto entries = std::make_shared<std::vector<FileConstantEntry>>(num_constants);
+  for (auto& entry : *entries) {
+    STREAM_CHECK(strm.Read(&entry.dtype), "constant");
+    STREAM_CHECK(strm.Read(&entry.shape), "constant");
+    STREAM_CHECK(strm.Read(&entry.offset), "constant");
+    STREAM_CHECK(strm.Read(&entry.nbytes), "constant");
+    entry.offset += data_start;
+    STREAM_CHECK(entry.offset + entry.nbytes <= file->size(), "constant");
+  }
+
+  auto loader = PackedFunc([file, entries](TVMArgs args, TVMRetValue* rv) {
+    int64_t index = args[0];
+    const FileConstantEntry& entry = entries->at(index);
+    MappedTensor* mapped = new MappedTensor();
+    mapped->file = file;
+    mapped->shape = entry.shape;
+    DLTensor& tensor = mapped->tensor.dl_tensor;
+    tensor.data = file->data() + entry.offset;
+    tensor.ctx = DLContext{kDLCPU, 0};
+    tensor.ndim = static_cast<int>(mapped->shape.size());
+    tensor.dtype = entry.dtype;
+    tensor.shape = mapped->shape.data();
+    tensor.strides = nullptr;
+    tensor.byte_offset = 0;
+    mapped->tensor.manager_ctx = mapped;
+    mapped->tensor.deleter = MappedTensor::Deleter;
+    *rv = NDArray::FromDLPack(&mapped->tensor);
+  });
+  return Load(code, lib, loader);
+}
+
 TVM_REGISTER_GLOBAL("runtime.GetNumOfGlobals")
 .set_body([](TVMArgs args, TVMRetValue* rv) {
   runtime::Module mod = args[0];
@@ -796,6 +999,13 @@ TVM_REGISTER_GLOBAL("runtime.Load_Executable")
   return Executable::Load(code, lib);
 });
 
+TVM_REGISTER_GLOBAL("runtime.Load_Executable_File")
+.set_body_typed([](
+    std::string path,
+    runtime::Module lib) {
+  return Executable::LoadFromFile(path, lib);
+});
+
 }  // namespace vm
 }  // namespace runtime
 }  // namespace tvm
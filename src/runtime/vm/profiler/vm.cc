@@ -30,6 +30,7 @@
 #include <iomanip>
 #include <memory>
 #include <numeric>
+#include <sstream>
 #include <string>
 #include <utility>
 #include <vector>
@@ -45,17 +46,12 @@ PackedFunc VirtualMachineDebug::GetFunction(
   if (name == "get_stat") {
     return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
       CHECK_EQ(args.size(), 1U);
-      std::vector<std::pair<Index, double>> op_acc_time;
-      for (auto kv : op_durations_) {
-        auto val = std::make_pair(
-            kv.first, std::accumulate(kv.second.begin(), kv.second.end(), 0.0));
-        op_acc_time.push_back(val);
-      }
+      std::vector<std::pair<Index, OpStat>> op_acc_time(op_stats_.begin(), op_stats_.end());
       bool sort_by_time = args[0];
       if (sort_by_time) {
-        auto comp = [](const std::pair<Index, double>& lhs,
-                       const std::pair<Index, double>& rhs) {
-          return lhs.second > rhs.second;
+        auto comp = [](const std::pair<Index, OpStat>& lhs,
+                       const std::pair<Index, OpStat>& rhs) {
+          return lhs.second.total > rhs.second.total;
         };
         std::sort(op_acc_time.begin(), op_acc_time.end(), comp);
       }
@@ -68,27 +64,34 @@ PackedFunc VirtualMachineDebug::GetFunction(
          << "#Duration(us): Sum/Mean/Min/Max" << std::endl;
 
       for (auto kv : op_acc_time) {
-        auto vals = op_durations_[kv.first];
-        auto sum = kv.second;
-        auto mean = sum / static_cast<double>(vals.size());
-        auto min_value = *std::min_element(vals.begin(), vals.end());
-        auto max_value = *std::max_element(vals.begin(), vals.end());
+        const OpStat& stat = kv.second;
+        auto mean = stat.total / static_cast<double>(stat.count);
 
         os << std::setw(30) << std::left << packed_index_map_[kv.first] << "\t"
-           << std::setw(10) << std::left << op_invokes_[kv.first] << "\t"
-           <<  sum << "/" << mean << "/" << min_value << "/" << max_value << std::endl;
+           << std::setw(10) << std::left << stat.count << "\t"
+           << stat.total << "/" << mean << "/" << stat.min << "/" << stat.max << std::endl;
 
-        total_duration += sum;
-        total_packed_funcs += op_invokes_[kv.first];
+        total_duration += stat.total;
+        total_packed_funcs += stat.count;
       }
       os << "\nTotal Duration: " << total_duration << " us.\t"
          << "Total Packed Functions: " << total_packed_funcs << std::endl;
       *rv = os.str();
     });
+  } else if (name == "get_events") {
+    return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
+      *rv = this->GetEvents();
+    });
+  } else if (name == "set_window") {
+    return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
+      int64_t window = args[0];
+      CHECK_GE(window, 0);
+      window_ = static_cast<size_t>(window);
+      TrimEvents();
+    });
   } else if (name == "reset") {
     return PackedFunc([sptr_to_self, this](TVMArgs args, TVMRetValue* rv) {
-      op_durations_.clear();
-      op_invokes_.clear();
+      this->Reset();
     });
   } else {
     return VirtualMachine::GetFunction(name, sptr_to_self);
@@ -100,8 +103,65 @@ void VirtualMachineDebug::LoadExecutable(const Executable* exec) {
   CHECK(exec_);
   for (auto kv : exec_->primitive_map) {
     packed_index_map_[kv.second] = kv.first;
-    op_invokes_[kv.second] = 0;
   }
+  Reset();
+}
+
+double VirtualMachineDebug::Now() const {
+  return std::chrono::duration_cast<std::chrono::duration<double> >(
+      std::chrono::high_resolution_clock::now() - epoch_).count() * 1e6;
+}
+
+void VirtualMachineDebug::TrimEvents() {
+  if (window_ == 0) return;
+  while (call_events_.size() > window_) call_events_.pop_front();
+  while (alloc_events_.size() > window_) alloc_events_.pop_front();
+}
+
+void VirtualMachineDebug::Reset() {
+  op_stats_.clear();
+  call_events_.clear();
+  alloc_events_.clear();
+  alloc_count_ = 0;
+  alloc_bytes_ = 0;
+  alloc_time_ = 0.0;
+  epoch_ = std::chrono::high_resolution_clock::now();
+}
+
+std::string VirtualMachineDebug::GetEvents() const {
+  std::ostringstream os;
+  os << std::setprecision(17);
+  os << "{\"ops\": {";
+  bool first = true;
+  for (const auto& kv : packed_index_map_) {
+    os << (first ? "" : ", ") << "\"" << kv.first << "\": \"" << kv.second << "\"";
+    first = false;
+  }
+  os << "}, \"op_stats\": {";
+  first = true;
+  for (const auto& kv : op_stats_) {
+    os << (first ? "" : ", ") << "\"" << kv.first << "\": ["
+       << kv.second.count << ", " << kv.second.total << ", "
+       << kv.second.min << ", " << kv.second.max << "]";
+    first = false;
+  }
+  os << "}, \"calls\": [";
+  first = true;
+  for (const auto& e : call_events_) {
+    os << (first ? "" : ", ") << "[" << e.packed_index << ", " << e.start
+       << ", " << e.duration << "]";
+    first = false;
+  }
+  os << "], \"allocs\": [";
+  first = true;
+  for (const auto& e : alloc_events_) {
+    os << (first ? "" : ", ") << "[" << e.start << ", " << e.duration
+       << ", " << e.size << ", " << e.device_type << "]";
+    first = false;
+  }
+  os << "], \"alloc_stats\": [" << alloc_count_ << ", " << alloc_bytes_
+     << ", " << alloc_time_ << "]}";
+  return os.str();
 }
 
 void VirtualMachineDebug::InvokePacked(Index packed_index,
@@ -114,17 +174,32 @@ void VirtualMachineDebug::InvokePacked(Index packed_index,
   VirtualMachine::InvokePacked(packed_index, func, arg_count, output_size, args);
   TVMSynchronize(ctx.device_type, ctx.device_id, nullptr);
 
-  auto op_begin = std::chrono::high_resolution_clock::now();
+  double op_begin = Now();
   VirtualMachine::InvokePacked(packed_index, func, arg_count, output_size, args);
   TVMSynchronize(ctx.device_type, ctx.device_id, nullptr);
-  auto op_end = std::chrono::high_resolution_clock::now();
-  double op_duration =
-      std::chrono::duration_cast<std::chrono::duration<double> >(op_end -
-                                                                 op_begin)
-          .count();
-
-  op_durations_[packed_index].push_back(op_duration * 1e6);
-  op_invokes_[packed_index] += 1;
+  double op_duration = Now() - op_begin;
+
+  OpStat& stat = op_stats_[packed_index];
+  if (stat.count == 0 || op_duration < stat.min) stat.min = op_duration;
+  if (stat.count == 0 || op_duration > stat.max) stat.max = op_duration;
+  stat.total += op_duration;
+  stat.count += 1;
+  call_events_.push_back(CallEvent{packed_index, op_begin, op_duration});
+  TrimEvents();
+}
+
+ObjectRef VirtualMachineDebug::AllocStorage(int64_t size, int64_t alignment,
+                                            DLDataType dtype_hint, TVMContext ctx) {
+  double alloc_begin = Now();
+  ObjectRef storage = VirtualMachine::AllocStorage(size, alignment, dtype_hint, ctx);
+  double alloc_duration = Now() - alloc_begin;
+  alloc_count_ += 1;
+  alloc_bytes_ += size;
+  alloc_time_ += alloc_duration;
+  alloc_events_.push_back(
+      AllocEvent{alloc_begin, alloc_duration, size, static_cast<int>(ctx.device_type)});
+  TrimEvents();
+  return storage;
 }
 
 runtime::Module CreateVirtualMachineDebug(const Executable* exec) {
@@ -27,6 +27,8 @@
 
 #include <tvm/runtime/vm.h>
 
+#include <chrono>
+#include <deque>
 #include <memory>
 #include <string>
 #include <unordered_map>
@@ -48,12 +50,57 @@ class VirtualMachineDebug : public VirtualMachine {
   ~VirtualMachineDebug() {}
 
  private:
+  /*! \brief The cumulative statistics of a packed function. */
+  struct OpStat {
+    int64_t count{0};
+    double total{0.0};
+    double min{0.0};
+    double max{0.0};
+  };
+
+  /*! \brief A packed function call, times are in microseconds. */
+  struct CallEvent {
+    Index packed_index;
+    double start;
+    double duration;
+  };
+
+  /*! \brief A storage allocation, times are in microseconds. */
+  struct AllocEvent {
+    double start;
+    double duration;
+    int64_t size;
+    int device_type;
+  };
+
   void InvokePacked(Index packed_index, const PackedFunc& func, Index arg_count,
                     Index output_size, const std::vector<ObjectRef>& args) final;
 
+  ObjectRef AllocStorage(int64_t size, int64_t alignment,
+                         DLDataType dtype_hint, TVMContext ctx) final;
+
+  /*! \brief The time elapsed since the last reset in microseconds. */
+  double Now() const;
+
+  /*! \brief Drop the events that are out of the window. */
+  void TrimEvents();
+
+  /*! \brief Serialize the recorded events and statistics to JSON. */
+  std::string GetEvents() const;
+
+  /*! \brief Clear the statistics and the events. */
+  void Reset();
+
   std::unordered_map<Index, std::string> packed_index_map_;
-  std::unordered_map<Index, std::vector<double>> op_durations_;
-  std::unordered_map<Index, int> op_invokes_;
+  std::unordered_map<Index, OpStat> op_stats_;
+  std::deque<CallEvent> call_events_;
+  std::deque<AllocEvent> alloc_events_;
+  int64_t alloc_count_{0};
+  int64_t alloc_bytes_{0};
+  double alloc_time_{0.0};
+  /*! \brief The number of events kept, 0 keeps all of them. */
+  size_t window_{0};
+  std::chrono::high_resolution_clock::time_point epoch_;
 };
 
 }  // namespace vm
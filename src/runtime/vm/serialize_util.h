@@ -39,6 +39,9 @@ namespace vm {
 /*! \brief The magic number for the serialized VM bytecode file  */
 constexpr uint64_t kTVMVMBytecodeMagic = 0xD225DE2F4214151D;
 
+/*! \brief The magic number for the memory mappable VM executable file  */
+constexpr uint64_t kTVMVMExecutableFileMagic = 0xD225DE2F4214151E;
+
 template <typename T>
 static inline size_t VectorHash(size_t key, const std::vector<T>& values) {
   for (const auto& it : values) {
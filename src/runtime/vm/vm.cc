@@ -752,6 +752,11 @@ ObjectRef VirtualMachine::Invoke(const std::string& name, const std::vector<Obje
   return Invoke(exec_->functions[func_index_], args);
 }
 
+ObjectRef VirtualMachine::AllocStorage(int64_t size, int64_t alignment,
+                                       DLDataType dtype_hint, TVMContext ctx) {
+  return make_storage(size, alignment, dtype_hint, ctx);
+}
+
 void VirtualMachine::InvokePacked(Index packed_index, const PackedFunc& func,
                                   Index arg_count, Index output_size,
                                   const std::vector<ObjectRef>& args) {
@@ -860,7 +865,6 @@ void VirtualMachine::RunLoop() {
         throw std::runtime_error("VM encountered fatal error");
       }
       case Opcode::LoadConst: {
-        auto constant_obj = exec_->constants[instr.const_index];
         // We cache the allocated object in the constant pool. To measure, the
         // first iteration will set the pool up. The other iterations will
         // directly reuse the allocated objects.
@@ -870,6 +874,7 @@ void VirtualMachine::RunLoop() {
 
         if (!const_pool_[instr.const_index].defined()) {
           // TODO(wweic) ctx could be obtained from the ctxs list.
+          auto constant_obj = exec_->GetConstant(instr.const_index);
           const_pool_[instr.const_index] = CopyTo(constant_obj, ctxs_[0]);
         }
         WriteRegister(instr.dst, const_pool_[instr.const_index]);
@@ -1027,7 +1032,7 @@ void VirtualMachine::RunLoop() {
           "alignment=" << alignment <<
           "dtype_hint=" << DLDataType2String(instr.alloc_storage.dtype_hint);
 
-        auto storage = make_storage(size, alignment, instr.alloc_storage.dtype_hint, ctxs_[0]);
+        auto storage = AllocStorage(size, alignment, instr.alloc_storage.dtype_hint, ctxs_[0]);
         WriteRegister(instr.dst, storage);
         pc_++;
         goto main_loop;
@@ -261,7 +261,6 @@ class LLVMModuleNode final : public runtime::ModuleNode {
       std::string msg = std::string(err.getMessage());
       LOG(FATAL) << "Fail to load module: " << msg;
     }
-    std::string target_;
     llvm::Metadata* mtarget = module_->getModuleFlag("tvm_target");
     if (mtarget != nullptr) {
       llvm::MDString* pstr = llvm::dyn_cast<llvm::MDString>(mtarget);
@@ -421,6 +420,13 @@ TVM_REGISTER_GLOBAL("runtime.module.loadfile_ll")
     *rv = runtime::Module(n);
   });
 
+TVM_REGISTER_GLOBAL("runtime.module.loadfile_bc")
+.set_body([](TVMArgs args, TVMRetValue* rv) {
+    auto n = make_object<LLVMModuleNode>();
+    n->LoadIR(args[0]);
+    *rv = runtime::Module(n);
+  });
+
 TVM_REGISTER_GLOBAL("codegen.llvm_target_enabled")
 .set_body([](TVMArgs args, TVMRetValue* rv) {
     InitializeLLVM();
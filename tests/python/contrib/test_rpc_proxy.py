@@ -16,10 +16,13 @@
 # under the License.
 import tvm
 from tvm import te
+import json
 import logging
 import numpy as np
 import time
 import multiprocessing
+import socket
+from urllib.request import urlopen
 from tvm import rpc
 
 def rpc_proxy_check():
@@ -62,6 +65,135 @@ def rpc_proxy_check():
     except ImportError:
         print("Skipping because tornado is not avaliable...")
 
+def _free_port():
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("localhost", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def test_rpc_proxy_backpressure():
+    try:
+        from tornado import httpclient, ioloop
+        from tvm.rpc import proxy
+    except ImportError:
+        print("Skipping because tornado is not avaliable...")
+        return
+    max_buffer_size = 64 << 10
+    listen_sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listen_sock.bind(("localhost", 0))
+    listen_sock.listen(1)
+    web_port = _free_port()
+    server = proxy.ProxyServerHandler(listen_sock, listen_sock.getsockname()[1], web_port,
+                                      None, None, None, max_buffer_size=max_buffer_size)
+    try:
+        client_sock, client_peer = socket.socketpair()
+        server_sock, server_peer = socket.socketpair()
+        client = proxy.TCPHandler(client_sock, ("client", 0))
+        client.rpc_key = "client:backpressure"
+        remote = proxy.TCPHandler(server_sock, ("server", 0))
+        remote.rpc_key = "server:backpressure"
+        server._pair_up(client, remote)
+
+        # the peer of remote does not read, so the message queues up in the proxy
+        message = bytes(1 << 20)
+        client.on_data(message)
+        assert remote.queue_nbytes() > max_buffer_size
+        assert client.reading_paused
+        assert client.stats.pauses == 1
+
+        # reading resumes once half of the queue is drained
+        handshake_nbytes = 8 + len(client.rpc_key)
+        received = 0
+        while received < handshake_nbytes + len(message):
+            received += len(server_peer.recv(1 << 16))
+            remote._update_write()
+            assert client.reading_paused == (remote.queue_nbytes() > max_buffer_size // 2)
+        assert not client.reading_paused
+
+        def _fetch():
+            return httpclient.AsyncHTTPClient().fetch("http://localhost:%d/metrics" % web_port)
+        response = ioloop.IOLoop.current().run_sync(_fetch)
+        metrics = {item["name"]: item for item in json.loads(response.body)}
+        client_metrics = metrics[client.name()]
+        assert client_metrics["bytes_in"] == len(message)
+        assert client_metrics["messages_in"] == 1
+        assert client_metrics["pauses"] == 1
+        assert not client_metrics["paused"]
+        remote_metrics = metrics[remote.name()]
+        assert remote_metrics["bytes_out"] == len(message)
+        assert remote_metrics["peak_queue_nbytes"] > max_buffer_size
+        assert remote_metrics["queue_nbytes"] == 0
+
+        client.close()
+        remote.close()
+        for sock in [client_peer, server_peer]:
+            sock.close()
+    finally:
+        server.loop.remove_handler(listen_sock.fileno())
+        listen_sock.close()
+        proxy.ProxyServerHandler.current = None
+
+
+def _upload_through_proxy(args):
+    host, port, key, nbytes, repeat = args
+    remote = rpc.connect(host, port, key=key)
+    blob = bytearray(np.random.randint(0, 255, size=nbytes, dtype="uint8"))
+    tstart = time.time()
+    for i in range(repeat):
+        remote.upload(blob, "blob%d.bin" % i, cache=False)
+    assert remote.download("blob0.bin") == blob
+    return time.time() - tstart
+
+
+def rpc_proxy_load_check(num_pairs=16, nbytes=16 << 20, repeat=4):
+    """Load test of the RPC proxy with many simultaneous paired sessions.
+
+    Every pair uploads repeat blobs of nbytes bytes through the proxy at
+    the same time. Like rpc_proxy_check, this is not included in pytest.
+    """
+    if not tvm.runtime.enabled("rpc"):
+        return
+    try:
+        from tvm.rpc import proxy
+    except ImportError:
+        print("Skipping because tornado is not avaliable...")
+        return
+    web_port = 8888
+    prox = proxy.Proxy("localhost", web_port=web_port, max_buffer_size=1 << 20)
+    time.sleep(0.5)
+    keys = ["load%d" % i for i in range(num_pairs)]
+    servers = [rpc.Server(prox.host, prox.port, key=key, is_proxy=True) for key in keys]
+    time.sleep(0.5)
+
+    pool = multiprocessing.Pool(num_pairs)
+    tstart = time.time()
+    result = pool.map_async(_upload_through_proxy,
+                            [(prox.host, prox.port, key, nbytes, repeat) for key in keys])
+    # the metrics only cover the live pairs, keep the last snapshot
+    metrics = []
+    while not result.ready():
+        snapshot = json.loads(urlopen("http://localhost:%d/metrics" % web_port).read())
+        metrics = snapshot or metrics
+        result.wait(0.5)
+    costs = result.get()
+    duration = time.time() - tstart
+    pool.close()
+    total = num_pairs * nbytes * repeat
+    print("%d pairs, %.1f MB in %.2f s: %.1f MB/s, slowest pair %.2f s" % (
+        num_pairs, total / 1e6, duration, total / 1e6 / duration, max(costs)))
+    for item in sorted(metrics, key=lambda x: x["name"]):
+        print("%-40s in %.1f MB/s  peak queue %.1f MB  pauses %d" % (
+            item["name"], item["throughput_in"] / 1e6,
+            item["peak_queue_nbytes"] / 1e6, item["pauses"]))
+    for server in servers:
+        server.terminate()
+    prox.terminate()
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     rpc_proxy_check()
+    test_rpc_proxy_backpressure()
+    rpc_proxy_load_check()
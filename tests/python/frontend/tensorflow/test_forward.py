@@ -2221,6 +2221,49 @@ def test_forward_placeholder():
                                         rtol=1e-5, atol=1e-5)
 
 
+#######################################################################
+# Low memory import
+# -----------------
+
+
+def test_forward_low_memory_import():
+    """test importing with lazily converted Const nodes"""
+    with tf.Graph().as_default():
+        data = np.random.uniform(size=(4, 8)).astype('float32')
+        weight = np.random.uniform(size=(8, 16)).astype('float32')
+        in_data = tf.placeholder(shape=data.shape, dtype='float32', name='in_data')
+        w = tf.constant(weight, name='weight')
+        tf.constant(np.ones((32, 32), 'float32'), name='unused')
+        out = tf.nn.relu(math_ops.matmul(in_data, w) + tf.constant(0.5), name='out')
+
+        with tf.Session() as sess:
+            tf_output = run_tf_graph(sess, data, 'in_data:0', 'out:0')
+            # the graph has no variables, freezing it would only prune 'unused'
+            graph_def = sess.graph.as_graph_def(add_shapes=True)
+
+    shape_dict = {'in_data': data.shape}
+    mod, params = relay.frontend.from_tensorflow(graph_def, shape=shape_dict,
+                                                 outputs=['out'])
+    mod_lm, params_lm = relay.frontend.from_tensorflow(graph_def, shape=shape_dict,
+                                                       outputs=['out'], low_memory=True)
+    assert tvm.ir.structural_equal(mod['main'], mod_lm['main'])
+    # unused constants are never converted.
+    assert 'unused' in params and 'unused' not in params_lm
+    tvm.testing.assert_allclose(params_lm['weight'].asnumpy(), weight)
+    weight_node = [node for node in graph_def.node if node.name == 'weight'][0]
+    assert not weight_node.attr['value'].tensor.tensor_content
+
+    with relay.build_config(opt_level=3):
+        graph, lib, params_lm = relay.build(mod_lm, 'llvm', params=params_lm)
+    from tvm.contrib import graph_runtime
+    m = graph_runtime.create(graph, lib, tvm.cpu(0))
+    m.set_input('in_data', data)
+    m.set_input(**params_lm)
+    m.run()
+    tvm.testing.assert_allclose(m.get_output(0).asnumpy(), tf_output[0],
+                                rtol=1e-5, atol=1e-5)
+
+
 #######################################################################
 # PTB
 # ---
@@ -3305,6 +3348,7 @@ if __name__ == '__main__':
     test_forward_mobilenet()
     test_forward_resnetv2()
     test_forward_placeholder()
+    test_forward_low_memory_import()
     test_forward_ptb()
 
     # RNN
@@ -14,7 +14,11 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from tvm.relay.frontend.common import StrAttrsDict
+import numpy as np
+import tvm
+from tvm import relay
+from tvm.relay.frontend.common import StrAttrsDict, InferenceContext
+from tvm.relay.frontend.common import infer_shape, infer_type, infer_value
 
 
 def test_key_is_present():
@@ -27,6 +31,38 @@ def test_key_is_not_present():
     assert not attrs.has_attr("b")
 
 
+def test_incremental_infer_type():
+    x = relay.var("x", shape=(1, 3, 8, 8))
+    y = relay.nn.relu(x)
+    with InferenceContext():
+        assert infer_shape(y) == (1, 3, 8, 8)
+        z = relay.nn.max_pool2d(y, pool_size=(2, 2), strides=(2, 2))
+        w = relay.add(z, y)
+        assert infer_shape(z) == (1, 3, 4, 4)
+        assert infer_type(z) is infer_type(z)
+        assert infer_type(relay.Tuple([z, w])).checked_type == relay.TupleType(
+            [relay.TensorType((1, 3, 4, 4)), relay.TensorType((1, 3, 8, 8))])
+
+
+def test_memoized_infer_value():
+    x = relay.var("x", shape=(2, 3))
+    x_data = tvm.nd.array(np.arange(6).reshape(2, 3).astype("float32"))
+    params = {"x": x_data}
+    with InferenceContext():
+        val = infer_value(relay.shape_of(relay.multiply(x, x)), params)
+        np.testing.assert_equal(val.asnumpy(), [2, 3])
+        # a structurally equal expression hits the cache
+        val2 = infer_value(relay.shape_of(relay.multiply(x, x)), params)
+        assert val2.same_as(val)
+        params["x"] = tvm.nd.array(np.ones((2, 3), "float32"))
+        val3 = infer_value(relay.sum(x), params)
+        np.testing.assert_equal(val3.asnumpy(), 6)
+    val4 = infer_value(relay.sum(x), {"x": x_data})
+    np.testing.assert_equal(val4.asnumpy(), 15)
+
+
 if __name__ == '__main__':
     test_key_is_present()
     test_key_is_present()
+    test_incremental_infer_type()
+    test_memoized_infer_value()
@@ -0,0 +1,67 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmarking the recursive and iterative Python ExprVisitor and ExprMutator
+on a 100k-node graph."""
+import sys
+import time
+
+from tvm import relay
+from tvm.relay import ExprMutator, ExprVisitor
+
+
+class IterativeVisitor(ExprVisitor):
+    iterative = True
+
+
+class IterativeMutator(ExprMutator):
+    iterative = True
+
+
+def make_graph(num_nodes, depth):
+    """Sum num_nodes // depth chains of depth calls each."""
+    x = relay.var("x", shape=(1,))
+    chains = []
+    for i in range(num_nodes // depth):
+        expr = x
+        for _ in range(depth):
+            expr = relay.add(expr, relay.const(float(i)))
+        chains.append(expr)
+    return relay.Tuple(chains)
+
+
+def benchmark(name, functor_cls, expr):
+    start = time.time()
+    try:
+        functor_cls().visit(expr)
+    except RecursionError:
+        print("%-18s recursion limit exceeded" % name)
+        return
+    print("%-18s %.2f s" % (name, time.time() - start))
+
+
+if __name__ == "__main__":
+    # 100k calls in chains shallow enough for the recursive functors
+    sys.setrecursionlimit(10000)
+    shallow = make_graph(100000, 1000)
+    # and in chains deeper than the recursion limit
+    deep = make_graph(100000, 20000)
+    for graph_name, graph in [("shallow", shallow), ("deep", deep)]:
+        print("%s graph:" % graph_name)
+        benchmark("  ExprVisitor", ExprVisitor, graph)
+        benchmark("  IterativeVisitor", IterativeVisitor, graph)
+        benchmark("  ExprMutator", ExprMutator, graph)
+        benchmark("  IterativeMutator", IterativeMutator, graph)
@@ -0,0 +1,48 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmarking the compile time scaling of relay.build with n_parallel."""
+import multiprocessing
+import time
+
+from tvm import relay
+from tvm.relay import testing
+from tvm.relay.backend import compile_engine
+
+
+def benchmark_build(name, mod, params, target="llvm"):
+    max_jobs = multiprocessing.cpu_count()
+    n_parallel = 1
+    base = None
+    while n_parallel <= max_jobs:
+        # Make sure every build lowers the functions again.
+        compile_engine.get().clear()
+        start = time.time()
+        with relay.build_config(opt_level=3):
+            relay.build(mod, target, params=params, n_parallel=n_parallel)
+        cost = time.time() - start
+        base = base or cost
+        print("%-12s n_parallel=%-3d build time: %.2f s, speedup: %.2fx"
+              % (name, n_parallel, cost, base / cost))
+        n_parallel *= 2
+
+
+if __name__ == "__main__":
+    for num_layers in [18, 50]:
+        net, net_params = testing.resnet.get_workload(num_layers=num_layers, batch_size=1)
+        benchmark_build("resnet-%d" % num_layers, net, net_params)
+    net, net_params = testing.inception_v3.get_workload(batch_size=1)
+    benchmark_build("inception_v3", net, net_params)
@@ -0,0 +1,64 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmarking the throughput of parsing the text format of Relay models,
+with the recursive descent parser and, when available, the ANTLR parser."""
+import time
+
+import tvm
+from tvm.relay import testing
+from tvm.relay import _text_parser
+
+MODELS = [
+    ("resnet-50", lambda: testing.resnet.get_workload(num_layers=50, batch_size=1)),
+    ("mobilenet", lambda: testing.mobilenet.get_workload(batch_size=1)),
+    ("inception_v3", lambda: testing.inception_v3.get_workload(batch_size=1)),
+    ("lstm", lambda: testing.lstm.get_workload(iterations=32, num_hidden=256)),
+]
+
+
+def _parsers():
+    parsers = [("descent", _text_parser.fromtext)]
+    try:
+        # pylint: disable=import-outside-toplevel
+        from tvm.relay import _parser
+        parsers.append(("antlr", _parser.fromtext))
+    except Exception:  # pylint: disable=broad-except
+        print("ANTLR parser is not available, only the recursive descent parser is measured")
+    return parsers
+
+
+def benchmark_parse(name, get_workload, repeat=3):
+    mod, _ = get_workload()
+    text = mod.astext() + "\n"
+    num_lines = text.count("\n")
+    results = {}
+    for parser_name, fromtext in _parsers():
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.time()
+            parsed = fromtext(text)
+            best = min(best, time.time() - start)
+        results[parser_name] = parsed
+        print("%-12s %-8s %7d lines, %8.3f s, %9.0f lines/s"
+              % (name, parser_name, num_lines, best, num_lines / best))
+    if len(results) == 2:
+        tvm.ir.assert_structural_equal(results["descent"], results["antlr"], map_free_vars=True)
+
+
+if __name__ == "__main__":
+    for model_name, workload in MODELS:
+        benchmark_parse(model_name, workload)
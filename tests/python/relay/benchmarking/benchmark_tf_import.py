@@ -0,0 +1,62 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmarking peak memory and time of importing TensorFlow models."""
+import multiprocessing
+import resource
+import time
+
+from tvm import relay
+import tvm.relay.testing.tf as tf_testing
+
+MODELS = [
+    ("InceptionV3/inception_v3_2016_08_28_frozen-with_shapes.pb", None,
+     {"input": (1, 299, 299, 3)}),
+    ("https://storage.googleapis.com/mobilenet_v2/checkpoints/mobilenet_v2_1.4_224.tgz",
+     "mobilenet_v2_1.4_224_frozen.pb", {"input": (1, 224, 224, 3)}),
+    ("ResnetV2/resnet-20180601_resnet_v2_imagenet-shapes.pb", None,
+     {"input_tensor": (128, 224, 224, 3)}),
+]
+
+
+def _import_model(model_path, model_sub_path, shape, low_memory, queue):
+    with tf_testing.tf_compat_v1.Graph().as_default():
+        graph_def = tf_testing.get_workload(model_path, model_sub_path)
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.time()
+    relay.frontend.from_tensorflow(graph_def, shape=shape, low_memory=low_memory)
+    cost = time.time() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((cost, base_rss, peak_rss))
+
+
+def benchmark_import(model_path, model_sub_path, shape, low_memory):
+    # Each import runs in a fresh process so that peak rss is not shared.
+    queue = multiprocessing.Queue()
+    proc = multiprocessing.Process(target=_import_model,
+                                   args=(model_path, model_sub_path, shape,
+                                         low_memory, queue))
+    proc.start()
+    cost, base_rss, peak_rss = queue.get()
+    proc.join()
+    print("%-60s low_memory=%-5s time: %.2f s, peak rss: %.1f MB (graph def loaded: %.1f MB)"
+          % (model_path, low_memory, cost, peak_rss / 1024., base_rss / 1024.))
+
+
+if __name__ == "__main__":
+    for path, sub_path, input_shape in MODELS:
+        for mode in [False, True]:
+            benchmark_import(path, sub_path, input_shape, mode)
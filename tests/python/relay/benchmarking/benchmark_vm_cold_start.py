@@ -0,0 +1,86 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmarking cold start time and memory of VM executables saved
+as a byte array and as a memory-mappable file."""
+import multiprocessing
+import resource
+import time
+
+import numpy as np
+
+import tvm
+from tvm import relay
+from tvm.contrib import util
+from tvm.runtime import vm as _vm
+from tvm.relay import testing
+
+MODELS = [
+    ("resnet-50", lambda: testing.resnet.get_workload(num_layers=50, batch_size=1),
+     (1, 3, 224, 224)),
+    ("mobilenet", lambda: testing.mobilenet.get_workload(batch_size=1),
+     (1, 3, 224, 224)),
+]
+
+
+def _cold_start(path_lib, path_exec, mapped, data_shape, queue):
+    base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.time()
+    lib = tvm.runtime.load_module(path_lib)
+    if mapped:
+        exe = _vm.Executable.load_file(path_exec, lib)
+    else:
+        with open(path_exec, "rb") as fi:
+            exe = _vm.Executable.load_exec(bytearray(fi.read()), lib)
+    vm = _vm.VirtualMachine(exe)
+    vm.init(tvm.cpu())
+    load_cost = time.time() - start
+    data = np.random.uniform(size=data_shape).astype("float32")
+    start = time.time()
+    vm.run(data)
+    run_cost = time.time() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((load_cost, run_cost, peak_rss - base_rss))
+
+
+def benchmark_cold_start(name, get_workload, data_shape):
+    mod, params = get_workload()
+    exe = relay.vm.compile(mod, "llvm", params=params)
+    temp = util.tempdir()
+    path_lib = temp.relpath("lib.so")
+    exe.lib.export_library(path_lib)
+    code, _ = exe.save()
+    with open(temp.relpath("code.ro"), "wb") as fo:
+        fo.write(code)
+    exe.save_file(temp.relpath("exec.vm"))
+
+    # Each start runs in a fresh process.
+    ctx = multiprocessing.get_context("spawn")
+    for mapped, path_exec in [(False, temp.relpath("code.ro")),
+                              (True, temp.relpath("exec.vm"))]:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_cold_start,
+                           args=(path_lib, path_exec, mapped, data_shape, queue))
+        proc.start()
+        load_cost, run_cost, rss = queue.get()
+        proc.join()
+        print("%-12s mapped=%-5s load: %.3f s, first run: %.3f s, rss growth: %.1f MB"
+              % (name, mapped, load_cost, run_cost, rss / 1024.))
+
+
+if __name__ == "__main__":
+    for model_name, workload, shape in MODELS:
+        benchmark_cold_start(model_name, workload, shape)
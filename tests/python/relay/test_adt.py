@@ -14,6 +14,8 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import os
+
 import tvm
 from tvm import te
 from tvm import relay
@@ -1370,6 +1372,34 @@ def test_static_tensor_get_data():
     run('float32', [])
     run('int32', [2, 3])
 
+def test_prelude_lazy_tensor_array():
+    mod = tvm.IRModule()
+    prelude = Prelude(mod)
+    names = [gvar.name_hint for gvar in mod.get_global_vars()]
+    assert "tensor_array_int8" not in names
+    assert "hd" in names
+    tensor_array = prelude.get_var('tensor_array', 'int8')
+    assert tensor_array.name_hint == "tensor_array_int8"
+    assert "tensor_array_int8" in [gvar.name_hint for gvar in mod.get_global_vars()]
+    assert "tensor_array_uint16" not in [gvar.name_hint for gvar in mod.get_global_vars()]
+    # attributes of an unregistered dtype are defined on access
+    assert prelude.tensor_int16_t.name_hint == "tensor_int16_t"
+
+    # the std library is parsed once and shared between modules
+    other = Prelude()
+    assert tvm.ir.structural_equal(other.mod[other.map], prelude.mod[prelude.map])
+
+    # but every load returns a new module
+    path = os.path.join(relay.base.__STD_PATH__, "core.rly")
+    with open(path) as core_file:
+        source = core_file.read()
+    core = relay.fromtext(source, path)
+    core["extra"] = relay.Function([], relay.const(1))
+    other_core = relay.fromtext(source, path)
+    assert not other_core.same_as(core)
+    assert "extra" not in [gvar.name_hint for gvar in other_core.get_global_vars()]
+
+
 if __name__ == "__main__":
     test_nat_constructor()
     test_double()
@@ -1419,3 +1449,4 @@ if __name__ == "__main__":
     test_static_tensor_array_stack()
     test_static_tensor_array_gather()
     test_static_tensor_get_data()
+    test_prelude_lazy_tensor_array()
@@ -146,6 +146,63 @@ def test_select_implementation():
                 impl, _ = _select_impl((1, 16, 7, 7), (32, 16, 3, 3), True)
                 assert impl.name == "conv2d_1"
 
+def test_select_implementation_cache():
+    target = tvm.target.create("llvm")
+    num_computes = [0]
+
+    def _compute_conv2d_counted(input, filter, strides, padding, dilation, out_dtype):
+        num_computes[0] += 1
+        return topi.nn.conv2d_nchw(input, filter, strides, padding, dilation, out_dtype)
+
+    @tvm.target.override_native_generic_func("test_conv2d_cache_strategy")
+    def _counted_strategy(attrs, inputs, out_type, target):
+        strategy = relay.op.OpStrategy()
+        strategy.add_implementation(
+            relay.op.strategy.wrap_compute_conv2d(_compute_conv2d_counted),
+            relay.op.strategy.wrap_topi_schedule(_schedule_conv2d_3),
+            name="conv2d_low",
+            plevel=10)
+        strategy.add_implementation(
+            relay.op.strategy.wrap_compute_conv2d(_compute_conv2d_counted),
+            relay.op.strategy.wrap_topi_schedule(_schedule_conv2d_3),
+            name="conv2d_high",
+            plevel=15)
+        return strategy
+
+    def _select_impl(dshape, wshape):
+        data = relay.var("data", shape=dshape)
+        weight = relay.var("wshape", shape=wshape)
+        out = relay.nn.conv2d(data, weight, padding=(1, 1))
+        out = run_infer_type(out)
+        return relay.backend.compile_engine.select_implementation(
+            relay.op.get("nn.conv2d"),
+            out.attrs,
+            [te.placeholder(dshape), te.placeholder(wshape)],
+            out.checked_type,
+            target)
+
+    relay.backend.compile_engine.clear_selection_cache()
+    with TempOpAttr("nn.conv2d", "FTVMStrategy", _counted_strategy):
+        with target:
+            impl, outs = _select_impl((1, 8, 7, 7), (32, 8, 3, 3))
+            assert impl.name == "conv2d_high"
+            assert num_computes[0] == 2
+            # a duplicate layer only computes the selected implementation
+            impl, outs = _select_impl((1, 8, 7, 7), (32, 8, 3, 3))
+            assert impl.name == "conv2d_high"
+            assert num_computes[0] == 3
+            assert list(outs[0].shape) == [1, 32, 7, 7]
+            # a different shape is selected again
+            _select_impl((1, 16, 7, 7), (32, 16, 3, 3))
+            assert num_computes[0] == 5
+            # a new dispatch context invalidates the selection
+            with autotvm.apply_history_best([]):
+                _select_impl((1, 8, 7, 7), (32, 8, 3, 3))
+                assert num_computes[0] == 7
+    # the default strategy is not served from the overridden one
+    impl, _ = _select_impl((1, 8, 7, 7), (32, 8, 3, 3))
+    assert impl.name not in ("conv2d_low", "conv2d_high")
+
 def test_compile_engine():
     engine = relay.backend.compile_engine.get()
     def get_func(shape):
@@ -237,6 +294,7 @@ def test_compile_nhwc_pack():
 if __name__ == "__main__":
     test_get_valid_implementations()
     test_select_implementation()
+    test_select_implementation_cache()
     test_compile_engine()
     test_compile_placeholder_bypass()
     test_compile_injective_with_tuple()
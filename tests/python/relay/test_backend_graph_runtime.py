@@ -14,11 +14,14 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import os
+
 import numpy as np
 
 import tvm
 from tvm import relay
-from tvm.contrib import graph_runtime
+from tvm.contrib import graph_runtime, util
+import tvm.relay.testing
 from tvm.relay.op import add
 from tvm.relay.testing.config import ctx_list
 
@@ -178,6 +181,186 @@ def test_gru_like():
             tvm.testing.assert_allclose(out, ref, rtol=1e-5, atol=1e-5)
 
 
+def test_parallel_build():
+    mod, params = relay.testing.resnet.get_workload(
+        num_layers=18, batch_size=1, image_shape=(3, 32, 32))
+    data = np.random.uniform(size=(1, 3, 32, 32)).astype("float32")
+
+    def run(n_parallel):
+        with relay.build_config(opt_level=3):
+            graph, lib, out_params = relay.build(
+                mod, "llvm", params=params, n_parallel=n_parallel)
+        m = graph_runtime.create(graph, lib, tvm.cpu())
+        m.set_input(**out_params)
+        m.run(data=data)
+        return graph, lib, out_params, m.get_output(0).asnumpy()
+
+    graph, _, ref_params, ref_out = run(1)
+    par_graph, par_lib, par_params, par_out = run(4)
+    assert par_graph == graph
+    assert len(par_lib.imported_modules) == 3
+    assert set(par_params.keys()) == set(ref_params.keys())
+    for key, value in ref_params.items():
+        np.testing.assert_equal(par_params[key].asnumpy(), value.asnumpy())
+    np.testing.assert_equal(par_out, ref_out)
+
+    # The linked modules can be exported and loaded back.
+    temp = util.tempdir()
+    path_lib = temp.relpath("deploy.so")
+    par_lib.export_library(path_lib)
+    m = graph_runtime.create(par_graph, tvm.runtime.load_module(path_lib), tvm.cpu())
+    m.set_input(**par_params)
+    m.run(data=data)
+    np.testing.assert_equal(m.get_output(0).asnumpy(), ref_out)
+
+    # Graphs with nothing to split are built serially or get an empty module.
+    x = relay.var("x", shape=(4, ))
+    x_data = np.random.uniform(size=(4, )).astype("float32")
+    for func, ref in [(relay.Function([x], relay.add(x, x)), x_data + x_data),
+                      (relay.Function([x], x), x_data)]:
+        with relay.build_config(opt_level=3):
+            graph, lib, _ = relay.build(tvm.IRModule.from_expr(func), "llvm", n_parallel=4)
+        m = graph_runtime.create(graph, lib, tvm.cpu())
+        m.run(x=x_data)
+        np.testing.assert_equal(m.get_output(0).asnumpy(), ref)
+
+
+def test_kernel_cache():
+    from tvm.relay.backend.kernel_cache import KernelCache
+    mod, params = relay.testing.mlp.get_workload(batch_size=1)
+    data = np.random.uniform(size=(1, 1, 28, 28)).astype("float32")
+    temp = util.tempdir()
+
+    def run(cache):
+        with cache, relay.build_config(opt_level=3):
+            graph, lib, out_params = relay.build(mod, "llvm", params=params)
+        m = graph_runtime.create(graph, lib, tvm.cpu())
+        m.set_input(**out_params)
+        m.run(data=data)
+        return lib, m.get_output(0).asnumpy()
+
+    cold = KernelCache(temp.relpath("cache"))
+    _, cold_out = run(cold)
+    cold_stats = cold.stats()
+    assert cold_stats["hits"] == 0
+    assert cold_stats["misses"] > 0
+    assert cold_stats["entries"] == cold_stats["misses"]
+
+    # A new cache object on the same directory reuses every function.
+    warm = KernelCache(temp.relpath("cache"))
+    warm_lib, warm_out = run(warm)
+    assert warm.stats()["hits"] == cold_stats["misses"]
+    assert warm.stats()["misses"] == 0
+    assert warm.stats()["hit_rate"] == 1.0
+    np.testing.assert_equal(warm_out, cold_out)
+
+    path_lib = temp.relpath("deploy.so")
+    warm_lib.export_library(path_lib)
+    assert tvm.runtime.load_module(path_lib)
+
+    # A key collision is caught by comparing the stored function.
+    func_paths = sorted(os.path.join(temp.relpath("cache"), name)
+                        for name in os.listdir(temp.relpath("cache")) if name.endswith(".json"))
+    assert len(func_paths) == cold_stats["entries"] > 1
+    with open(func_paths[0]) as func_file:
+        other_func = func_file.read()
+    for path in func_paths[1:]:
+        with open(path, "w") as func_file:
+            func_file.write(other_func)
+    collided = KernelCache(temp.relpath("cache"))
+    _, collided_out = run(collided)
+    assert collided.stats()["hits"] == 1
+    np.testing.assert_equal(collided_out, cold_out)
+
+    # Entries are evicted past the size limit.
+    tiny = KernelCache(temp.relpath("cache"), max_size=0)
+    tiny.clear()
+    run(tiny)
+    assert tiny.stats()["entries"] == 0
+    assert tiny.stats()["evictions"] > 0
+
+
+def test_incremental_build():
+    from tvm.relay.backend.incremental_build import IncrementalBuilder
+    data = np.random.uniform(size=(1, 1, 28, 28)).astype("float32")
+    temp = util.tempdir()
+
+    def get_mod(activation):
+        # an mlp whose second layer is fused with the given activation
+        net = relay.nn.batch_flatten(relay.var("data", shape=data.shape))
+        for i, (units, act) in enumerate([(128, relay.nn.relu), (64, activation)]):
+            net = relay.nn.dense(net, relay.var("fc%d_weight" % i), units=units)
+            net = act(relay.nn.bias_add(net, relay.var("fc%d_bias" % i)))
+        net = relay.nn.dense(net, relay.var("fc2_weight"), units=10)
+        net = relay.nn.softmax(relay.nn.bias_add(net, relay.var("fc2_bias")))
+        return relay.testing.create_workload(
+            relay.Function(relay.analysis.free_vars(net), net))
+
+    mod, params = get_mod(relay.nn.relu)
+
+    def run(build, params, mod=mod):
+        with relay.build_config(opt_level=3):
+            graph, lib, out_params = build(mod, "llvm", params=params)
+        m = graph_runtime.create(graph, lib, tvm.cpu())
+        m.set_input(**out_params)
+        m.run(data=data)
+        return m.get_output(0).asnumpy()
+
+    builder = IncrementalBuilder(temp.relpath("objects"))
+    out = run(builder.build, params)
+    np.testing.assert_allclose(out, run(relay.build, params), rtol=1e-5)
+    assert builder.stats[0]["reused"] == 0
+    assert builder.stats[0]["compiled"] > 0
+
+    # New parameter values do not change any fused function.
+    new_params = {key: tvm.nd.array(np.random.uniform(size=value.shape).astype(value.dtype))
+                  for key, value in params.items()}
+    out = run(builder.build, new_params)
+    np.testing.assert_allclose(out, run(relay.build, new_params), rtol=1e-5)
+    assert builder.stats[1]["compiled"] == 0
+    assert builder.stats[1]["reused"] == builder.stats[0]["compiled"]
+
+    # A new activation in one layer only compiles its fused function again.
+    new_mod, _ = get_mod(relay.nn.sigmoid)
+    out = run(builder.build, params, new_mod)
+    np.testing.assert_allclose(out, run(relay.build, params, new_mod), rtol=1e-5)
+    assert builder.stats[2]["compiled"] == 1
+    assert builder.stats[2]["reused"] == builder.stats[0]["compiled"] - 1
+
+    # A new builder on the same directory reuses the object files.
+    builder = IncrementalBuilder(temp.relpath("objects"))
+    run(builder.build, params)
+    assert builder.stats[0]["compiled"] == 0
+
+
+def test_build_cache():
+    mod, params = relay.testing.mlp.get_workload(batch_size=1)
+    data = np.random.uniform(size=(1, 1, 28, 28)).astype("float32")
+    temp = util.tempdir()
+
+    def build_and_export(path):
+        with relay.build_config(opt_level=3):
+            graph, lib, out_params = relay.build(mod, "llvm", params=params, n_parallel=2)
+        lib.export_library(path)
+        m = graph_runtime.create(graph, tvm.runtime.load_module(path), tvm.cpu())
+        m.set_input(**out_params)
+        m.run(data=data)
+        return m.get_output(0).asnumpy()
+
+    with tvm.driver.BuildCache(temp.relpath("cache")) as cache:
+        ref_out = build_and_export(temp.relpath("first.so"))
+        # the hits are new modules, the other modules are imported into them
+        out = build_and_export(temp.relpath("second.so"))
+    assert cache.hits > 0
+    np.testing.assert_equal(out, ref_out)
+
+    # the modules loaded from the disk can be exported as well
+    with tvm.driver.BuildCache(temp.relpath("cache")) as cache:
+        out = build_and_export(temp.relpath("third.so"))
+    assert cache.misses == 0
+    np.testing.assert_equal(out, ref_out)
+
+
 if __name__ == "__main__":
     test_plan_memory()
     test_with_params()
@@ -185,3 +368,7 @@ if __name__ == "__main__":
     test_add_op_tensor()
     test_add_op_broadcast()
     test_gru_like()
+    test_parallel_build()
+    test_kernel_cache()
+    test_incremental_build()
+    test_build_cache()
@@ -14,11 +14,24 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import sys
+
+import pytest
+
 import tvm
 from tvm import te
 from tvm import relay
 from tvm.relay import ExprFunctor, ExprMutator, ExprVisitor
 
+
+class IterativeVisitor(ExprVisitor):
+    iterative = True
+
+
+class IterativeMutator(ExprMutator):
+    iterative = True
+
+
 def check_visit(expr):
     try:
         ef = ExprFunctor()
@@ -33,6 +46,9 @@ def check_visit(expr):
     em = ExprMutator()
     assert em.visit(expr)
 
+    IterativeVisitor().visit(expr)
+    assert tvm.ir.structural_equal(IterativeMutator().visit(expr), em.visit(expr))
+
 
 def test_constant():
     check_visit(relay.const(1.0))
@@ -136,6 +152,38 @@ def test_match_completeness():
         assert result_expr.complete == completeness
 
 
+def test_iterative():
+    # every call takes at least two Python frames in the recursive visitor
+    depth = sys.getrecursionlimit()
+    x = relay.var('x', shape=())
+    expr = x
+    for i in range(depth):
+        expr = relay.add(expr, relay.const(float(i)))
+    with pytest.raises(RecursionError):
+        ExprVisitor().visit(expr)
+
+    class CallCounter(IterativeVisitor):
+        def __init__(self):
+            super().__init__()
+            self.calls = []
+
+        def visit_call(self, call):
+            self.calls.append(call)
+            super().visit_call(call)
+
+    counter = CallCounter()
+    counter.visit(expr)
+    assert len(counter.calls) == depth
+    assert counter.calls[-1].same_as(expr)
+    assert tvm.ir.structural_equal(IterativeMutator().visit(expr), expr)
+
+    body = x
+    for i in range(depth):
+        v = relay.var('v%d' % i, shape=())
+        body = relay.Let(v, relay.add(x, relay.const(float(i))), body)
+    assert tvm.ir.structural_equal(IterativeMutator().visit(body), body)
+
+
 if __name__ == "__main__":
     test_constant()
     test_tuple()
@@ -151,3 +199,4 @@ if __name__ == "__main__":
     test_memo()
     test_match()
     test_match_completeness()
+    test_iterative()
@@ -878,6 +878,28 @@ def test_import_grad():
     mod = tvm.IRModule()
     mod.import_from_std("gradient.rly")
 
+def test_descent_parser_matches_antlr():
+    pytest.importorskip("antlr4")
+    from tvm.relay import _parser, _text_parser
+    from tvm.relay import testing
+
+    mod, _ = testing.resnet.get_workload(num_layers=18)
+    text = mod.astext() + "\n"
+    expected = _parser.fromtext(text)
+    parsed = _text_parser.fromtext(text)
+    assert_graph_equal(parsed, expected)
+
+    def _spans(func):
+        spans = []
+        def _visit(node):
+            if isinstance(node, (relay.Call, relay.Var)) and node.span is not None:
+                spans.append((node.span.lineno, node.span.col_offset))
+        relay.analysis.post_order_visit(func, _visit)
+        return spans
+
+    assert _spans(parsed["main"]) == _spans(expected["main"])
+
+
 if __name__ == "__main__":
     test_graph()
     test_comments()
@@ -913,3 +935,4 @@ if __name__ == "__main__":
     test_duplicate_global_var()
     test_extern_adt_defn()
     test_import_grad()
+    test_descent_parser_matches_antlr()
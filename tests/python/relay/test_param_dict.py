@@ -53,6 +53,45 @@ def test_ndarray_reflection():
     np.testing.assert_equal(deser_param_dict['x'].asnumpy(), deser_param_dict['y'].asnumpy())
 
 
+def test_save_load_param_file():
+    x = np.random.uniform(size=(10, 3)).astype("float32")
+    y = np.arange(7).astype("int8")
+    params = {"x": tvm.nd.array(x), "y": y}
+    temp = util.tempdir()
+    path = temp.relpath("deploy.params")
+    relay.save_param_file(params, path)
+    with relay.load_param_file(path) as param_file:
+        assert len(param_file) == 2
+        assert set(param_file.keys()) == {"x", "y"}
+        np.testing.assert_equal(param_file.asnumpy("x"), x)
+        np.testing.assert_equal(param_file["y"].asnumpy(), y)
+        assert param_file["x"].dtype == "float32"
+        assert param_file["x"].shape == (10, 3)
+        data = param_file["x"].handle.contents.data
+        assert data % 64 == 0
+        mat = param_file.materialize("x")
+    np.testing.assert_equal(mat.asnumpy(), x)
+    param2 = relay.load_param_file(path, lazy=False)
+    np.testing.assert_equal(param2["x"].asnumpy(), x)
+    np.testing.assert_equal(param2["y"].asnumpy(), y)
+
+
+def test_graph_runtime_load_param_file():
+    x = relay.var("x", shape=(4, 3))
+    w = relay.var("w", shape=(4, 3))
+    func = relay.Function([x, w], relay.add(x, w))
+    w_data = np.random.uniform(size=(4, 3)).astype("float32")
+    x_data = np.random.uniform(size=(4, 3)).astype("float32")
+    graph, lib, _ = relay.build(func, target="llvm")
+    temp = util.tempdir()
+    path = temp.relpath("deploy.params")
+    relay.save_param_file({"w": w_data}, path)
+    mod = graph_runtime.create(graph, lib, tvm.cpu(0))
+    mod.load_params(relay.load_param_file(path))
+    mod.run(x=x_data)
+    tvm.testing.assert_allclose(mod.get_output(0).asnumpy(), x_data + w_data)
+
+
 def test_bigendian_rpc_param():
     """Test big endian rpc when there is a PowerPC RPC server available"""
     host = os.environ.get("TVM_POWERPC_TEST_HOST", None)
@@ -92,4 +131,6 @@ def test_bigendian_rpc_param():
 if __name__ == "__main__":
     test_save_load()
     test_ndarray_reflection()
+    test_save_load_param_file()
+    test_graph_runtime_load_param_file()
     test_bigendian_rpc_param()
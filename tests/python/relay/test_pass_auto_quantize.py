@@ -71,18 +71,100 @@ def test_calibrate_target(create_target):
             relay.quantize.quantize(mod, params, dataset)
 
 
-def test_calibrate_memory_bound():
+def test_calibrate_chunk_by_deprecated():
+    with pytest.warns(DeprecationWarning):
+        relay.quantize.qconfig(calibrate_chunk_by=4)
+
+
+@pytest.mark.parametrize("calibrate_mode", ["percentile", "mse"])
+def test_calibrate_histogram_modes(calibrate_mode):
     mod, params = testing.resnet.get_workload(num_layers=18)
     dataset = get_calibration_dataset("data")
-    import multiprocessing
-    num_cpu = multiprocessing.cpu_count()
-    with relay.quantize.qconfig(calibrate_mode="kl_divergence",
-                                calibrate_chunk_by=num_cpu):
+    with relay.quantize.qconfig(calibrate_mode=calibrate_mode):
         relay.quantize.quantize(mod, params, dataset)
 
 
+def test_streaming_histogram():
+    from tvm.relay.quantize._histogram import (
+        StreamingHistogram, find_scale_by_percentile, find_scale_by_mse)
+    batches = [np.random.uniform(-1, 1, size=1000),
+               np.zeros(100),
+               np.random.uniform(-5, 5, size=1000)]
+    hist = StreamingHistogram(num_bins=101)
+    for batch in batches:
+        hist.update(batch)
+    # the range grew by an odd factor and the bins were merged
+    assert hist.thres >= 5 * 0.99 and hist.thres <= 3 * 5
+    ref, _ = np.histogram(np.concatenate(batches), bins=101, range=(-hist.thres, hist.thres))
+    assert hist.count == 2100
+    assert np.abs(hist.hist - ref).max() <= 2
+
+    data = np.random.uniform(-1, 1, size=100000)
+    hist = StreamingHistogram()
+    hist.update(data)
+    np.testing.assert_allclose(find_scale_by_percentile(hist, 50), 0.5, atol=0.02)
+    assert find_scale_by_percentile(hist, 100) <= np.abs(data).max()
+    assert 0.9 <= find_scale_by_mse(hist, nbit=8) <= 1.0
+
+    # the long tail is clipped at low precision
+    data = np.random.laplace(size=100000)
+    hist = StreamingHistogram()
+    hist.update(data)
+    assert find_scale_by_mse(hist, nbit=4) < 0.8 * np.abs(data).max()
+
+
+def _sweep_accuracy(module):
+    data = np.random.uniform(size=(1, 16, 32, 32)).astype("float32")
+    module.set_input("data", data)
+    module.run()
+    return float(np.isfinite(module.get_output(0).asnumpy()).mean())
+
+
+def test_qconfig_sweep():
+    from tvm.relay.quantize import sweep
+    data = relay.var("data", shape=(1, 16, 32, 32))
+    out = data
+    for _ in range(2):
+        out = relay.nn.conv2d(out, relay.var("weight"), kernel_size=(3, 3),
+                              padding=(1, 1), channels=16)
+        out = relay.nn.relu(out)
+    mod, params = testing.create_workload(relay.Function(relay.analysis.free_vars(out), out))
+    dataset = [{"data": np.random.uniform(size=(1, 16, 32, 32)).astype("float32")}
+               for _ in range(2)]
+
+    qsweep = relay.quantize.QConfigSweep(mod, params, dataset, _sweep_accuracy,
+                                         n_parallel=2, number=1, repeat=1)
+    configs = sweep.grid(calibrate_mode=["global_scale", "percentile"],
+                         skip_conv_layers=[[0], []])
+    assert len(configs) == 4
+    results = qsweep.run(configs)
+    assert len(results) == 5
+    assert all(res.error is None for res in results)
+    assert any(res.pareto for res in results)
+    # the annotated modules and histograms are shared across calibrate modes
+    assert len(qsweep._annotated) == 2
+    assert len(qsweep._histograms) == 2
+    assert "float" in sweep.format_table(results)
+
+
+def test_pareto_front():
+    from tvm.relay.quantize.sweep import SweepResult, pareto_front
+    results = [SweepResult({"a": 0}, 0.9, 2.0, False, None),
+               SweepResult({"a": 1}, 0.8, 1.0, False, None),
+               SweepResult({"a": 2}, 0.7, 1.5, False, None),
+               SweepResult({"a": 3}, None, None, False, "failed")]
+    results = pareto_front(results)
+    assert [res.config["a"] for res in results] == [1, 2, 0, 3]
+    assert [res.pareto for res in results] == [True, False, True, False]
+
+
 if __name__ == "__main__":
     test_mul_rewrite()
     test_calibrate_target(False)
     test_calibrate_target(True)
-    test_calibrate_memory_bound()
+    test_calibrate_chunk_by_deprecated()
+    test_calibrate_histogram_modes("percentile")
+    test_calibrate_histogram_modes("mse")
+    test_streaming_histogram()
+    test_qconfig_sweep()
+    test_pareto_front()
@@ -15,6 +15,8 @@
 # specific language governing permissions and limitations
 # under the License.
 """Unit tests for relay pass manager."""
+import json
+
 import numpy as np
 import pytest
 
@@ -554,5 +556,49 @@ def test_print_debug_callback():
     assert __TRACE_COUNTER__ == 4
 
 
+def test_compile_profiler(tmpdir):
+    x = relay.var("x", shape=(1, 3, 16, 16))
+    w = relay.var("w", shape=(8, 3, 3, 3))
+    y = relay.nn.relu(relay.nn.conv2d(x, w, padding=(1, 1)))
+    mod = tvm.IRModule.from_expr(relay.Function([x, w], y))
+
+    with tvm.transform.PassContext(opt_level=3, disabled_pass=["AlterOpLayout"]):
+        with tvm.ir.CompileProfiler() as prof:
+            assert tvm.transform.PassContext.current().opt_level == 3
+            relay.build(mod, "llvm")
+    assert tvm.ir.CompileProfiler.current is None
+
+    categories = {event.category for event in prof.events}
+    assert {"build", "pass", "strategy", "compute", "schedule", "lower", "codegen"} <= categories
+    names = {event.name for event in prof.events if event.category == "pass"}
+    assert "FuseOps" in names and "AlterOpLayout" not in names
+    for event in prof.events:
+        assert event.duration is not None and event.duration >= 0
+        if event.category in ("pass", "lower"):
+            assert event.nodes > 0
+    lower = [event for event in prof.events if event.category == "lower"]
+    assert all(prof.events[event.parent].name == "graph_codegen" for event in lower)
+    report = prof.report()
+    assert sum(row["count"] for row in report) == len(prof.events)
+    assert "FuseOps" in prof.summary()
+
+    trace_path = str(tmpdir.join("trace.json"))
+    prof.export_chrome_trace(trace_path)
+    with open(trace_path) as trace_file:
+        assert len(json.load(trace_file)["traceEvents"]) == len(prof.events)
+    flame_path = str(tmpdir.join("flame.txt"))
+    prof.export_flame_graph(flame_path)
+    with open(flame_path) as flame_file:
+        prefix = "build:relay.build;build:graph_codegen;lower:"
+        assert any(line.startswith(prefix) for line in flame_file)
+
+    # the profiler can also be given as the trace of a pass context
+    prof = tvm.ir.CompileProfiler(count_nodes=False)
+    with tvm.transform.PassContext(opt_level=3, trace=prof):
+        relay.build(mod, "llvm")
+    assert any(event.category == "lower" for event in prof.events)
+    assert all(event.nodes is None for event in prof.events)
+
+
 if __name__ == "__main__":
     pytest.main()
@@ -622,5 +622,46 @@ def test_loop_free_var():
         mod["main"] = relay.Function(relay.analysis.free_vars(ret), ret)
         check_result(args, expected, mod=mod)
 
+def test_vm_pool():
+    x = relay.var('x', shape=(10, 10))
+    y = relay.var('y', shape=(10, 10))
+    mod = tvm.IRModule()
+    mod["main"] = relay.Function([x, y], x * y + y)
+    exe = relay.vm.compile(mod, "llvm")
+
+    inputs = [(np.random.rand(10, 10).astype('float32'),
+               np.random.rand(10, 10).astype('float32')) for _ in range(8)]
+    requests = [[x_data, y_data] for x_data, y_data in inputs[:4]]
+    requests += [{"y": y_data, "x": x_data} for x_data, y_data in inputs[4:]]
+    with runtime.vm.VirtualMachinePool(exe, tvm.cpu(), size=3) as pool:
+        futures = pool.invoke_batch(requests)
+        for (x_data, y_data), future in zip(inputs, futures):
+            tvm.testing.assert_allclose(future.result().asnumpy(), x_data * y_data + y_data)
+            assert future.latency >= future.run_time > 0
+
+        future = pool.submit("main", inputs[0][0], z=inputs[0][1])
+        with pytest.raises(ValueError):
+            future.result()
+
+def test_vm_pool_parallel():
+    x = relay.var('x', shape=(512, 512))
+    out = x
+    for _ in range(8):
+        out = relay.nn.dense(out, x)
+    mod = tvm.IRModule()
+    mod["main"] = relay.Function([x], out)
+    exe = relay.vm.compile(mod, "llvm")
+
+    x_data = np.random.rand(512, 512).astype('float32') / 512
+    with runtime.vm.VirtualMachinePool(exe, tvm.cpu(), size=2) as pool:
+        # warm up, then time two concurrent requests
+        for future in pool.invoke_batch([[x_data]] * 2):
+            future.result()
+        futures = pool.invoke_batch([[x_data]] * 2)
+        for future in futures:
+            future.result()
+    # run one after the other, the second request would wait for the whole first one
+    assert max(f.latency for f in futures) < sum(f.run_time for f in futures)
+
 if __name__ == "__main__":
     pytest.main([__file__])
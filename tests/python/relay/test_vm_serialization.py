@@ -162,6 +162,40 @@ def test_const():
     tvm.testing.assert_allclose(res.asnumpy(), x_data + 1)
 
 
+def test_save_load_file():
+    c1_data = np.random.rand(10, 10).astype('float32')
+    c2_data = np.random.rand(3).astype('float32')
+    x = relay.var('x', shape=(10, 10), dtype='float32')
+    y = relay.add(x, relay.const(c1_data))
+    f = relay.Function([x], relay.Tuple([y, relay.const(c2_data) * relay.const(2.0)]))
+    exe = create_exec(f)
+
+    tmp = util.tempdir()
+    path_lib = tmp.relpath("lib.so")
+    path_exec = tmp.relpath("exec.vm")
+    exe.lib.export_library(path_lib)
+    exe.save_file(path_exec)
+    loaded_lib = tvm.runtime.load_module(path_lib)
+
+    des_exec = _vm.Executable.load_file(path_exec, loaded_lib)
+    assert des_exec.stats == exe.stats
+    assert des_exec.bytecode == exe.bytecode
+    des_vm = _vm.VirtualMachine(des_exec)
+    des_vm.init(tvm.cpu())
+    x_data = np.random.rand(10, 10).astype('float32')
+    res = veval(des_vm, x_data)
+    tvm.testing.assert_allclose(res[0].asnumpy(), x_data + c1_data)
+    tvm.testing.assert_allclose(res[1].asnumpy(), c2_data * 2.0)
+
+    # A lazily loaded executable can be saved again.
+    code, _ = des_exec.save()
+    re_exec = _vm.Executable.load_exec(code, loaded_lib)
+    re_vm = _vm.VirtualMachine(re_exec)
+    re_vm.init(tvm.cpu())
+    res = veval(re_vm, x_data)
+    tvm.testing.assert_allclose(res[0].asnumpy(), x_data + c1_data)
+
+
 def test_if():
     x = relay.var('x', shape=(10, 10))
     y = relay.var('y', shape=(10, 10))
@@ -336,6 +370,7 @@ if __name__ == "__main__":
     test_serializer()
     test_save_load()
     test_const()
+    test_save_load_file()
     test_if()
     test_loop()
     test_tuple()
@@ -101,6 +101,20 @@ def test_graph_simple():
         out = mod.get_output(0, tvm.nd.empty((n,)))
         np.testing.assert_equal(out.asnumpy(), a + 1)
 
+        #verify the structured profile
+        files = sorted(os.listdir(directory))
+        prof = mod.profile(number=5, capture="^add$", flops={"add": n})
+        assert sorted(os.listdir(directory)) == files
+        assert list(prof.name) == ["add"]
+        assert list(prof.op) == ["myadd"]
+        assert prof.bytes[0] == 2 * n * 4
+        assert prof.flops[0] == n
+        assert prof.min_us[0] <= prof.p50_us[0] <= prof.max_us[0]
+        assert prof.mean_us[0] > 0
+        captured = mod.get_captured_outputs()
+        assert list(captured.keys()) == ["add_0"]
+        np.testing.assert_equal(captured["add_0"].asnumpy(), a + 1)
+
         mod.exit()
         #verify dump root delete after cleanup
         assert(not os.path.exists(directory))
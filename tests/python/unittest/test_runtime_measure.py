@@ -59,6 +59,46 @@ def test_min_repeat_ms():
     assert ct > 10 + 2
 
 
+def test_summarize_costs():
+    from tvm.runtime.module import summarize_costs
+    costs = [1.0, 1.1, 0.9, 1.0, 1.05, 0.95, 10.0]
+    res = summarize_costs(costs)
+    assert res.results == tuple(costs)
+    assert res.median == 1.0
+    assert res.num_outliers == 1
+    assert abs(res.mean - 1.0) < 1e-9
+    assert res.ci[0] <= res.median <= res.ci[1]
+    assert not res.unstable
+
+
+def test_adaptive_time_evaluator():
+    n = 1024
+    A = te.placeholder((n,), name='A')
+    B = te.compute(A.shape, lambda i: A[i] + 1.0, name='B')
+    s = te.create_schedule(B.op)
+    func = tvm.build(s, [A, B])
+    a = tvm.nd.empty((n,))
+    b = tvm.nd.empty((n,))
+
+    ftimer = func.adaptive_time_evaluator(func.entry_name, tvm.cpu(), number=2,
+                                          min_repeat=5, max_repeat=20, batch=5,
+                                          rel_ci=1e9)
+    res = ftimer(a, b)
+    assert len(res.results) == 5
+    assert not res.unstable
+    assert res.ci[0] <= res.median <= res.ci[1]
+
+    # an impossible precision stops at max_repeat and is flagged.
+    ftimer = func.adaptive_time_evaluator(func.entry_name, tvm.cpu(), number=2,
+                                          min_repeat=5, max_repeat=10, batch=5,
+                                          rel_ci=-1.0)
+    res = ftimer(a, b)
+    assert len(res.results) == 10
+    assert res.unstable
+
+
 if __name__ == "__main__":
     test_min_repeat_ms()
+    test_summarize_costs()
+    test_adaptive_time_evaluator()
 
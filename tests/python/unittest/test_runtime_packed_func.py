@@ -14,6 +14,8 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import threading
+
 import tvm
 from tvm import te
 import tvm.testing
@@ -52,6 +54,29 @@ def test_get_callback_with_node():
     assert(y.value == 10)
 
 
+def test_release_gil_callback():
+    def add_one(x):
+        return x + 1
+    f = tvm.runtime.convert(add_one)
+
+    # a python function called from C++, which calls back into python
+    @tvm.register_func("testing.release_gil_callback")
+    def call_twice(g, x):
+        return g(g(x))
+    call = tvm.get_global_func("testing.release_gil_callback")
+
+    results = []
+    def worker():
+        with tvm.runtime.packed_func.ReleaseGIL():
+            results.append([call(f, i) for i in range(100)])
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [list(range(2, 102))] * 4
+
+
 def test_return_func():
     def addy(y):
         def add(x):
@@ -304,6 +329,7 @@ if __name__ == "__main__":
     test_empty_array()
     test_get_global()
     test_get_callback_with_node()
+    test_release_gil_callback()
     test_convert()
     test_return_func()
     test_byte_array()
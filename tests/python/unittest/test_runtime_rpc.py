@@ -17,6 +17,7 @@
 import tvm
 from tvm import te
 import tvm.testing
+import hashlib
 import os
 import logging
 import time
@@ -25,7 +26,7 @@ import multiprocessing
 import numpy as np
 from tvm import rpc
 from tvm.contrib import util
-from tvm.rpc.tracker import Tracker
+from tvm.rpc.tracker import Tracker, HealthPolicy
 
 
 def test_bigendian_rpc():
@@ -111,6 +112,37 @@ def test_rpc_file_exchange():
     rev = remote.download("dat.bin")
     assert(rev == blob)
 
+def test_rpc_upload_cache():
+    if not tvm.runtime.enabled("rpc"):
+        return
+    cache_dir = util.tempdir()
+    server = rpc.Server("localhost", upload_cache_size=1024,
+                        upload_cache_path=cache_dir.temp_dir)
+    remote = rpc.connect(server.host, server.port)
+    blob = bytearray(np.random.randint(0, 10, size=(512), dtype="uint8"))
+    remote.upload(blob, "a.bin")
+    assert cache_dir.listdir() == [hashlib.sha256(blob).hexdigest()]
+    # served from the cache
+    remote.upload(blob, "b.bin")
+    assert remote.download("b.bin") == blob
+    assert len(cache_dir.listdir()) == 1
+    # the least recently used entry is evicted to stay below the limit
+    other = bytearray(np.random.randint(10, 20, size=(768), dtype="uint8"))
+    remote.upload(other, "c.bin")
+    assert remote.download("c.bin") == other
+    assert cache_dir.listdir() == [hashlib.sha256(other).hexdigest()]
+    remote.upload(blob, "d.bin", cache=False)
+    assert remote.download("d.bin") == blob
+    assert cache_dir.listdir() == [hashlib.sha256(other).hexdigest()]
+    # files that do not match their digest are not cached
+    insert = remote.get_function("tvm.rpc.server.upload_cache_insert")
+    insert(hashlib.sha256(other).hexdigest(), "d.bin")
+    insert("0" * 64, "d.bin")
+    assert cache_dir.listdir() == [hashlib.sha256(other).hexdigest()]
+    remote.upload(other, "e.bin")
+    assert remote.download("e.bin") == other
+    server.terminate()
+
 def test_rpc_remote_module():
     if not tvm.runtime.enabled("rpc"):
         return
@@ -331,6 +363,47 @@ def test_rpc_tracker_request():
     server.terminate()
     tracker.terminate()
 
+def test_rpc_tracker_health():
+    policy = HealthPolicy(min_reports=2, quarantine_time=2)
+    tracker = Tracker('localhost', port=9000, port_end=10000, health_policy=policy)
+    device_key = 'test_device'
+    servers = [rpc.Server('localhost', port=9000, port_end=10000,
+                          key=device_key,
+                          tracker_addr=(tracker.host, tracker.port)) for _ in range(3)]
+    time.sleep(1)
+    client = rpc.connect_tracker(tracker.host, tracker.port)
+
+    remotes = [client.request(device_key) for _ in range(3)]
+    addrs = [remote.server_addr for remote in remotes]
+    for _ in range(2):
+        for addr in addrs[:2]:
+            assert client.report(addr, latency=0.1, success=True)
+        assert client.report(addrs[2], latency=1.0, success=True)
+    assert not client.report(("unknown", 1), latency=1.0)
+    del remotes
+    time.sleep(1)
+
+    summary = client.summary()
+    assert summary['queue_info'][device_key]['free'] == 2
+    assert summary['queue_info'][device_key]['quarantined'] == 1
+    quarantined = [item['health']['quarantined'] for item in summary['server_info']]
+    assert sorted(quarantined) == [False, False, True]
+    assert "quarantined (latency" in client.text_summary()
+
+    # the straggler is never handed out while in quarantine
+    remotes = [client.request(device_key) for _ in range(2)]
+    assert addrs[2] not in [remote.server_addr for remote in remotes]
+    del remotes
+
+    time.sleep(2.5)
+    summary = client.summary()
+    assert summary['queue_info'][device_key]['free'] == 3
+    assert summary['queue_info'][device_key]['quarantined'] == 0
+
+    for server in servers:
+        server.terminate()
+    tracker.terminate()
+
 
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -339,8 +412,10 @@ if __name__ == "__main__":
     test_bigendian_rpc()
     test_rpc_remote_module()
     test_rpc_file_exchange()
+    test_rpc_upload_cache()
     test_rpc_array()
     test_rpc_simple()
     test_local_func()
     test_rpc_tracker_register()
     test_rpc_tracker_request()
+    test_rpc_tracker_health()
@@ -14,6 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import json
 import numpy as np
 
 import tvm
@@ -21,6 +22,7 @@ from tvm import te
 from tvm.runtime import profiler_vm
 from tvm import relay
 from tvm.relay.testing import resnet
+from tvm.contrib import util
 
 def test_basic():
     mod, params = resnet.get_workload()
@@ -37,5 +39,45 @@ def test_basic():
     print("\n{}".format(vm.get_stat()))
     print("\n{}".format(vm.get_stat(False)))
 
+def test_structured_stats():
+    if not profiler_vm.enabled():
+        return
+    x = relay.var("x", shape=(8, 8))
+    y = relay.nn.relu(relay.add(x, relay.const(1.0)))
+    mod = tvm.IRModule.from_expr(relay.Function([x], relay.exp(y)))
+    exe = relay.vm.compile(mod, "llvm")
+    vm = profiler_vm.VirtualMachineProfiler(exe, window=2)
+    vm.init(tvm.cpu())
+
+    data = np.random.rand(8, 8).astype('float32')
+    for _ in range(3):
+        vm.invoke("main", [data])
+    stats = vm.get_stats()
+    assert len(stats) > 0
+    assert all(stats.count == 3)
+    assert all(stats.min_us <= stats.mean_us)
+    assert all(stats.mean_us <= stats.max_us)
+    # Only the last two calls are kept.
+    assert len(vm.get_events()["calls"]) == 2
+
+    alloc_stats = vm.get_alloc_stats()
+    assert alloc_stats["count"] > 0
+    assert alloc_stats["bytes"] >= 3 * 8 * 8 * 4
+    assert alloc_stats["window_count"] <= 2
+
+    temp = util.tempdir()
+    path = temp.relpath("trace.json")
+    vm.dump_chrome_trace(path)
+    with open(path) as f:
+        trace = json.load(f)
+    assert len(trace["traceEvents"]) == 2 + alloc_stats["window_count"]
+    assert all(e["ph"] == "X" for e in trace["traceEvents"])
+
+    vm.reset()
+    assert len(vm.get_stats()) == 0
+    assert vm.get_alloc_stats()["count"] == 0
+
+
 if __name__ == "__main__":
     test_basic()
+    test_structured_stats()
@@ -14,8 +14,11 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+import threading
+import numpy as np
 import tvm
 from tvm import te
+from tvm.contrib import util
 
 def test_lower_rfactor():
     n = te.size_var("n")
@@ -52,7 +55,45 @@ def test_split_uneven_unique_likely():
     assert isinstance(stmt.body.body.body, tvm.tir.stmt.IfThenElse)
     assert str(stmt.body.body.body).count("likely") == 1
 
+def test_build_cache():
+    def _build(n):
+        A = te.placeholder((n,), name='A')
+        B = te.compute((n,), lambda i: A[i] + 1.0, name='B')
+        s = te.create_schedule(B.op)
+        return tvm.build(s, [A, B], "llvm")
+
+    with tvm.driver.BuildCache() as cache:
+        f16 = _build(16)
+        # every hit is a new module
+        assert _build(16).handle.value != f16.handle.value
+        _build(32)
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+    # the cache only applies to the thread that entered it
+    with tvm.driver.BuildCache() as cache:
+        _build(16)
+        thread = threading.Thread(target=_build, args=(16,))
+        thread.start()
+        thread.join()
+        assert tvm.driver.BuildCache.current() is cache
+    assert cache.misses == 1 and cache.hits == 0
+    assert tvm.driver.BuildCache.current() is None
+
+    # a persistent cache is shared by later caches
+    temp = util.tempdir()
+    with tvm.driver.BuildCache(temp.path):
+        _build(16)
+    with tvm.driver.BuildCache(temp.path) as cache:
+        f16 = _build(16)
+    assert cache.hits == 1
+    a = tvm.nd.array(np.random.uniform(size=16).astype('float32'))
+    b = tvm.nd.empty((16,), 'float32')
+    f16(a, b)
+    tvm.testing.assert_allclose(b.asnumpy(), a.asnumpy() + 1.0)
+
 if __name__ == "__main__":
     test_lower_rfactor()
     test_dependent_output_shape()
     test_split_uneven_unique_likely()
+    test_build_cache()
@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-import tvm, inspect, sys, traceback, numpy, pytest, types, os
+import tvm, inspect, sys, traceback, numpy, pytest, types, os, threading
 
 from tvm import te
 from tvm.contrib import util
@@ -818,6 +818,79 @@ def test_array_inputs():
     mod(*input_nd, out_nd)
     tvm.testing.assert_allclose(out_nd.asnumpy(), out_ref)
 
+def test_parse_once():
+    @script
+    def add_one(a):
+        b = output_tensor(a.shape, a.dtype)
+        for i in range(a.shape[0]):
+            b[i] = a[i] + 1.0
+        return b
+
+    n = te.size_var('n')
+    a = te.placeholder((n, ), name='a')
+    b = add_one(a)
+    m = te.size_var('m')
+    c = te.placeholder((m, ), name='c')
+    d = add_one(c)
+
+    # the second call instantiates the template of the first one
+    assert d.op.input_tensors[0].same_as(c)
+    assert d.op.body.extent.same_as(m)
+    assert not d.op.body.loop_var.same_as(b.op.body.loop_var)
+    run_and_check(add_one, [c], {m: 64})
+
+    # the templates hold placeholders instead of the upstream compute operations
+    e = te.compute((16, ), lambda i: a[i] * 2.0, name='upstream')
+    add_one(e)
+    f = te.compute((16, ), lambda i: a[i] * 3.0, name='upstream')
+    g = add_one(f)
+    assert g.op.input_tensors[0].same_as(f)
+    templates = te.hybrid.parser._OP_TEMPLATES
+    assert all('"ComputeOp"' not in template
+               for by_key in templates.values() for template in by_key.values())
+
+    # captured arrays are keyed by content, other objects by identity
+    closure_key = te.hybrid.util._closure_key
+    w = numpy.ones((4, ), dtype='float32')
+    assert closure_key({'w': w}) == closure_key({'w': w.copy()})
+    assert closure_key({'w': w}) != closure_key({'w': w * 2.0})
+    key = closure_key({'f': lambda x: x})
+    # the key keeps the function alive, a new one never gets its id
+    assert key != closure_key({'f': lambda x: x})
+
+def test_emulator():
+    a = numpy.random.uniform(size=(99,)).astype('float32')
+    b = numpy.random.uniform(size=(101,)).astype('float32')
+    ref = outer_product(99, 101, a, b)
+
+    emulator = te.hybrid.Emulator()
+    with emulator:
+        out = outer_product(99, 101, a, b)
+        tvm.testing.assert_allclose(out, ref, rtol=1e-5)
+        outer_product(99, 101, a[::-1].copy(), b[::-1].copy())
+        assert emulator.num_builds == 1
+        outer_product(50, 101, a[:50], b)
+        assert emulator.num_builds == 2
+
+        # lists of arrays are emulated in Python
+        def add_pair(pair):
+            c = output_tensor(pair[0].shape, pair[0].dtype)
+            for i in range(pair[0].shape[0]):
+                c[i] = pair[0][i] + pair[1][i]
+            return c
+        out = emulator.run(add_pair, [[a, a[::-1].copy()]])
+        tvm.testing.assert_allclose(out, a + a[::-1])
+        assert emulator.num_builds == 2
+
+        # the emulator only applies to the thread that entered it
+        currents = []
+        thread = threading.Thread(target=lambda: currents.append(te.hybrid.Emulator.current()))
+        thread.start()
+        thread.join()
+        assert currents == [None]
+        assert te.hybrid.Emulator.current() is emulator
+    assert te.hybrid.Emulator.current() is None
+
 if __name__ == "__main__":
     test_outer_product()
     test_fanout()
@@ -837,5 +910,7 @@ if __name__ == "__main__":
     test_schedule()
     test_capture()
     test_array_inputs()
+    test_parse_once()
+    test_emulator()
     # TODO:
     # test_inplace()
@@ -18,6 +18,7 @@
 """1D convolution in python"""
 import numpy as np
 from topi.nn.util import get_pad_tuple1d
+from .sliding_window_python import correlate_python
 
 
 def dilate_np(x, dilation):
@@ -83,11 +84,6 @@ def conv1d_ncw_python(a_np, w_np, stride, padding, dilation):
     padded_a_np = np.zeros((batch, in_c, in_w + pad_left + pad_right))
     padded_a_np[:, :, pad_left:(in_w + pad_left)] = a_np
 
-    b_np = np.zeros((batch, out_c, out_w))
-    for n in range(batch):
-        for f in range(out_c):
-            for c in range(in_c):
-                out = np.convolve(
-                    padded_a_np[n, c], np.flip(dilate_np(w_np[f, c], dilation)), mode='valid')
-                b_np[n, f] += out[::stride]
+    b_np = correlate_python(padded_a_np, w_np, stride, dilation)
+    assert b_np.shape == (batch, out_c, out_w)
     return b_np
@@ -17,9 +17,9 @@
 # pylint: disable=unused-variable
 """Transposed 1D convolution in python"""
 import numpy as np
-import scipy
 import topi
 from topi.nn.util import get_pad_tuple1d
+from .sliding_window_python import correlate_python
 
 def conv1d_transpose_ncw_python(a_np, w_np, stride, padding):
     """Transposed 1D convolution operator in NCW layout.
@@ -61,11 +61,7 @@ def conv1d_transpose_ncw_python(a_np, w_np, stride, padding):
     padded_a_np[:, :, bpad_left:dilated_a_np.shape[2]+bpad_left] = dilated_a_np
     # convolution stage
     out_w = (in_w - 1) * stride_w - fpad_left - fpad_right + filter_w
-    b_np = np.zeros((batch, out_c, out_w))
-    for n in range(batch):
-        for f in range(out_c):
-            for c in range(in_c):
-                out = scipy.signal.convolve(
-                    padded_a_np[n, c], w_np[c, f], mode='valid')
-                b_np[n, f] += out
+    # a convolution is a correlation with the flipped kernel
+    b_np = correlate_python(padded_a_np, np.flip(w_np, axis=2).transpose(1, 0, 2), 1)
+    assert b_np.shape == (batch, out_c, out_w)
     return b_np
@@ -17,8 +17,8 @@
 # pylint: disable=invalid-name, line-too-long, unused-variable, too-many-locals, too-many-branches
 """Convolution in python"""
 import numpy as np
-import scipy.signal
 from topi.nn.util import get_pad_tuple
+from .sliding_window_python import correlate_python
 
 
 def _conv2d_nchw_python(a_np, w_np, stride, padding):
@@ -58,19 +58,11 @@ def _conv2d_nchw_python(a_np, w_np, stride, padding):
     out_channel = num_filter
     out_height = (in_height - kernel_h + pad_h) // stride_h + 1
     out_width = (in_width - kernel_w + pad_w) // stride_w + 1
-    b_np = np.zeros((batch, out_channel, out_height, out_width))
     # computation
-    for n in range(batch):
-        for f in range(out_channel):
-            for c in range(in_channel):
-                if pad_h > 0 or pad_w > 0:
-                    apad = np.zeros((in_height + pad_h, in_width + pad_w))
-                    apad[pad_top:pad_top + in_height, pad_left:pad_left + in_width] = a_np[n, c]
-                else:
-                    apad = a_np[n, c]
-                out = scipy.signal.convolve2d(
-                    apad, np.rot90(np.rot90(w_np[f, c])), mode='valid')
-                b_np[n, f] += out[::stride_h, ::stride_w]
+    apad = np.pad(a_np, ((0, 0), (0, 0), (pad_top, pad_bottom), (pad_left, pad_right)),
+                  mode='constant')
+    b_np = correlate_python(apad, w_np, (stride_h, stride_w))
+    assert b_np.shape == (batch, out_channel, out_height, out_width)
     return b_np
 
 
@@ -17,9 +17,9 @@
 # pylint: disable=unused-variable
 """Transposed convolution in python"""
 import numpy as np
-import scipy
 import topi
 from topi.nn.util import get_pad_tuple
+from .sliding_window_python import correlate_python
 
 
 def conv2d_transpose_nchw_python(a_np, w_np, stride, padding):
@@ -65,13 +65,9 @@ def conv2d_transpose_nchw_python(a_np, w_np, stride, padding):
     # convolution stage
     out_h = (in_h - 1) * stride_h - fpad_top - fpad_bottom + filter_h
     out_w = (in_w - 1) * stride_w - fpad_left - fpad_right + filter_w
-    b_np = np.zeros((batch, out_c, out_h, out_w))
-    for n in range(batch):
-        for f in range(out_c):
-            for c in range(in_c):
-                out = scipy.signal.convolve2d(
-                    padded_a_np[n, c], w_np[c, f], mode='valid')
-                b_np[n, f] += out
+    # a convolution is a correlation with the flipped kernel
+    b_np = correlate_python(padded_a_np, np.flip(w_np, axis=(2, 3)).transpose(1, 0, 2, 3), 1)
+    assert b_np.shape == (batch, out_c, out_h, out_w)
     return b_np
 
 
@@ -16,7 +16,6 @@
 # under the License.
 # pylint: disable=invalid-name, too-many-locals, too-many-arguments
 """Deformable convolution in python"""
-import itertools
 import numpy as np
 from topi.nn.util import get_pad_tuple
 
@@ -77,43 +76,36 @@ def deformable_conv2d_nchw_python(a_np, offset_np, w_np, stride, padding, dilati
     else:
         dilation_h, dilation_w = dilation
 
-
-    def _bilinear(n, c, h, w):
-        low_h, low_w = int(h), int(w)
-        high_h = min(low_h + 1, in_height - 1)
-        high_w = min(low_w + 1, in_width - 1)
-        y_lerp = h - low_h
-        x_lerp = w - low_w
-
-        bottom = (1 - x_lerp) * a_np[n, c, low_h, low_w] + x_lerp * a_np[n, c, low_h, high_w]
-        top = (1 - x_lerp) * a_np[n, c, high_h, low_w] + x_lerp * a_np[n, c, high_h, high_w]
-        return (1 - y_lerp) * bottom + y_lerp * top
-
-
-    a_deform = np.zeros((batch, in_channel, out_height, out_width, kernel_h, kernel_w), dtype=dtype)
-    for n, h, w in itertools.product(range(batch), range(out_height), range(out_width)):
-        offset = offset_np[n, :, h, w].reshape(deformable_groups, kernel_h, kernel_w, 2)
-        in_h = h * stride_h - pad_top
-        in_w = w * stride_w - pad_left
-
-        index_h_base, index_w_base = np.meshgrid(
-            np.arange(in_h, in_h + kernel_h * dilation_h, dilation_h, dtype=offset_np.dtype),
-            np.arange(in_w, in_w + kernel_w * dilation_w, dilation_w, dtype=offset_np.dtype),
-            indexing='ij')
-
-        for c, kh, kw in itertools.product(range(in_channel), range(kernel_h), range(kernel_w)):
-            dg = c // ic_per_dgroup
-            index_h = index_h_base + offset[dg, ..., 0]
-            index_w = index_w_base + offset[dg, ..., 1]
-
-            y, x = index_h[kh, kw], index_w[kh, kw]
-            if y < 0 or y >= in_height or x < 0 or x >= in_width:
-                continue
-            a_deform[n, c, h, w, kh, kw] = _bilinear(n, c, y, x)
-
-    b_np = np.zeros((batch, out_channel, out_height, out_width), dtype=dtype)
-    for n, c, f, h, w in itertools.product(range(batch), range(in_channel), range(out_channel),
-                                           range(out_height), range(out_width)):
-        b_np[n, f, h, w] += np.tensordot(a_deform[n, c, h, w], w_np[f, c])
-
-    return b_np
+    # sampling positions with shape [batch, deformable_groups, kernel_h, kernel_w,
+    #                                out_height, out_width]
+    offset = offset_np.reshape(batch, deformable_groups, kernel_h, kernel_w, 2,
+                               out_height, out_width)
+    base_h = (np.arange(kernel_h) * dilation_h).reshape(-1, 1, 1, 1) + \
+        (np.arange(out_height) * stride_h - pad_top).reshape(1, 1, -1, 1)
+    base_w = (np.arange(kernel_w) * dilation_w).reshape(1, -1, 1, 1) + \
+        (np.arange(out_width) * stride_w - pad_left).reshape(1, 1, 1, -1)
+    y = base_h.astype(offset_np.dtype) + offset[:, :, :, :, 0]
+    x = base_w.astype(offset_np.dtype) + offset[:, :, :, :, 1]
+    valid = (y >= 0) & (y < in_height) & (x >= 0) & (x < in_width)
+
+    low_h = np.clip(np.floor(y), 0, in_height - 1).astype("int64")
+    low_w = np.clip(np.floor(x), 0, in_width - 1).astype("int64")
+    high_h = np.minimum(low_h + 1, in_height - 1)
+    high_w = np.minimum(low_w + 1, in_width - 1)
+    y_lerp = (y - low_h)[..., None]
+    x_lerp = (x - low_w)[..., None]
+
+    # gather with shape [batch, deformable_groups, kernel_h, kernel_w,
+    #                    out_height, out_width, ic_per_dgroup]
+    a_group = a_np.reshape(batch, deformable_groups, ic_per_dgroup, in_height, in_width)
+    n_idx = np.arange(batch).reshape(-1, 1, 1, 1, 1, 1)
+    g_idx = np.arange(deformable_groups).reshape(1, -1, 1, 1, 1, 1)
+    bottom = (1 - x_lerp) * a_group[n_idx, g_idx, :, low_h, low_w] + \
+        x_lerp * a_group[n_idx, g_idx, :, low_h, high_w]
+    top = (1 - x_lerp) * a_group[n_idx, g_idx, :, high_h, low_w] + \
+        x_lerp * a_group[n_idx, g_idx, :, high_h, high_w]
+    a_deform = np.where(valid[..., None], (1 - y_lerp) * bottom + y_lerp * top, 0)
+
+    w_group = w_np.reshape(out_channel, deformable_groups, ic_per_dgroup, kernel_h, kernel_w)
+    b_np = np.tensordot(a_deform, w_group, axes=([1, 6, 2, 3], [1, 2, 3, 4]))
+    return np.moveaxis(b_np, -1, 1).astype(dtype)
@@ -18,6 +18,7 @@
 """max_pool1d and avg_pool1d in python"""
 import math
 import numpy as np
+from .sliding_window_python import pool_window_python
 
 
 def pool1d_ncw_python(np_data, kernel,
@@ -42,25 +43,21 @@ def pool1d_ncw_python(np_data, kernel,
 
     no_zero = (range(in_n), range(in_c), range(pl, in_w + pl))
     pad_np[np.ix_(*no_zero)] = np_data
-    ret_np = np.zeros(shape=out_shape).astype(dtype)
+    windows = pool_window_python(pad_np, (k_w,), (s_w,), out_shape[2:])
 
     if pool_type == 'avg':
-        for k in range(out_shape[2]):
-            if count_include_pad:
-                ret_np[:, :, k] = np.mean(
-                    pad_np[:, :, k * s_w: k * s_w + k_w], axis=(2,))
-            else:
-                pad_count = np.sum(
-                    pad_np[:, :, k * s_w: k * s_w + k_w] > 0, axis=(2,))
-                ret_np[:, :, k] = np.sum(
-                    pad_np[:, :, k * s_w: k * s_w + k_w], axis=(2,)) / np.maximum(pad_count, 1)
+        if count_include_pad:
+            ret_np = np.nanmean(windows, axis=(3,))
+        else:
+            pad_count = np.sum(windows > 0, axis=(3,))
+            ret_np = np.nansum(windows, axis=(3,)) / np.maximum(pad_count, 1)
 
     elif pool_type == 'max':
-        for k in range(out_shape[2]):
-            ret_np[:, :, k] = np.max(pad_np[:, :, k * s_w: k * s_w + k_w], axis=(2,))
+        ret_np = np.nanmax(windows, axis=(3,))
 
     else:
         raise ValueError("Pool type {} is not supported".format(pool_type))
 
+    ret_np = ret_np.astype(dtype)
     ret_np = np.maximum(ret_np, 0.0)
     return ret_np
@@ -14,7 +14,7 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-# pylint: disable=invalid-name, too-many-nested-blocks
+# pylint: disable=invalid-name
 "Roi align in python"
 import math
 import numpy as np
@@ -30,23 +30,18 @@ def roi_align_nchw_python(a_np, rois_np, pooled_size, spatial_scale, sample_rati
     else:
         pooled_size_h, pooled_size_w = pooled_size
 
-    def _bilinear(b, c, y, x):
-        if y < -1 or y > height or x < -1 or x > width:
-            return 0
-        y = max(y, 0.0)
-        x = max(x, 0.0)
-        y_low = int(y)
-        x_low = int(x)
-
-        y_high = min(y_low + 1, height - 1)
-        x_high = min(x_low + 1, width - 1)
-
-        ly = y - y_low
-        lx = x - x_low
-        return (1 - ly) * (1 - lx) * a_np[b, c, y_low, x_low] + \
-               (1 - ly) * lx * a_np[b, c, y_low, x_high] + \
-            ly * (1 - lx) * a_np[b, c, y_high, x_low] + \
-            ly * lx * a_np[b, c, y_high, x_high]
+    def _interpolation(coords, size):
+        """Rows of bilinear interpolation weights of the samples over one axis"""
+        weights = np.zeros((coords.size, size), dtype="float64")
+        rows = np.arange(coords.size)
+        valid = (coords >= -1) & (coords <= size)
+        coords = np.maximum(coords, 0.0)
+        low = np.minimum(coords.astype("int64"), size - 1)
+        high = np.minimum(low + 1, size - 1)
+        lerp = coords - low
+        np.add.at(weights, (rows, low), np.where(valid, 1 - lerp, 0))
+        np.add.at(weights, (rows, high), np.where(valid, lerp, 0))
+        return weights
 
     for i in range(num_roi):
         roi = rois_np[i]
@@ -66,14 +61,15 @@ def roi_align_nchw_python(a_np, rois_np, pooled_size, spatial_scale, sample_rati
 
         count = roi_bin_grid_h * roi_bin_grid_w
 
-        for c in range(channel):
-            for ph in range(pooled_size_h):
-                for pw in range(pooled_size_w):
-                    total = 0.
-                    for iy in range(roi_bin_grid_h):
-                        for ix in range(roi_bin_grid_w):
-                            y = roi_start_h + ph * bin_h + (iy + 0.5) * bin_h / roi_bin_grid_h
-                            x = roi_start_w + pw * bin_w + (ix + 0.5) * bin_w / roi_bin_grid_w
-                            total += _bilinear(batch_index, c, y, x)
-                    b_np[i, c, ph, pw] = total / count
+        # the interpolation is separable, so the samples of all bins are a product
+        # of [pooled_h * grid_h, height], [height, width] and [width, pooled_w * grid_w]
+        y = roi_start_h + np.arange(pooled_size_h)[:, None] * bin_h + \
+            (np.arange(roi_bin_grid_h)[None, :] + 0.5) * bin_h / roi_bin_grid_h
+        x = roi_start_w + np.arange(pooled_size_w)[:, None] * bin_w + \
+            (np.arange(roi_bin_grid_w)[None, :] + 0.5) * bin_w / roi_bin_grid_w
+        samples = np.matmul(np.matmul(_interpolation(y.ravel(), height), a_np[batch_index]),
+                            _interpolation(x.ravel(), width).T)
+        samples = samples.reshape(channel, pooled_size_h, roi_bin_grid_h,
+                                  pooled_size_w, roi_bin_grid_w)
+        b_np[i] = samples.sum(axis=(2, 4)) / count
     return b_np
@@ -55,9 +55,9 @@ def roi_pool_nchw_python(a_np, rois_np, pooled_size, spatial_scale):
                 wend = min(max(wend + roi_start_w, 0), width)
                 is_empty = (hend <= hstart) or (wend <= wstart)
 
-                for c in range(channel):
-                    if is_empty:
-                        b_np[i, c, ph, pw] = 0.
-                    else:
-                        b_np[i, c, ph, pw] = np.max(a_np[batch_index, c, hstart:hend, wstart:wend])
+                if is_empty:
+                    b_np[i, :, ph, pw] = 0.
+                else:
+                    b_np[i, :, ph, pw] = np.max(a_np[batch_index, :, hstart:hend, wstart:wend],
+                                                axis=(1, 2))
     return b_np
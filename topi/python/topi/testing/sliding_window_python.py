@@ -0,0 +1,129 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=invalid-name
+"""Sliding windows and correlation in python"""
+import numpy as np
+from numpy.lib.stride_tricks import as_strided
+
+
+def sliding_window_python(a_np, window, strides, dilation=1):
+    """Get a read-only view of the sliding windows over the trailing axes of an array.
+
+    Parameters
+    ----------
+    a_np : numpy.ndarray
+        n-D array, the windows slide over its last len(window) axes.
+
+    window : list / tuple of ints
+        The window size on each sliding axis.
+
+    strides : int or list / tuple of ints
+        The step between windows on each sliding axis.
+
+    dilation : int or list / tuple of ints
+        The step between elements of a window on each sliding axis.
+
+    Returns
+    -------
+    windows : numpy.ndarray
+        A view with shape a_np.shape[:-d] + out_shape + window, where d is len(window).
+    """
+    d = len(window)
+    if isinstance(strides, int):
+        strides = (strides,) * d
+    if isinstance(dilation, int):
+        dilation = (dilation,) * d
+    out_shape = tuple((size - (k - 1) * dl - 1) // s + 1 for size, k, s, dl
+                      in zip(a_np.shape[-d:], window, strides, dilation))
+    assert all(size > 0 for size in out_shape), "window is larger than the input"
+    byte_strides = a_np.strides[-d:]
+    return as_strided(
+        a_np,
+        shape=a_np.shape[:-d] + out_shape + tuple(window),
+        strides=a_np.strides[:-d] + tuple(b * s for b, s in zip(byte_strides, strides)) \
+            + tuple(b * dl for b, dl in zip(byte_strides, dilation)),
+        writeable=False)
+
+
+def correlate_python(a_np, w_np, strides, dilation=1):
+    """Valid cross-correlation in NC[D][H]W layout, computed as a single im2col product.
+
+    Parameters
+    ----------
+    a_np : numpy.ndarray
+        (d+2)-D with shape [batch, in_channel, spatial...], already padded
+
+    w_np : numpy.ndarray
+        (d+2)-D with shape [num_filter, in_channel, filter_spatial...]
+
+    strides : int or list / tuple of d ints
+        Stride size on each spatial axis
+
+    dilation : int or list / tuple of d ints
+        Dilation rate of the kernel on each spatial axis
+
+    Returns
+    -------
+    b_np : numpy.ndarray
+        (d+2)-D float64 array with shape [batch, num_filter, out_spatial...]
+    """
+    d = w_np.ndim - 2
+    windows = sliding_window_python(a_np.astype("float64"), w_np.shape[2:], strides, dilation)
+    # contract the channel and the window axes of [batch, in_channel, out..., window...]
+    b_np = np.tensordot(windows, w_np.astype("float64"),
+                        axes=([1] + list(range(2 + d, 2 + 2 * d)), list(range(1, 2 + d))))
+    return np.moveaxis(b_np, -1, 1)
+
+
+def pool_window_python(pad_np, kernel, strides, out_size):
+    """Get the pooling windows over the trailing axes of a padded array.
+
+    In ceil mode the last windows may extend past the end of the array, their
+    missing elements are NaN so that nan-aware reductions only see the
+    elements inside the array. When the stride is larger than the kernel,
+    a last window can start past the end and is all NaN: its average is NaN,
+    or 0 without counting the padding, as with the former per-window loops,
+    and its maximum is NaN, where the loops failed on the empty window.
+
+    Parameters
+    ----------
+    pad_np : numpy.ndarray
+        n-D padded array, the windows slide over its last len(kernel) axes.
+
+    kernel : list / tuple of ints
+        The window size on each pooling axis.
+
+    strides : list / tuple of ints
+        The step between windows on each pooling axis.
+
+    out_size : list / tuple of ints
+        The number of windows on each pooling axis.
+
+    Returns
+    -------
+    windows : numpy.ndarray
+        float64 array with shape pad_np.shape[:-d] + out_size + kernel.
+    """
+    d = len(kernel)
+    extra = [max((o - 1) * s + k - size, 0) for o, s, k, size
+             in zip(out_size, strides, kernel, pad_np.shape[-d:])]
+    data = pad_np.astype("float64")
+    if any(extra):
+        data = np.pad(data, [(0, 0)] * (pad_np.ndim - d) + [(0, e) for e in extra],
+                      mode='constant', constant_values=np.nan)
+    windows = sliding_window_python(data, kernel, strides)
+    return windows[(Ellipsis,) + tuple(slice(0, o) for o in out_size) + (slice(None),) * d]
@@ -0,0 +1,68 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Benchmarking the vectorized topi.testing references against loop implementations
+at network-sized shapes."""
+import time
+
+import numpy as np
+import topi
+import topi.testing
+
+from test_topi_testing_references import conv2d_nchw_loops, conv3d_ncdhw_loops, \
+    deformable_conv2d_nchw_loops, roi_align_nchw_loops
+
+
+def _time(func, *args):
+    start = time.time()
+    func(*args)
+    return time.time() - start
+
+
+def benchmark(name, vectorized, loops):
+    vectorized_cost = _time(*vectorized)
+    loops_cost = _time(*loops)
+    print("%-18s vectorized: %.3f s, loops: %.3f s, speedup: %.1fx"
+          % (name, vectorized_cost, loops_cost, loops_cost / vectorized_cost))
+
+
+if __name__ == "__main__":
+    a_np = np.random.uniform(size=(1, 64, 56, 56)).astype("float32")
+    w_np = np.random.uniform(size=(64, 64, 3, 3)).astype("float32")
+    benchmark("conv2d_nchw",
+              (topi.testing.conv2d_nchw_python, a_np, w_np, 1, 1),
+              (conv2d_nchw_loops, a_np, w_np, 1, 1))
+
+    a_np = np.random.uniform(size=(1, 32, 16, 28, 28)).astype("float32")
+    w_np = np.random.uniform(size=(32, 32, 3, 3, 3)).astype("float32")
+    benchmark("conv3d_ncdhw",
+              (topi.testing.conv3d_ncdhw_python, a_np, w_np, 1, 1),
+              (conv3d_ncdhw_loops, a_np, w_np, 1, 1))
+
+    a_np = np.random.uniform(size=(1, 16, 28, 28)).astype("float32")
+    w_np = np.random.uniform(size=(16, 16, 3, 3)).astype("float32")
+    offset_np = np.random.uniform(-2, 2, size=(1, 18, 28, 28)).astype("float32")
+    benchmark("deformable_conv2d",
+              (topi.testing.deformable_conv2d_nchw_python, a_np, offset_np, w_np, 1, 1, 1, 1, 1),
+              (deformable_conv2d_nchw_loops, a_np, offset_np, w_np, 1, 1, 1, 1, 1))
+
+    a_np = np.random.uniform(size=(1, 64, 38, 50)).astype("float32")
+    rois_np = np.zeros((64, 5), dtype="float32")
+    rois_np[:, 1:3] = np.random.uniform(0, 500, size=(64, 2))
+    rois_np[:, 3:] = rois_np[:, 1:3] + np.random.uniform(16, 300, size=(64, 2))
+    benchmark("roi_align",
+              (topi.testing.roi_align_nchw_python, a_np, rois_np, 7, 1 / 16., 2),
+              (roi_align_nchw_loops, a_np, rois_np, 7, 1 / 16., 2))
@@ -0,0 +1,603 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Check the vectorized topi.testing references against the loop implementations
+they replaced, which are kept here as oracles"""
+import itertools
+import math
+
+import numpy as np
+import pytest
+import scipy.signal
+import tvm
+import topi
+import topi.testing
+from topi.nn.util import get_pad_tuple, get_pad_tuple1d, get_pad_tuple3d
+
+# pylint: disable=invalid-name, unused-variable, too-many-locals, too-many-nested-blocks
+
+
+def dilate_np(x, dilation):
+    """1D dilation using numpy"""
+    irange = range(len(x) - 1)
+    for d in range(dilation - 1):
+        indices = [(d + 1)*(i + 1) for i in irange]
+        x = np.insert(x, indices, 0)
+    return x
+
+
+def conv1d_ncw_loops(a_np, w_np, stride, padding, dilation):
+    """1D convolution in NCW layout, one scipy convolution per channel pair"""
+    batch, in_c, in_w = a_np.shape
+    out_c, _, filter_w = w_np.shape
+    if isinstance(stride, (tuple, list)):
+        stride = stride[0]
+    if isinstance(dilation, (tuple, list)):
+        dilation = dilation[0]
+
+    dilated_filter_w = (filter_w - 1) * dilation + 1
+    pad_left, pad_right = get_pad_tuple1d(padding, (dilated_filter_w,))
+    out_w = ((in_w - dilated_filter_w + pad_left + pad_right) // stride) + 1
+
+    padded_a_np = np.zeros((batch, in_c, in_w + pad_left + pad_right))
+    padded_a_np[:, :, pad_left:(in_w + pad_left)] = a_np
+
+    b_np = np.zeros((batch, out_c, out_w))
+    for n in range(batch):
+        for f in range(out_c):
+            for c in range(in_c):
+                out = np.convolve(
+                    padded_a_np[n, c], np.flip(dilate_np(w_np[f, c], dilation)), mode='valid')
+                b_np[n, f] += out[::stride]
+    return b_np
+
+
+def _conv2d_nchw_loops(a_np, w_np, stride, padding):
+    batch, in_channel, in_height, in_width = a_np.shape
+    num_filter, _, kernel_h, kernel_w = w_np.shape
+    if isinstance(stride, int):
+        stride_h = stride_w = stride
+    else:
+        stride_h, stride_w = stride
+    pad_top, pad_left, pad_bottom, pad_right = get_pad_tuple(padding, (kernel_h, kernel_w))
+    pad_h = pad_top + pad_bottom
+    pad_w = pad_left + pad_right
+    # compute the output shape
+    out_channel = num_filter
+    out_height = (in_height - kernel_h + pad_h) // stride_h + 1
+    out_width = (in_width - kernel_w + pad_w) // stride_w + 1
+    b_np = np.zeros((batch, out_channel, out_height, out_width))
+    # computation
+    for n in range(batch):
+        for f in range(out_channel):
+            for c in range(in_channel):
+                if pad_h > 0 or pad_w > 0:
+                    apad = np.zeros((in_height + pad_h, in_width + pad_w))
+                    apad[pad_top:pad_top + in_height, pad_left:pad_left + in_width] = a_np[n, c]
+                else:
+                    apad = a_np[n, c]
+                out = scipy.signal.convolve2d(
+                    apad, np.rot90(np.rot90(w_np[f, c])), mode='valid')
+                b_np[n, f] += out[::stride_h, ::stride_w]
+    return b_np
+
+
+def conv2d_nchw_loops(a_np, w_np, stride, padding, groups=1):
+    """2D convolution in NCHW layout, one scipy convolution per channel pair"""
+    a_slices = np.array_split(a_np, groups, axis=1)
+    w_slices = np.array_split(w_np, groups, axis=0)
+    b_slices = [_conv2d_nchw_loops(a_slice, w_slice, stride, padding)
+                for a_slice, w_slice in zip(a_slices, w_slices)]
+    b_np = np.concatenate(b_slices, axis=1)
+    return b_np
+
+
+def _conv3d_ncdhw_loops(a_np, w_np, stride, padding):
+    batch, in_channel, in_depth, in_height, in_width = a_np.shape
+    num_filter, _, kernel_d, kernel_h, kernel_w = w_np.shape
+    if isinstance(stride, int):
+        stride_d = stride_h = stride_w = stride
+    else:
+        stride_d, stride_h, stride_w = stride
+
+    pad_front, pad_top, pad_left, pad_back, pad_bottom, pad_right = \
+        get_pad_tuple3d(padding, (kernel_d, kernel_h, kernel_w))
+    pad_d = pad_front + pad_back
+    pad_h = pad_top + pad_bottom
+    pad_w = pad_left + pad_right
+
+    # compute the output shape
+    out_channel = num_filter
+    out_depth = (in_depth - kernel_d + pad_d) // stride_d + 1
+    out_height = (in_height - kernel_h + pad_h) // stride_h + 1
+    out_width = (in_width - kernel_w + pad_w) // stride_w + 1
+    b_np = np.zeros((batch, out_channel, out_depth, out_height, out_width))
+    # computation
+    for n in range(batch):
+        for f in range(out_channel):
+            for c in range(in_channel):
+                if pad_d > 0 or pad_h > 0 or pad_w > 0:
+                    apad = np.zeros((in_depth + pad_d, in_height + pad_h, in_width + pad_w))
+                    apad[pad_front:pad_front + in_depth, pad_top:pad_top + in_height,\
+                         pad_left:pad_left + in_width] = a_np[n, c]
+                else:
+                    apad = a_np[n, c]
+                out = scipy.signal.convolve(
+                    apad, np.flip(w_np[f, c]), mode='valid')
+                b_np[n, f] += out[::stride_d, ::stride_h, ::stride_w]
+    return b_np
+
+
+def conv3d_ncdhw_loops(a_np, w_np, stride, padding, groups=1):
+    """3D convolution in NCDHW layout, one scipy convolution per channel pair"""
+    a_slices = np.array_split(a_np, groups, axis=1)
+    w_slices = np.array_split(w_np, groups, axis=0)
+    b_slices = [_conv3d_ncdhw_loops(a_slice, w_slice, stride, padding)
+                for a_slice, w_slice in zip(a_slices, w_slices)]
+    b_np = np.concatenate(b_slices, axis=1)
+    return b_np
+
+
+def conv1d_transpose_ncw_loops(a_np, w_np, stride, padding):
+    """Transposed 1D convolution in NCW layout, one scipy convolution per channel pair"""
+    batch, in_c, in_w = a_np.shape
+    _, out_c, filter_w = w_np.shape
+    if isinstance(stride, int):
+        stride_w = stride
+    else:
+        stride_w = stride[0]
+    fpad_left, fpad_right = get_pad_tuple1d(padding, filter_w)
+    # dilate stage
+    dilated_a_np = topi.testing.dilate_python(a_np, [1, 1, stride_w])
+    # padding stage
+    bpad_left = filter_w - 1 - fpad_left
+    bpad_right = filter_w - 1 - fpad_right
+    padded_a_np = np.zeros((batch, in_c, dilated_a_np.shape[2]+bpad_left+bpad_right))
+    padded_a_np[:, :, bpad_left:dilated_a_np.shape[2]+bpad_left] = dilated_a_np
+    # convolution stage
+    out_w = (in_w - 1) * stride_w - fpad_left - fpad_right + filter_w
+    b_np = np.zeros((batch, out_c, out_w))
+    for n in range(batch):
+        for f in range(out_c):
+            for c in range(in_c):
+                out = scipy.signal.convolve(
+                    padded_a_np[n, c], w_np[c, f], mode='valid')
+                b_np[n, f] += out
+    return b_np
+
+
+def conv2d_transpose_nchw_loops(a_np, w_np, stride, padding):
+    """Transposed 2D convolution in NCHW layout, one scipy convolution per channel pair"""
+    batch, in_c, in_h, in_w = a_np.shape
+    _, out_c, filter_h, filter_w = w_np.shape
+    if isinstance(stride, int):
+        stride_h = stride_w = stride
+    else:
+        stride_h, stride_w = stride
+    # dilate stage
+    dilated_a_np = topi.testing.dilate_python(a_np, [1, 1, stride_h, stride_w])
+    # padding stage
+    fpad_top, fpad_left, fpad_bottom, fpad_right = get_pad_tuple(padding, (filter_h, filter_w))
+    bpad_top = filter_h - 1 - fpad_top
+    bpad_bottom = filter_h - 1 - fpad_bottom
+    bpad_left = filter_w - 1 - fpad_left
+    bpad_right = filter_w - 1 - fpad_right
+    padded_a_np = np.zeros((batch, in_c, dilated_a_np.shape[2]+bpad_top+bpad_bottom, \
+                            dilated_a_np.shape[3]+bpad_left+bpad_right))
+    padded_a_np[:, :, bpad_top:dilated_a_np.shape[2]+bpad_top, \
+                bpad_left:dilated_a_np.shape[3]+bpad_left] = dilated_a_np
+    # convolution stage
+    out_h = (in_h - 1) * stride_h - fpad_top - fpad_bottom + filter_h
+    out_w = (in_w - 1) * stride_w - fpad_left - fpad_right + filter_w
+    b_np = np.zeros((batch, out_c, out_h, out_w))
+    for n in range(batch):
+        for f in range(out_c):
+            for c in range(in_c):
+                out = scipy.signal.convolve2d(
+                    padded_a_np[n, c], w_np[c, f], mode='valid')
+                b_np[n, f] += out
+    return b_np
+
+
+def deformable_conv2d_nchw_loops(a_np, offset_np, w_np, stride, padding, dilation,
+                                 deformable_groups, groups):
+    """Deformable convolution in NCHW layout, one sample at a time"""
+    batch, in_channel, in_height, in_width = a_np.shape
+    out_channel, _, kernel_h, kernel_w = w_np.shape
+    out_height, out_width = offset_np.shape[-2:]
+    dtype = a_np.dtype
+    ic_per_dgroup = in_channel // deformable_groups
+    assert groups == 1, "deformable_conv2d_nchw_python does not support groups > 1"
+
+    if isinstance(stride, int):
+        stride_h = stride_w = stride
+    else:
+        stride_h, stride_w = stride
+
+    pad_top, pad_left, _, _ = get_pad_tuple(padding, (kernel_h, kernel_w))
+
+    if isinstance(dilation, int):
+        dilation_h = dilation_w = dilation
+    else:
+        dilation_h, dilation_w = dilation
+
+
+    def _bilinear(n, c, h, w):
+        low_h, low_w = int(h), int(w)
+        high_h = min(low_h + 1, in_height - 1)
+        high_w = min(low_w + 1, in_width - 1)
+        y_lerp = h - low_h
+        x_lerp = w - low_w
+
+        bottom = (1 - x_lerp) * a_np[n, c, low_h, low_w] + x_lerp * a_np[n, c, low_h, high_w]
+        top = (1 - x_lerp) * a_np[n, c, high_h, low_w] + x_lerp * a_np[n, c, high_h, high_w]
+        return (1 - y_lerp) * bottom + y_lerp * top
+
+
+    a_deform = np.zeros((batch, in_channel, out_height, out_width, kernel_h, kernel_w), dtype=dtype)
+    for n, h, w in itertools.product(range(batch), range(out_height), range(out_width)):
+        offset = offset_np[n, :, h, w].reshape(deformable_groups, kernel_h, kernel_w, 2)
+        in_h = h * stride_h - pad_top
+        in_w = w * stride_w - pad_left
+
+        index_h_base, index_w_base = np.meshgrid(
+            np.arange(in_h, in_h + kernel_h * dilation_h, dilation_h, dtype=offset_np.dtype),
+            np.arange(in_w, in_w + kernel_w * dilation_w, dilation_w, dtype=offset_np.dtype),
+            indexing='ij')
+
+        for c, kh, kw in itertools.product(range(in_channel), range(kernel_h), range(kernel_w)):
+            dg = c // ic_per_dgroup
+            index_h = index_h_base + offset[dg, ..., 0]
+            index_w = index_w_base + offset[dg, ..., 1]
+
+            y, x = index_h[kh, kw], index_w[kh, kw]
+            if y < 0 or y >= in_height or x < 0 or x >= in_width:
+                continue
+            a_deform[n, c, h, w, kh, kw] = _bilinear(n, c, y, x)
+
+    b_np = np.zeros((batch, out_channel, out_height, out_width), dtype=dtype)
+    for n, c, f, h, w in itertools.product(range(batch), range(in_channel), range(out_channel),
+                                           range(out_height), range(out_width)):
+        b_np[n, f, h, w] += np.tensordot(a_deform[n, c, h, w], w_np[f, c])
+
+    return b_np
+
+
+def roi_align_nchw_loops(a_np, rois_np, pooled_size, spatial_scale, sample_ratio):
+    """Roi align in NCHW layout, one sample at a time"""
+    _, channel, height, width = a_np.shape
+    num_roi = rois_np.shape[0]
+    b_np = np.zeros((num_roi, channel, pooled_size, pooled_size), dtype=a_np.dtype)
+
+    if isinstance(pooled_size, int):
+        pooled_size_h = pooled_size_w = pooled_size
+    else:
+        pooled_size_h, pooled_size_w = pooled_size
+
+    def _bilinear(b, c, y, x):
+        if y < -1 or y > height or x < -1 or x > width:
+            return 0
+        y = max(y, 0.0)
+        x = max(x, 0.0)
+        y_low = int(y)
+        x_low = int(x)
+
+        y_high = min(y_low + 1, height - 1)
+        x_high = min(x_low + 1, width - 1)
+
+        ly = y - y_low
+        lx = x - x_low
+        return (1 - ly) * (1 - lx) * a_np[b, c, y_low, x_low] + \
+               (1 - ly) * lx * a_np[b, c, y_low, x_high] + \
+            ly * (1 - lx) * a_np[b, c, y_high, x_low] + \
+            ly * lx * a_np[b, c, y_high, x_high]
+
+    for i in range(num_roi):
+        roi = rois_np[i]
+        batch_index = int(roi[0])
+        roi_start_w, roi_start_h, roi_end_w, roi_end_h = roi[1:] * spatial_scale
+        roi_h = max(roi_end_h - roi_start_h, 1.0)
+        roi_w = max(roi_end_w - roi_start_w, 1.0)
+
+        bin_h = roi_h / pooled_size_h
+        bin_w = roi_w / pooled_size_w
+
+        if sample_ratio > 0:
+            roi_bin_grid_h = roi_bin_grid_w = int(sample_ratio)
+        else:
+            roi_bin_grid_h = int(math.ceil(roi_h / pooled_size))
+            roi_bin_grid_w = int(math.ceil(roi_w / pooled_size))
+
+        count = roi_bin_grid_h * roi_bin_grid_w
+
+        for c in range(channel):
+            for ph in range(pooled_size_h):
+                for pw in range(pooled_size_w):
+                    total = 0.
+                    for iy in range(roi_bin_grid_h):
+                        for ix in range(roi_bin_grid_w):
+                            y = roi_start_h + ph * bin_h + (iy + 0.5) * bin_h / roi_bin_grid_h
+                            x = roi_start_w + pw * bin_w + (ix + 0.5) * bin_w / roi_bin_grid_w
+                            total += _bilinear(batch_index, c, y, x)
+                    b_np[i, c, ph, pw] = total / count
+    return b_np
+
+
+def roi_pool_nchw_loops(a_np, rois_np, pooled_size, spatial_scale):
+    """Roi pool in NCHW layout, one channel at a time"""
+    _, channel, height, width = a_np.shape
+    num_roi = rois_np.shape[0]
+    b_np = np.zeros((num_roi, channel, pooled_size, pooled_size), dtype=a_np.dtype)
+
+    if isinstance(pooled_size, int):
+        pooled_size_h = pooled_size_w = pooled_size
+    else:
+        pooled_size_h, pooled_size_w = pooled_size
+
+    for i in range(num_roi):
+        roi = rois_np[i]
+        batch_index = int(roi[0])
+        roi_start_w = int(round(roi[1] * spatial_scale))
+        roi_start_h = int(round(roi[2] * spatial_scale))
+        roi_end_w = int(round(roi[3] * spatial_scale))
+        roi_end_h = int(round(roi[4] * spatial_scale))
+        roi_h = max(roi_end_h - roi_start_h + 1, 1)
+        roi_w = max(roi_end_w - roi_start_w + 1, 1)
+
+        bin_h = float(roi_h) / pooled_size_h
+        bin_w = float(roi_w) / pooled_size_w
+
+        for ph in range(pooled_size_h):
+            for pw in range(pooled_size_w):
+                hstart = int(math.floor(ph * bin_h))
+                wstart = int(math.floor(pw * bin_w))
+                hend = int(math.ceil((ph + 1) * bin_h))
+                wend = int(math.ceil((pw + 1) * bin_w))
+                hstart = min(max(hstart + roi_start_h, 0), height)
+                hend = min(max(hend + roi_start_h, 0), height)
+                wstart = min(max(wstart + roi_start_w, 0), width)
+                wend = min(max(wend + roi_start_w, 0), width)
+                is_empty = (hend <= hstart) or (wend <= wstart)
+
+                for c in range(channel):
+                    if is_empty:
+                        b_np[i, c, ph, pw] = 0.
+                    else:
+                        b_np[i, c, ph, pw] = np.max(a_np[batch_index, c, hstart:hend, wstart:wend])
+    return b_np
+
+
+def pool1d_ncw_loops(np_data, kernel, strides, padding, out_shape, pool_type,
+                     count_include_pad=True, ceil_mode=False, dtype="float32"):
+    """Pooling in NCW layout, one window at a time"""
+    in_n, in_c, in_w = in_shape = np_data.shape
+    k_w = kernel[0]
+    s_w = strides[0]
+    pl, pr = padding
+
+    pad_np = np.zeros(shape=(in_n, in_c, in_w + pl + pr)).astype(dtype)
+
+    no_zero = (range(in_n), range(in_c), range(pl, in_w + pl))
+    pad_np[np.ix_(*no_zero)] = np_data
+    ret_np = np.zeros(shape=out_shape).astype(dtype)
+
+    if pool_type == 'avg':
+        for k in range(out_shape[2]):
+            if count_include_pad:
+                ret_np[:, :, k] = np.mean(
+                    pad_np[:, :, k * s_w: k * s_w + k_w], axis=(2,))
+            else:
+                pad_count = np.sum(
+                    pad_np[:, :, k * s_w: k * s_w + k_w] > 0, axis=(2,))
+                ret_np[:, :, k] = np.sum(
+                    pad_np[:, :, k * s_w: k * s_w + k_w], axis=(2,)) / np.maximum(pad_count, 1)
+
+    elif pool_type == 'max':
+        for k in range(out_shape[2]):
+            ret_np[:, :, k] = np.max(pad_np[:, :, k * s_w: k * s_w + k_w], axis=(2,))
+
+    else:
+        raise ValueError("Pool type {} is not supported".format(pool_type))
+
+    ret_np = np.maximum(ret_np, 0.0)
+    return ret_np
+
+
+def pool3d_ncdhw_loops(np_data, kernel, strides, padding, out_shape, pool_type,
+                       count_include_pad=True, ceil_mode=False, dtype="float32"):
+    """Pooling in NCDHW layout, one window at a time"""
+    in_n, in_c, in_d, in_h, in_w = in_shape = np_data.shape
+    k_d, k_h, k_w = kernel
+    s_d, s_h, s_w = strides
+    pf, pt, pl, pk, pb, pr = padding
+
+    fill_value = tvm.tir.const(0.0, dtype).value
+    if not(count_include_pad) and pool_type == 'max':
+        fill_value = tvm.te.min_value(dtype).value
+
+    pad_np = np.full(shape=(in_n, in_c,
+                            in_d + pf + pk,
+                            in_h + pt + pb,
+                            in_w + pl + pr),
+                     fill_value=fill_value,
+                     dtype=dtype)
+
+    no_zero = (range(in_n),
+               range(in_c),
+               (range(pf, in_d + pf)),
+               (range(pt, in_h + pt)),
+               (range(pl, in_w + pl)))
+    pad_np[np.ix_(*no_zero)] = np_data
+    ret_np = np.zeros(shape=out_shape).astype(dtype)
+
+    if pool_type == 'avg':
+        for k in range(out_shape[2]):
+            for i in range(out_shape[3]):
+                for j in range(out_shape[4]):
+                    if count_include_pad:
+                        ret_np[:, :, k, i, j] = \
+                            np.mean(pad_np[:, :, k * s_d: k * s_d + k_d,
+                                           i * s_h: i * s_h + k_h,
+                                           j * s_w: j * s_w + k_w], axis=(2, 3, 4))
+                    else:
+                        pad_count = np.sum(pad_np[:, :,
+                                                  k * s_d: k * s_d + k_d,
+                                                  i * s_h: i * s_h + k_h,
+                                                  j * s_w: j * s_w + k_w] > 0, axis=(2, 3, 4))
+                        ret_np[:, :, k, i, j] = np.sum(pad_np[:, :,
+                                                              k * s_d: k * s_d + k_d,
+                                                              i * s_h: i * s_h + k_h,
+                                                              j * s_w: j * s_w + k_w],
+                                                       axis=(2, 3, 4)) / np.maximum(pad_count, 1)
+    elif pool_type == 'max':
+        for k in range(out_shape[2]):
+            for i in range(out_shape[3]):
+                for j in range(out_shape[4]):
+                    ret_np[:, :, k, i, j] = np.max(
+                        pad_np[:, :, k * s_d: k * s_d + k_d,
+                               i * s_h: i * s_h + k_h,
+                               j * s_w: j * s_w + k_w], axis=(2, 3, 4))
+    else:
+        raise ValueError("pool type {} is not supported".format(pool_type))
+
+    ret_np = np.maximum(ret_np, fill_value)
+    return ret_np
+
+
+def test_conv():
+    for stride, padding, dilation in [(1, 0, 1), (2, 1, 1), (3, 2, 2)]:
+        a_np = np.random.uniform(size=(2, 3, 13)).astype("float32")
+        w_np = np.random.uniform(size=(4, 3, 3)).astype("float32")
+        b_np = topi.testing.conv1d_ncw_python(a_np, w_np, stride, padding, dilation)
+        ref = conv1d_ncw_loops(a_np, w_np, stride, padding, dilation)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-5)
+
+        a_np = np.random.uniform(size=(2, 4, 11, 9)).astype("float32")
+        w_np = np.random.uniform(size=(6, 2, 3, 2)).astype("float32")
+        b_np = topi.testing.conv2d_nchw_python(a_np, w_np, stride, padding, groups=2)
+        ref = conv2d_nchw_loops(a_np, w_np, stride, padding, groups=2)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-5)
+
+        a_np = np.random.uniform(size=(1, 3, 6, 7, 5)).astype("float32")
+        w_np = np.random.uniform(size=(2, 3, 3, 2, 3)).astype("float32")
+        b_np = topi.testing.conv3d_ncdhw_python(a_np, w_np, stride, padding)
+        ref = conv3d_ncdhw_loops(a_np, w_np, stride, padding)
+        # scipy convolves in the Fourier domain, which leaves noise in the zeros
+        np.testing.assert_allclose(b_np, ref, rtol=1e-5, atol=1e-6)
+
+
+def test_conv_transpose():
+    for stride, padding in [(1, 0), (2, 1), (3, 2)]:
+        a_np = np.random.uniform(size=(2, 3, 5)).astype("float32")
+        w_np = np.random.uniform(size=(3, 4, 4)).astype("float32")
+        b_np = topi.testing.conv1d_transpose_ncw_python(a_np, w_np, stride, padding)
+        ref = conv1d_transpose_ncw_loops(a_np, w_np, stride, padding)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-5)
+
+        a_np = np.random.uniform(size=(2, 3, 5, 6)).astype("float32")
+        w_np = np.random.uniform(size=(3, 4, 3, 4)).astype("float32")
+        b_np = topi.testing.conv2d_transpose_nchw_python(a_np, w_np, stride, padding)
+        ref = conv2d_transpose_nchw_loops(a_np, w_np, stride, padding)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-5)
+
+
+def test_deformable_conv2d():
+    for deformable_groups, stride, padding, dilation in [(1, 1, 1, 1), (2, 2, 0, 1), (4, 1, 2, 2)]:
+        a_np = np.random.uniform(size=(2, 8, 9, 10)).astype("float32")
+        w_np = np.random.uniform(size=(5, 8, 3, 3)).astype("float32")
+        out_height = (9 + 2 * padding - 2 * dilation - 1) // stride + 1
+        out_width = (10 + 2 * padding - 2 * dilation - 1) // stride + 1
+        offset_np = np.random.uniform(-3, 3, size=(2, deformable_groups * 18, out_height,
+                                                   out_width)).astype("float32")
+        b_np = topi.testing.deformable_conv2d_nchw_python(a_np, offset_np, w_np, stride, padding,
+                                                          dilation, deformable_groups, 1)
+        ref = deformable_conv2d_nchw_loops(a_np, offset_np, w_np, stride, padding, dilation,
+                                           deformable_groups, 1)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-4, atol=1e-4)
+
+
+def test_roi():
+    a_np = np.random.uniform(size=(2, 4, 16, 16)).astype("float32")
+    rois_np = np.zeros((8, 5), dtype="float32")
+    rois_np[:, 0] = np.random.randint(0, 2, size=8)
+    rois_np[:, 1:3] = np.random.uniform(-4, 60, size=(8, 2))
+    rois_np[:, 3:] = rois_np[:, 1:3] + np.random.uniform(0, 30, size=(8, 2))
+    for spatial_scale, sample_ratio in [(0.25, 2), (0.125, -1)]:
+        b_np = topi.testing.roi_align_nchw_python(a_np, rois_np, 7, spatial_scale, sample_ratio)
+        ref = roi_align_nchw_loops(a_np, rois_np, 7, spatial_scale, sample_ratio)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-4, atol=1e-5)
+
+        # rois past the input have empty bins
+        b_np = topi.testing.roi_pool_nchw_python(a_np, rois_np, 7, spatial_scale)
+        ref = roi_pool_nchw_loops(a_np, rois_np, 7, spatial_scale)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-5)
+
+
+def test_pool():
+    for kernel, stride, padding, pool_type, count_include_pad, ceil_mode in [
+            (3, 2, (1, 1), 'avg', True, False),
+            (3, 2, (1, 2), 'avg', False, False),
+            (2, 2, (0, 1), 'max', True, False),
+            (3, 2, (1, 1), 'avg', True, True),
+            (3, 2, (1, 1), 'avg', False, True),
+            (2, 2, (0, 1), 'max', True, True)]:
+        round_out = math.ceil if ceil_mode else math.floor
+        a_np = np.random.uniform(size=(2, 3, 14)).astype("float32")
+        out_shape = (2, 3, int(round_out((14 - kernel + sum(padding)) / stride)) + 1)
+        args = ((kernel,), (stride,), padding, out_shape, pool_type, count_include_pad, ceil_mode)
+        b_np = topi.testing.pool1d_ncw_python(a_np, *args)
+        ref = pool1d_ncw_loops(a_np, *args)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-5)
+
+        a_np = np.random.uniform(size=(2, 3, 9, 10, 11)).astype("float32")
+        out_shape = (2, 3) + tuple(int(round_out((size - kernel + sum(padding)) / stride)) + 1
+                                   for size in (9, 10, 11))
+        args = ((kernel,) * 3, (stride,) * 3, padding[:1] * 3 + padding[1:] * 3, out_shape,
+                pool_type, count_include_pad, ceil_mode)
+        b_np = topi.testing.pool3d_ncdhw_python(a_np, *args)
+        ref = pool3d_ncdhw_loops(a_np, *args)
+        np.testing.assert_allclose(b_np, ref, rtol=1e-5)
+
+
+def test_pool_empty_window():
+    # in ceil mode with a stride larger than the kernel, the last window
+    # starts past the end of the padded input
+    a_np = np.random.uniform(size=(2, 3, 10)).astype("float32")
+    out_shape = (2, 3, 4)
+    with pytest.warns(RuntimeWarning):
+        for count_include_pad in [True, False]:
+            args = ((1,), (4,), (0, 0), out_shape, 'avg', count_include_pad, True)
+            b_np = topi.testing.pool1d_ncw_python(a_np, *args)
+            ref = pool1d_ncw_loops(a_np, *args)
+            # the average of the empty window is nan, or 0 without the padding
+            np.testing.assert_allclose(b_np, ref, rtol=1e-5)
+
+        # the maximum of the empty window is nan, the loops raised an error
+        args = ((1,), (4,), (0, 0), out_shape, 'max', True, True)
+        b_np = topi.testing.pool1d_ncw_python(a_np, *args)
+    assert np.isnan(b_np[:, :, 3]).all()
+    np.testing.assert_allclose(b_np[:, :, :3], a_np[:, :, :9:4], rtol=1e-5)
+    with pytest.raises(ValueError):
+        pool1d_ncw_loops(a_np, *args)
+
+
+if __name__ == "__main__":
+    test_conv()
+    test_conv_transpose()
+    test_deformable_conv2d()
+    test_roi()
+    test_pool()
+    test_pool_empty_window()